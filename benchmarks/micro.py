@@ -0,0 +1,307 @@
+# benchmarks/micro.py
+# Usage: python -m benchmarks.micro [--case NAME] [--baseline COMMIT]
+
+import argparse
+import gc
+import json
+import os
+import subprocess
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+import numpy as np
+import pygame
+from benchmarks.scenarios import environment
+from core.rng import get_numpy_stream, seed_streams
+from entities.asteroid import Asteroid
+from entities.enemy import Enemy, EnemySwarm
+from entities.player import Player
+from entities.projectiles import ProjectileStore
+from utils import blend_colors, darken_color, draw_glow_circle, is_collision, lighten_color, rotate_point
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RESULTS_PATH = os.path.join(REPO_ROOT, "benchmarks", "results", "micro.json")
+SURFACE_SIZE = (1280, 720)
+MIN_BATCH_SECONDS = 0.02  # Each timed batch runs at least this long
+WARMUP_SECONDS = 0.05
+REPEATS = 7
+ALLOCATION_CALLS = 200
+
+
+def case_is_collision():
+    return lambda: is_collision(100.0, 120.0, 130.0, 140.0, 20, 5)
+
+
+def case_blend_colors():
+    return lambda: blend_colors((40, 80, 120), (255, 200, 10), 0.35)
+
+
+def case_lighten_color():
+    return lambda: lighten_color((40, 80, 120), 0.35)
+
+
+def case_darken_color():
+    return lambda: darken_color((40, 80, 120), 0.35)
+
+
+def case_rotate_point():
+    return lambda: rotate_point(0.7, 12.0, -30.0)
+
+
+def case_draw_glow_circle(surface):
+    return lambda: draw_glow_circle(surface, (0, 220, 255), (640, 360), 20, 10)
+
+
+def case_asteroid_step(surface):
+    asteroid = Asteroid(640, 360, 3, *SURFACE_SIZE, (20, 24, 48), 2)
+
+    def step():
+        asteroid.move()
+        asteroid.rotate()
+    return step
+
+
+def case_asteroid_vertices(surface):
+    # Stands in for the old per-frame Asteroid.update_vertices: the polygon is now built on demand
+    asteroid = Asteroid(640, 360, 3, *SURFACE_SIZE, (20, 24, 48), 2)
+
+    def vertices():
+        asteroid.angle = (asteroid.angle + 1) % 360
+        return asteroid.vertices
+    return vertices
+
+
+def case_asteroid_draw(surface):
+    asteroid = Asteroid(640, 360, 3, *SURFACE_SIZE, (20, 24, 48), 2)
+
+    def draw():
+        asteroid.rotate()
+        asteroid.draw(surface)
+    return draw
+
+
+def case_swarm_steer(surface):
+    # A late-level wave: steering runs once per step over the whole swarm
+    swarm = EnemySwarm(*SURFACE_SIZE)
+    for i in range(60):
+        swarm.append(Enemy(40 + 20 * i, 80 + 40 * (i % 5), (235, 231, 207), (255, 0, 0), *SURFACE_SIZE))
+    return lambda: swarm.steer(640, 620)
+
+
+def case_projectile_draw(surface):
+    # Bullets are drawn per owner as one batched blit from the shared store
+    store = ProjectileStore()
+    rng = get_numpy_stream("spawn")
+    count = 500
+    store.spawn_batch(
+        rng.uniform(0, SURFACE_SIZE[0], count), rng.uniform(0, SURFACE_SIZE[1], count),
+        np.zeros(count), np.full(count, 5.0), 1, 'enemy',
+    )
+    return lambda: store.draw(surface, 'enemy')
+
+
+def case_player_draw(surface):
+    player = Player(640, 620, (255, 140, 60), *SURFACE_SIZE)
+    return lambda: player.draw(surface)
+
+
+# name -> (builder, whether the builder takes the target surface)
+CASES = {
+    "is_collision": (case_is_collision, False),
+    "blend_colors": (case_blend_colors, False),
+    "lighten_color": (case_lighten_color, False),
+    "darken_color": (case_darken_color, False),
+    "rotate_point": (case_rotate_point, False),
+    "draw_glow_circle": (case_draw_glow_circle, True),
+    "asteroid_step": (case_asteroid_step, True),
+    "asteroid_vertices": (case_asteroid_vertices, True),
+    "asteroid_draw": (case_asteroid_draw, True),
+    "swarm_steer": (case_swarm_steer, True),
+    "projectile_draw": (case_projectile_draw, True),
+    "player_draw": (case_player_draw, True),
+}
+
+
+def run_batch(op, number):
+    start = time.perf_counter_ns()
+    for _ in range(number):
+        op()
+    return time.perf_counter_ns() - start
+
+
+def calibrate(op):
+    """Double the batch size until one batch takes at least MIN_BATCH_SECONDS."""
+    number = 1
+    while True:
+        elapsed = run_batch(op, number)
+        if elapsed >= MIN_BATCH_SECONDS * 1e9:
+            return number
+        number *= 2
+
+
+def time_op(op, repeats=REPEATS):
+    """
+    Time ``op`` in ns/op with warm-up, a calibrated batch size and the GC paused.
+
+    The fastest batch is the stable estimate; the median shows how noisy the run was.
+    """
+    deadline = time.perf_counter() + WARMUP_SECONDS
+    while time.perf_counter() < deadline:
+        op()
+    number = calibrate(op)
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        samples = sorted(run_batch(op, number) / number for _ in range(repeats))
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return {"ns_per_op": samples[0], "median_ns_per_op": samples[len(samples) // 2], "number": number, "repeats": repeats}
+
+
+@contextmanager
+def counting_surfaces():
+    """Count pygame.Surface constructions made through the pygame module while active."""
+    created = [0]
+    original = pygame.Surface
+
+    class CountingSurface(original):
+        def __init__(self, *args, **kwargs):
+            created[0] += 1
+            super().__init__(*args, **kwargs)
+
+    pygame.Surface = CountingSurface
+    try:
+        yield created
+    finally:
+        pygame.Surface = original
+
+
+def measure_allocations(op, calls=ALLOCATION_CALLS):
+    """
+    Allocations per call: Surfaces constructed, plus Python heap use from tracemalloc.
+
+    ``alloc_bytes_per_op`` is the heap high-water mark each call reaches above
+    where it started; ``retained_bytes_per_op`` is what is still held after
+    all calls (caches filling, or leaks). SDL pixel buffers live outside the
+    Python heap, which is why Surfaces are counted separately.
+    """
+    gc.collect()
+    with counting_surfaces() as created:
+        tracemalloc.start()
+        try:
+            baseline = tracemalloc.get_traced_memory()[0]
+            peak_bytes = 0
+            for _ in range(calls):
+                tracemalloc.reset_peak()
+                start = tracemalloc.get_traced_memory()[0]
+                op()
+                peak_bytes += tracemalloc.get_traced_memory()[1] - start
+            retained = tracemalloc.get_traced_memory()[0] - baseline
+        finally:
+            tracemalloc.stop()
+    return {
+        "surfaces_per_op": created[0] / calls,
+        "alloc_bytes_per_op": peak_bytes / calls,
+        "retained_bytes_per_op": retained / calls,
+    }
+
+
+def run_case(name, surface, seed=0):
+    seed_streams(seed)
+    builder, takes_surface = CASES[name]
+    op = builder(surface) if takes_surface else builder()
+    result = time_op(op)
+    result.update(measure_allocations(op))
+    return result
+
+
+def git_commit():
+    """Short hash of HEAD, marked ``+dirty`` when tracked files have uncommitted changes."""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=REPO_ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+        status = subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=no"], cwd=REPO_ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+    return f"{commit}+dirty" if status else commit
+
+
+def load_results(path=RESULTS_PATH):
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path, "r") as file:
+            return json.load(file)
+    except (json.JSONDecodeError, OSError):
+        return {}
+
+
+def save_results(history, path=RESULTS_PATH):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as file:
+        json.dump(history, file, indent=2)
+
+
+def format_table(results, baseline=None):
+    """Lay results out as a console table, with the change against ``baseline`` results if given."""
+    lines = [f"{'case':<22} {'ns/op':>10} {'median':>10} {'surf/op':>8} {'B/op':>9} {'kept B/op':>9} {'vs base':>8}"]
+    lines.append("-" * len(lines[0]))
+    for name, result in results.items():
+        change = ""
+        previous = (baseline or {}).get(name)
+        if previous:
+            change = f"{(result['ns_per_op'] / previous['ns_per_op'] - 1) * 100:+.1f}%"
+        lines.append(
+            f"{name:<22} {result['ns_per_op']:>10.1f} {result['median_ns_per_op']:>10.1f} "
+            f"{result['surfaces_per_op']:>8.2f} {result['alloc_bytes_per_op']:>9.0f} "
+            f"{result['retained_bytes_per_op']:>9.1f} {change:>8}"
+        )
+    return "\n".join(lines)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Microbenchmarks for the frame loop's per-call primitives")
+    parser.add_argument("--case", action="append", choices=list(CASES),
+                        help="case to run; repeat for several (default: all)")
+    parser.add_argument("--baseline", metavar="COMMIT",
+                        help="compare against results stored for this commit")
+    parser.add_argument("--results", default=RESULTS_PATH, help="JSON file results are stored in, keyed by commit")
+    parser.add_argument("--no-save", action="store_true", help="print results without storing them")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.init()
+    pygame.display.set_mode(SURFACE_SIZE)
+    surface = pygame.Surface(SURFACE_SIZE).convert()
+
+    results = {name: run_case(name, surface) for name in args.case or CASES}
+    history = load_results(args.results)
+    baseline = history.get(args.baseline, {}).get("results") if args.baseline else None
+    if args.baseline and baseline is None:
+        print(f"No stored results for {args.baseline}")
+    print(format_table(results, baseline))
+
+    commit = git_commit()
+    if not args.no_save:
+        entry = history.get(commit, {"results": {}})
+        entry["results"].update(results)
+        entry["recorded_at"] = datetime.now(timezone.utc).isoformat(timespec="seconds")
+        entry["environment"] = environment()
+        history[commit] = entry
+        save_results(history, args.results)
+        print(f"Stored under {commit} in {os.path.relpath(args.results)}")
+    pygame.quit()
+    return results
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+# benchmarks/scenarios.py
+# Usage: python -m benchmarks.scenarios --frames 600 --json scenarios.json
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+
+import numpy as np
+import pygame
+from benchmarks.scenes import SCENE_SIZE, SCENES
+from core.clock import SimulationClock, set_clock
+from core.render_targets import RenderTargets
+from core.rng import seed_streams
+from core.timestep import SIMULATION_HZ
+from entities.asteroid import get_shape_bank
+
+MODES = ("render", "sim")  # Draw each frame to an offscreen buffer, or simulate only
+PHASES = ("update", "collision", "draw")
+PERCENTILES = (50, 95, 99)
+
+
+def summarize(samples_ms):
+    """Percentiles, max and mean of a list of timings in milliseconds."""
+    samples = np.asarray(samples_ms, dtype=np.float64)
+    summary = {f"p{p}": float(np.percentile(samples, p)) for p in PERCENTILES}
+    summary["max"] = float(samples.max())
+    summary["mean"] = float(samples.mean())
+    return summary
+
+
+def run_scene(name, frames, warmup=60, render=True, seed=0, render_targets=None):
+    """
+    Build scene ``name`` and time ``frames`` frames of it after ``warmup`` untimed ones.
+
+    Every scene starts from the same seed on a fresh simulation clock and an
+    empty asteroid frame cache, so repeated runs measure the same work.
+    """
+    seed_streams(seed)
+    get_shape_bank().clear_frames()
+    clock = SimulationClock()
+    previous_clock = set_clock(clock)
+    try:
+        scene = SCENES[name]()
+        target = None
+        if render:
+            render_targets = render_targets or RenderTargets(SCENE_SIZE)
+            target = render_targets.get("frame")
+        step_ms = 1000 / SIMULATION_HZ
+        timings = {phase: [] for phase in PHASES}
+        totals = []
+        contacts = 0
+        for frame in range(warmup + frames):
+            clock.advance(step_ms)
+            start = time.perf_counter_ns()
+            scene.update()
+            updated = time.perf_counter_ns()
+            frame_contacts = scene.collide()
+            collided = time.perf_counter_ns()
+            if target is not None:
+                scene.draw(target)
+            drawn = time.perf_counter_ns()
+            if frame < warmup:
+                continue
+            contacts += frame_contacts
+            timings["update"].append((updated - start) / 1e6)
+            timings["collision"].append((collided - updated) / 1e6)
+            timings["draw"].append((drawn - collided) / 1e6)
+            totals.append((drawn - start) / 1e6)
+    finally:
+        set_clock(previous_clock)
+
+    result = {
+        "scene": name,
+        "mode": "render" if render else "sim",
+        "frames": frames,
+        "frame_ms": summarize(totals),
+        "contacts": contacts,
+        "load": scene.stats(),
+        "asteroid_frames": asteroid_frame_stats(),
+    }
+    for phase in PHASES:
+        result[f"{phase}_ms"] = summarize(timings[phase])
+    return result
+
+
+def asteroid_frame_stats():
+    """The shared asteroid frame cache's counters, with its hit rate over the run."""
+    stats = get_shape_bank().frame_cache_stats()
+    lookups = stats["hits"] + stats["misses"]
+    stats["hit_rate"] = stats["hits"] / lookups if lookups else None
+    return stats
+
+
+def format_table(results):
+    """Lay results out as a fixed-width console table."""
+    columns = (
+        ("scene", 16), ("mode", 7), ("p50", 8), ("p95", 8), ("p99", 8), ("max", 8),
+        ("update", 8), ("collide", 8), ("draw", 8), ("bullets", 8), ("ast hit", 8),
+    )
+    lines = [" ".join(title.rjust(width) if i > 1 else title.ljust(width) for i, (title, width) in enumerate(columns))]
+    lines.append("-" * len(lines[0]))
+    for result in results:
+        frame = result["frame_ms"]
+        hit_rate = result["asteroid_frames"]["hit_rate"]
+        cells = [
+            result["scene"], result["mode"],
+            f"{frame['p50']:.2f}", f"{frame['p95']:.2f}", f"{frame['p99']:.2f}", f"{frame['max']:.2f}",
+            f"{result['update_ms']['mean']:.2f}", f"{result['collision_ms']['mean']:.2f}",
+            f"{result['draw_ms']['mean']:.2f}", str(result["load"]["bullets"]),
+            "-" if hit_rate is None else f"{hit_rate:.1%}",
+        ]
+        lines.append(" ".join(
+            cell.rjust(width) if i > 1 else cell.ljust(width) for i, (cell, (_, width)) in enumerate(zip(cells, columns))
+        ))
+    lines.append("Frame percentiles and phase means in milliseconds; ast hit is the asteroid frame cache hit rate.")
+    return "\n".join(lines)
+
+
+def environment():
+    return {
+        "python": platform.python_version(),
+        "pygame": pygame.version.ver,
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+    }
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Scenario benchmarks with frame-time percentiles")
+    parser.add_argument("--scene", action="append", choices=sorted(SCENES),
+                        help="scene to run; repeat for several (default: all)")
+    parser.add_argument("--mode", choices=MODES + ("both",), default="both",
+                        help="render to an offscreen surface, simulate only, or both")
+    parser.add_argument("--frames", type=int, default=600, help="timed frames per scene")
+    parser.add_argument("--warmup", type=int, default=60, help="untimed frames run first to fill caches")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", metavar="PATH", help="also write the results as JSON to PATH ('-' for stdout)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    # Sprites are converted to the display format just as they are in the game
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.init()
+    pygame.display.set_mode(SCENE_SIZE)
+    render_targets = RenderTargets(SCENE_SIZE)
+
+    modes = MODES if args.mode == "both" else (args.mode,)
+    results = []
+    for name in args.scene or list(SCENES):
+        for mode in modes:
+            results.append(run_scene(name, args.frames, args.warmup, mode == "render", args.seed, render_targets))
+
+    report = {
+        "frames": args.frames,
+        "warmup": args.warmup,
+        "seed": args.seed,
+        "size": list(SCENE_SIZE),
+        "environment": environment(),
+        "results": results,
+    }
+    if args.json == "-":
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    else:
+        print(format_table(results))
+        if args.json:
+            with open(args.json, "w") as file:
+                json.dump(report, file, indent=2)
+    pygame.quit()
+    return report
+
+
+if __name__ == "__main__":
+    main()
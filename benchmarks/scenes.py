@@ -0,0 +1,193 @@
+# benchmarks/scenes.py
+
+import numpy as np
+from core.rng import get_numpy_stream, get_stream
+from core.spatial_hash import SpatialHash
+from effects.starfield import Starfield
+from entities.asteroid import Asteroid, get_shape_bank
+from entities.boss import Boss
+from entities.enemy import Enemy, EnemySwarm
+from entities.player import Player
+from entities.projectiles import ProjectileStore
+from utils import get_opposite_color
+
+SCENE_SIZE = (1280, 720)
+BACKGROUND_COLOR = (20, 24, 48)
+ENEMY_INNER_COLOR = (255, 0, 0)
+
+
+class Scene:
+    """
+    A canned game scene built from the real entity classes.
+
+    Each frame is split into the same three phases as the game loop's
+    simulation step and drawing: update(), collide() and draw(). Nothing is
+    destroyed by collisions, so the load a scene starts with is the load it
+    is measured under for every frame.
+    """
+
+    def __init__(self, name, width=SCENE_SIZE[0], height=SCENE_SIZE[1], bg_color=BACKGROUND_COLOR):
+        self.name = name
+        self.width = width
+        self.height = height
+        self.bg_color = bg_color
+        self.enemy_color = get_opposite_color(bg_color)
+        self.projectiles = ProjectileStore()
+        self.player = Player(width // 2, height - 100, self.enemy_color, width, height, self.projectiles)
+        self.enemies = EnemySwarm(width, height)
+        self.boss = None
+        self.boss_shockwave_every_frame = False
+        self.asteroids = []
+        self.bullet_target = 0
+        self.collision_grid = SpatialHash(cell_size=64)
+        self.starfield = Starfield(width, height, rng=get_numpy_stream("cosmetic"))
+
+    def add_enemies(self, count):
+        rng = get_stream("spawn")
+        for _ in range(count):
+            x = rng.uniform(20, self.width - 20)
+            y = rng.uniform(50, self.height * 0.45)
+            enemy = Enemy(x, y, self.enemy_color, ENEMY_INNER_COLOR, self.width, self.height, self.projectiles)
+            self.enemies.append(enemy)
+
+    def add_asteroids(self, count, size_multiplier=1):
+        rng = get_stream("spawn")
+        for _ in range(count):
+            x = rng.uniform(0, self.width)
+            y = rng.uniform(0, self.height)
+            asteroid = Asteroid(x, y, rng.uniform(2, 5), self.width, self.height, self.bg_color, size_multiplier)
+            self.asteroids.append(asteroid)
+
+    def add_boss(self, phase=0, shockwave_every_frame=False):
+        self.boss = Boss(self.width // 2, 100, self.enemy_color, ENEMY_INNER_COLOR, self.width, self.height, self.projectiles)
+        if phase:
+            # Just under the health where that phase starts (two thirds, then one third)
+            self.boss.health = int(self.boss.max_health * (1 - phase / 3)) - 1
+        self.boss_shockwave_every_frame = shockwave_every_frame
+
+    def add_bullets(self, count):
+        """Keep ``count`` enemy bullets alive, replacing those that leave the screen."""
+        self.bullet_target = count
+        self.refill_bullets()
+
+    def refill_bullets(self):
+        missing = self.bullet_target - self.projectiles.count_owner('enemy')
+        if missing <= 0:
+            return
+        rng = get_numpy_stream("spawn")
+        angles = rng.uniform(0, np.pi, missing)
+        speeds = rng.uniform(2, 6, missing)
+        self.projectiles.spawn_batch(
+            rng.uniform(0, self.width, missing), rng.uniform(0, self.height, missing),
+            np.cos(angles) * speeds, np.sin(angles) * speeds, 1, 'enemy',
+        )
+
+    def update(self):
+        """One simulation step: movement, AI, firing and bullet upkeep."""
+        self.starfield.update()
+        self.player.shoot()
+        self.enemies.update(self.player.x, self.player.y)
+        self.enemies.move()
+        if self.boss is not None:
+            self.boss.update(self.player)
+            if self.boss_shockwave_every_frame:
+                self.boss.shockwave_burst(self.boss.get_phase())
+        self.projectiles.move()
+        self.projectiles.kill(self.projectiles.offscreen_mask(self.width, self.height))
+        self.refill_bullets()
+        for asteroid in self.asteroids:
+            asteroid.move()
+            asteroid.rotate()
+
+    def collide(self):
+        """Run the game's collision queries and return how many contacts were found."""
+        grid = self.collision_grid
+        grid.clear()
+        for enemy in self.enemies:
+            grid.insert(enemy, enemy.x, enemy.y, enemy.radius_outer, 'enemy')
+        if self.boss is not None:
+            grid.insert(self.boss, self.boss.x, self.boss.y, self.boss.radius_outer, 'boss')
+        for asteroid in self.asteroids:
+            grid.insert(asteroid, asteroid.x, asteroid.y, asteroid.radius_outer, 'asteroid')
+
+        contacts = 0
+        for _, bullet_x, bullet_y, bullet_radius in self.projectiles.entries('player'):
+            contacts += len(grid.collide(bullet_x, bullet_y, bullet_radius, 'enemy'))
+            contacts += len(grid.collide(bullet_x, bullet_y, bullet_radius, 'boss'))
+            contacts += len(grid.collide(bullet_x, bullet_y, bullet_radius, 'asteroid'))
+        player = self.player
+        contacts += int(np.count_nonzero(self.projectiles.hit_mask(player.x, player.y, player.radius, ('enemy', 'boss'))))
+        contacts += len(grid.collide(player.x, player.y, player.radius, 'asteroid'))
+        return contacts
+
+    def draw(self, surface):
+        """Draw the scene in the game's layer order."""
+        surface.fill(self.bg_color)
+        self.starfield.draw(surface)
+        self.player.draw(surface)
+        for enemy in self.enemies:
+            enemy.draw(surface)
+        self.projectiles.draw(surface, 'enemy')
+        self.projectiles.draw(surface, 'player')
+        if self.boss is not None:
+            self.boss.draw(surface)
+            self.boss.draw_health_bar(surface)
+        self.projectiles.draw(surface, 'boss')
+        get_shape_bank().fit_to(self.asteroids)
+        for asteroid in self.asteroids:
+            asteroid.draw(surface)
+
+    def stats(self):
+        return {
+            "enemies": len(self.enemies),
+            "asteroids": len(self.asteroids),
+            "bullets": len(self.projectiles),
+            "boss_phase": self.boss.get_phase() if self.boss is not None else None,
+        }
+
+
+def boss_phase_two():
+    """A phase-2 boss adding a shockwave burst on top of its patterns every frame."""
+    scene = Scene("boss_phase2")
+    scene.add_boss(phase=2, shockwave_every_frame=True)
+    return scene
+
+
+def enemy_flock():
+    """300 enemies steering and separating as one swarm."""
+    scene = Scene("enemy_flock")
+    scene.add_enemies(300)
+    return scene
+
+
+def asteroid_field():
+    """40 large asteroids tumbling across the screen."""
+    scene = Scene("asteroid_field")
+    scene.add_asteroids(40, size_multiplier=2)
+    return scene
+
+
+def bullet_storm():
+    """2,000 live enemy bullets, topped up as they leave the screen."""
+    scene = Scene("bullet_storm")
+    scene.add_bullets(2000)
+    return scene
+
+
+def everything():
+    """Every worst case above at once."""
+    scene = Scene("everything")
+    scene.add_boss(phase=2, shockwave_every_frame=True)
+    scene.add_enemies(300)
+    scene.add_asteroids(40, size_multiplier=2)
+    scene.add_bullets(2000)
+    return scene
+
+
+SCENES = {
+    "boss_phase2": boss_phase_two,
+    "enemy_flock": enemy_flock,
+    "asteroid_field": asteroid_field,
+    "bullet_storm": bullet_storm,
+    "everything": everything,
+}
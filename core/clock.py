@@ -0,0 +1,51 @@
+# core/clock.py
+
+import pygame
+
+
+class WallClock:
+    """Milliseconds since pygame.init(), as the game has always used."""
+
+    def get_ticks(self):
+        return pygame.time.get_ticks()
+
+
+class SimulationClock:
+    """
+    Game time that only moves when the simulation steps it.
+
+    Driving every timer from this clock makes gameplay independent of how fast
+    frames are drawn, and lets a headless run fast-forward through it.
+    """
+
+    def __init__(self, start_ms=0):
+        self.ticks = float(start_ms)
+
+    def advance(self, ms):
+        self.ticks += ms
+
+    def reset(self, start_ms=0):
+        self.ticks = float(start_ms)
+
+    def get_ticks(self):
+        return int(self.ticks)
+
+
+_clock = WallClock()
+
+
+def get_ticks():
+    """Current game time in milliseconds from the active clock."""
+    return _clock.get_ticks()
+
+
+def get_clock():
+    return _clock
+
+
+def set_clock(clock):
+    """Install the clock every entity reads; returns the one it replaced."""
+    global _clock
+    previous = _clock
+    _clock = clock
+    return previous
@@ -0,0 +1,81 @@
+# core/dirty_rects.py
+
+import pygame
+
+DIRTY_AREA_THRESHOLD = 0.4  # Above this fraction of the screen a full flip is cheaper
+
+
+class DirtyRectTracker:
+    """
+    Collect the screen regions that changed this frame and present only those.
+
+    Regions marked in one frame are presented again in the next, so anything
+    that moved is also erased from where it was. When the dirty area grows
+    past ``threshold`` of the screen, or a full redraw was requested, the
+    whole frame is copied and flipped instead.
+    """
+
+    def __init__(self, size, threshold=DIRTY_AREA_THRESHOLD, enabled=True):
+        self.screen_rect = pygame.Rect((0, 0), size)
+        self.threshold = threshold
+        self.enabled = enabled
+        self.rects = []
+        self.previous_rects = []
+        self.full_frames = 1
+        self.pending = None
+        self.frames = 0
+        self.full_presents = 0
+
+    def resize(self, size):
+        self.screen_rect = pygame.Rect((0, 0), size)
+        self.mark_all()
+
+    def mark(self, rect):
+        """Mark one rect-like region as changed this frame."""
+        rect = self.screen_rect.clip(rect)
+        if rect.width and rect.height:
+            self.rects.append(rect)
+
+    def mark_many(self, rects):
+        for rect in rects:
+            self.mark(rect)
+
+    def mark_all(self, frames=1):
+        """Present the whole screen for the next ``frames`` frames."""
+        self.full_frames = max(self.full_frames, frames)
+
+    def _is_full(self, rects):
+        if not self.enabled or self.full_frames > 0:
+            return True
+        area = sum(rect.width * rect.height for rect in rects)
+        return area > self.threshold * self.screen_rect.width * self.screen_rect.height
+
+    def present(self, screen, surface):
+        """Copy the dirty parts of ``surface`` (or all of it) onto the screen."""
+        rects = self.rects + self.previous_rects
+        if self._is_full(rects):
+            screen.blit(surface, (0, 0))
+            self.pending = None
+        else:
+            screen.blits([(surface, rect, rect) for rect in rects], doreturn=False)
+            self.pending = rects
+
+    def update_display(self):
+        """Push this frame to the display with update(rects) or a full flip."""
+        if self.pending is None:
+            pygame.display.flip()
+            self.full_presents += 1
+        elif self.pending:
+            pygame.display.update(self.pending)
+        self.frames += 1
+        self.full_frames = max(0, self.full_frames - 1)
+        self.previous_rects = self.rects
+        self.rects = []
+        self.pending = None
+
+    def stats(self):
+        return {
+            "frames": self.frames,
+            "full_presents": self.full_presents,
+            "dirty_rects": len(self.previous_rects),
+        }
@@ -0,0 +1,91 @@
+# core/render_targets.py
+
+import pygame
+
+
+class RenderTargets:
+    """
+    Named, screen-sized back buffers that are allocated once and reused.
+
+    Surfaces are converted to the display format when a display exists, so
+    blits between them and the screen take the fast path. The manager counts
+    how many surfaces it had to allocate this frame and overall; in steady
+    state the per-frame count stays at zero.
+    """
+
+    def __init__(self, size):
+        self.size = tuple(size)
+        self.targets = {}
+        self.layer_keys = {}
+        self.allocations = 0
+        self.total_allocations = 0
+
+    def begin_frame(self):
+        """Reset the per-frame allocation counter."""
+        self.allocations = 0
+
+    def resize(self, size):
+        """Change the target size; buffers are reallocated lazily on next use."""
+        size = tuple(size)
+        if size != self.size:
+            self.size = size
+            self.targets.clear()
+            self.layer_keys.clear()
+
+    def get(self, name, alpha=False):
+        """Return the back buffer called ``name``, allocating it on first use."""
+        key = (name, alpha)
+        surface = self.targets.get(key)
+        if surface is None:
+            surface = self._allocate(alpha)
+            self.targets[key] = surface
+        return surface
+
+    def get_layer(self, name, key, compose, alpha=False):
+        """
+        Return a buffer holding a static layer, recomposed only when ``key`` changes.
+
+        ``compose`` is called with the buffer to draw the layer from scratch.
+        Live elements may be drawn over the layer each frame as long as they
+        repaint the same pixels every time.
+        """
+        surface = self.get(name, alpha)
+        if self.layer_keys.get((name, alpha)) != key:
+            compose(surface)
+            self.layer_keys[(name, alpha)] = key
+        return surface
+
+    def _allocate(self, alpha):
+        surface = pygame.Surface(self.size, pygame.SRCALPHA if alpha else 0)
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha() if alpha else surface.convert()
+        self.allocations += 1
+        self.total_allocations += 1
+        return surface
+
+    def present(self, screen, surface, offset=(0, 0)):
+        """
+        Blit a finished frame to the screen, shifted by a camera offset.
+
+        Only the strips the shifted frame no longer covers are cleared, so a
+        shaking frame costs no more than a still one.
+        """
+        dx, dy = offset
+        screen.blit(surface, (dx, dy))
+        if dx or dy:
+            width, height = screen.get_size()
+            if dx > 0:
+                screen.fill((0, 0, 0), (0, 0, dx, height))
+            elif dx < 0:
+                screen.fill((0, 0, 0), (width + dx, 0, -dx, height))
+            if dy > 0:
+                screen.fill((0, 0, 0), (0, 0, width, dy))
+            elif dy < 0:
+                screen.fill((0, 0, 0), (0, height + dy, width, -dy))
+
+    def stats(self):
+        return {
+            "allocations": self.allocations,
+            "total_allocations": self.total_allocations,
+            "targets": len(self.targets),
+        }
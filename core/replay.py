@@ -0,0 +1,122 @@
+# core/replay.py
+
+import json
+import zlib
+
+# One bit per input the simulation reads in a step
+ACTION_LEFT = 1 << 0
+ACTION_RIGHT = 1 << 1
+ACTION_UP = 1 << 2
+ACTION_DOWN = 1 << 3
+ACTION_SHOOT = 1 << 4
+ACTION_MODE_BASIC = 1 << 5
+ACTION_MODE_SPREAD = 1 << 6
+
+REPLAY_MAGIC = b"SPACEPY-REPLAY"
+REPLAY_VERSION = 1
+LOADOUT_FIELDS = ("wing_level", "weapon_level", "hull_type", "nozzle_type")
+
+
+def pack_actions(direction_x, direction_y, shooting):
+    """Turn a movement direction and fire button into an action bitmask."""
+    actions = 0
+    if direction_x < 0:
+        actions |= ACTION_LEFT
+    elif direction_x > 0:
+        actions |= ACTION_RIGHT
+    if direction_y < 0:
+        actions |= ACTION_UP
+    elif direction_y > 0:
+        actions |= ACTION_DOWN
+    if shooting:
+        actions |= ACTION_SHOOT
+    return actions
+
+
+def unpack_direction(actions):
+    """Return the (direction_x, direction_y) an action bitmask steers the player in."""
+    direction_x = -1 if actions & ACTION_LEFT else 1 if actions & ACTION_RIGHT else 0
+    direction_y = -1 if actions & ACTION_UP else 1 if actions & ACTION_DOWN else 0
+    return direction_x, direction_y
+
+
+class InputRecorder:
+    """
+    Log the action bitmask of every simulation step of one run.
+
+    Actions fit in a byte, so a run is stored as a JSON header (seed, screen
+    size, loadout) followed by one byte per step, zlib-compressed. Held
+    inputs repeat for many steps and compress to almost nothing.
+    """
+
+    def __init__(self, path, header):
+        self.path = path
+        self.header = dict(header)
+        self.actions = bytearray()
+        self.closed = False
+
+    def __len__(self):
+        return len(self.actions)
+
+    def record(self, actions):
+        """Append one step's actions; steps after close() are dropped."""
+        if not self.closed:
+            self.actions.append(actions)
+
+    def close(self):
+        """Write the recording once; later calls do nothing."""
+        if self.closed:
+            return
+        self.closed = True
+        header = dict(self.header, version=REPLAY_VERSION, steps=len(self.actions))
+        payload = json.dumps(header).encode("utf-8") + b"\n" + bytes(self.actions)
+        with open(self.path, "wb") as file:
+            file.write(REPLAY_MAGIC + zlib.compress(payload, 9))
+
+
+class InputPlayback:
+    """Feed a recorded run's actions back one simulation step at a time."""
+
+    def __init__(self, header, actions):
+        self.header = header
+        self.actions = actions
+        self.position = 0
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as file:
+            data = file.read()
+        if not data.startswith(REPLAY_MAGIC):
+            raise ValueError(f"{path} is not a replay file")
+        header_line, _, actions = zlib.decompress(data[len(REPLAY_MAGIC):]).partition(b"\n")
+        header = json.loads(header_line)
+        if header.get("version") != REPLAY_VERSION:
+            raise ValueError(f"{path} has unsupported replay version {header.get('version')}")
+        return cls(header, actions)
+
+    def __len__(self):
+        return len(self.actions)
+
+    @property
+    def seed(self):
+        return self.header["seed"]
+
+    @property
+    def screen_size(self):
+        return tuple(self.header["screen_size"])
+
+    @property
+    def loadout(self):
+        return self.header.get("loadout", {})
+
+    @property
+    def finished(self):
+        return self.position >= len(self.actions)
+
+    def next_actions(self):
+        """Return the next step's actions, or None once the recording is used up."""
+        if self.finished:
+            return None
+        actions = self.actions[self.position]
+        self.position += 1
+        return actions
@@ -0,0 +1,146 @@
+# core/spatial_hash.py
+
+import math
+import numpy as np
+
+# Offsets of the 3x3 block of cells around a cell, as (dx, dy) pairs
+_BLOCK = [(dx, dy) for dx in (-1, 0, 1) for dy in (-1, 0, 1)]
+
+
+class SpatialHash:
+    """
+    Uniform grid broadphase for circle-vs-circle collision tests.
+
+    Circles are inserted into every cell their bounding box touches, tagged
+    with a layer name (e.g. 'enemy', 'asteroid'). Queries only test the
+    circles sharing a cell with the query circle. The grid keeps counters of
+    candidate pairs checked versus actual hits for the current frame and in
+    total.
+    """
+
+    def __init__(self, cell_size=64):
+        self.cell_size = cell_size
+        self.cells = {}
+        self.item_cells = {}
+        self.candidates = 0
+        self.hits = 0
+        self.total_candidates = 0
+        self.total_hits = 0
+
+    def clear(self):
+        """Empty the grid and start a new frame of counters."""
+        self.cells.clear()
+        self.item_cells.clear()
+        self.candidates = 0
+        self.hits = 0
+
+    def _cell_range(self, x, y, radius):
+        size = self.cell_size
+        return (
+            math.floor((x - radius) / size),
+            math.floor((x + radius) / size),
+            math.floor((y - radius) / size),
+            math.floor((y + radius) / size),
+        )
+
+    def insert(self, item, x, y, radius, layer=None):
+        """Add a circle to the grid."""
+        entry = (item, x, y, radius, layer)
+        min_cx, max_cx, min_cy, max_cy = self._cell_range(x, y, radius)
+        keys = []
+        for cx in range(min_cx, max_cx + 1):
+            for cy in range(min_cy, max_cy + 1):
+                key = (cx, cy)
+                self.cells.setdefault(key, []).append(entry)
+                keys.append(key)
+        self.item_cells[id(item)] = (entry, keys)
+
+    def remove(self, item):
+        """Take an item out of the grid, e.g. once it has been destroyed."""
+        record = self.item_cells.pop(id(item), None)
+        if record is None:
+            return
+        entry, keys = record
+        for key in keys:
+            bucket = self.cells[key]
+            bucket.remove(entry)
+            if not bucket:
+                del self.cells[key]
+
+    def query(self, x, y, radius, layer=None):
+        """Return the candidate entries sharing a cell with the query circle."""
+        min_cx, max_cx, min_cy, max_cy = self._cell_range(x, y, radius)
+        if min_cx == max_cx and min_cy == max_cy:
+            bucket = self.cells.get((min_cx, min_cy), ())
+            return [entry for entry in bucket if layer is None or entry[4] == layer]
+        seen = set()
+        candidates = []
+        for cx in range(min_cx, max_cx + 1):
+            for cy in range(min_cy, max_cy + 1):
+                for entry in self.cells.get((cx, cy), ()):
+                    if (layer is None or entry[4] == layer) and id(entry[0]) not in seen:
+                        seen.add(id(entry[0]))
+                        candidates.append(entry)
+        return candidates
+
+    def collide(self, x, y, radius, layer=None):
+        """Return the items whose circles overlap the query circle."""
+        hits = []
+        candidates = self.query(x, y, radius, layer)
+        for item, item_x, item_y, item_radius, _ in candidates:
+            reach = radius + item_radius
+            offset_x = x - item_x
+            offset_y = y - item_y
+            if offset_x * offset_x + offset_y * offset_y < reach * reach:
+                hits.append(item)
+        self.candidates += len(candidates)
+        self.total_candidates += len(candidates)
+        self.hits += len(hits)
+        self.total_hits += len(hits)
+        return hits
+
+    def stats(self):
+        """Return the candidate and hit counters."""
+        return {
+            "candidates": self.candidates,
+            "hits": self.hits,
+            "total_candidates": self.total_candidates,
+            "total_hits": self.total_hits,
+            "cells": len(self.cells),
+        }
+
+
+def neighbor_pairs(x, y, radius):
+    """
+    Return (rows, cols) index arrays of every pair of points closer than
+    ``radius`` (excluding coincident points).
+
+    Points are bucketed into radius-sized cells and sorted by cell, and each
+    point's 3x3 block of cells is found with searchsorted. That keeps the
+    work proportional to the number of nearby pairs rather than n squared.
+    """
+    n = len(x)
+    if n < 2:
+        empty = np.zeros(0, dtype=np.intp)
+        return empty, empty
+    cell_x = np.floor(x / radius).astype(np.int64)
+    cell_y = np.floor(y / radius).astype(np.int64)
+    cell_y -= cell_y.min() - 1
+    stride = int(cell_y.max()) + 2
+    keys = cell_x * stride + cell_y
+    order = np.argsort(keys, kind='stable')
+    sorted_keys = keys[order]
+
+    block = np.array([dx * stride + dy for dx, dy in _BLOCK], dtype=np.int64)
+    targets = (keys[:, None] + block[None, :]).ravel()
+    start = np.searchsorted(sorted_keys, targets, 'left')
+    counts = np.searchsorted(sorted_keys, targets, 'right') - start
+    total = int(counts.sum())
+    rows = np.repeat(np.arange(n).repeat(len(block)), counts)
+    cols = order[np.arange(total) + np.repeat(start - (np.cumsum(counts) - counts), counts)]
+
+    offset_x = x[rows] - x[cols]
+    offset_y = y[rows] - y[cols]
+    offset_sq = offset_x * offset_x + offset_y * offset_y
+    close = (offset_sq > 0) & (offset_sq < radius * radius)
+    return rows[close], cols[close]
@@ -0,0 +1,88 @@
+# core/timestep.py
+
+from contextlib import contextmanager
+
+SIMULATION_HZ = 60
+MAX_STEPS_PER_FRAME = 5  # A frame slower than this many steps drops the excess instead of spiralling
+
+
+class FixedTimestep:
+    """
+    Accumulator that turns variable frame times into whole fixed simulation steps.
+
+    The game advances by ``advance(frame_ms)`` steps each frame, so simulation
+    speed no longer depends on how long drawing took. ``alpha`` is how far the
+    renderer sits between the last two simulation states.
+    """
+
+    def __init__(self, hz=SIMULATION_HZ, max_steps=MAX_STEPS_PER_FRAME):
+        self.step_ms = 1000 / hz
+        self.max_steps = max_steps
+        self.accumulator = 0.0
+        self.total_steps = 0
+
+    def reset(self):
+        self.accumulator = 0.0
+
+    def advance(self, frame_ms):
+        """Add a frame's elapsed time and return how many steps to simulate."""
+        self.accumulator += frame_ms
+        steps = int(self.accumulator // self.step_ms)
+        if steps > self.max_steps:
+            steps = self.max_steps
+            self.accumulator = 0.0
+        else:
+            self.accumulator -= steps * self.step_ms
+        self.total_steps += steps
+        return steps
+
+    @property
+    def alpha(self):
+        return min(self.accumulator / self.step_ms, 1.0)
+
+
+class Interpolator:
+    """
+    Remember where objects were before the latest simulation step.
+
+    While drawing inside ``blended(objects, alpha)``, each live object that
+    was captured is moved to the point ``alpha`` of the way from its previous
+    to its current position, then put back. Objects spawned since the capture,
+    or that jumped further than ``max_jump`` (wrapping, respawning), are drawn
+    where they are.
+    """
+
+    def __init__(self, max_jump=100):
+        self.max_jump = max_jump
+        self.previous = {}
+
+    def capture(self, objects):
+        # Holding the object keeps its id from being reused by a new one
+        self.previous = {id(obj): (obj, obj.x, obj.y) for obj in objects}
+
+    def clear(self):
+        self.previous = {}
+
+    @contextmanager
+    def blended(self, objects, alpha):
+        restore = []
+        if alpha < 1.0:
+            for obj in objects:
+                entry = self.previous.get(id(obj))
+                if entry is None or entry[0] is not obj:
+                    continue
+                _, previous_x, previous_y = entry
+                current_x, current_y = obj.x, obj.y
+                dx = current_x - previous_x
+                dy = current_y - previous_y
+                if abs(dx) > self.max_jump or abs(dy) > self.max_jump:
+                    continue
+                restore.append((obj, current_x, current_y))
+                obj.x = previous_x + dx * alpha
+                obj.y = previous_y + dy * alpha
+        try:
+            yield
+        finally:
+            for obj, current_x, current_y in restore:
+                obj.x = current_x
+                obj.y = current_y
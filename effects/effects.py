@@ -1,7 +1,12 @@
 # effects/effects.py
 
 import pygame
-import random
+from core.rng import get_stream
+
+DAMAGE_FLASH_COLOR = (255, 120, 120)
+BOSS_FLASH_COLOR = (255, 80, 180)
+FLASH_CACHE_SIZE = 4  # Flash gradients kept pre-rendered; the game uses two colors
+FLASH_MAX_RADIUS = 400  # Caps each cached gradient at 800x800 (about 2.5 MB) however large the screen
 
 class Effects:
     def __init__(self, screen_width, screen_height):
@@ -12,42 +17,68 @@ class Effects:
         self.flash_duration = 0
         self.flash_alpha = 0
         self.flash_center = (screen_width // 2, screen_height // 2)
-        self.flash_color = (255, 120, 120)
+        self.flash_color = DAMAGE_FLASH_COLOR
+        self.flash_radius = min(int(max(screen_width, screen_height) * 0.35), FLASH_MAX_RADIUS)
+        self.flash_cache = {}
+        for color in (DAMAGE_FLASH_COLOR, BOSS_FLASH_COLOR):
+            self.get_flash_sprite(color)
 
     def start_shake(self, duration=15):
         self.shake_duration = duration
 
-    def apply_shake(self, surface):
+    def get_shake_offset(self):
+        """Return this frame's camera offset; applied when the frame is presented."""
         if self.shake_duration > 0:
-            dx = random.randint(-self.shake_intensity, self.shake_intensity)
-            dy = random.randint(-self.shake_intensity, self.shake_intensity)
-            self.shake_duration -= 1
-            shaken_surface = pygame.Surface((self.screen_width, self.screen_height))
-            shaken_surface.blit(surface, (dx, dy))
-            return shaken_surface
-        else:
-            return surface
+            rng = get_stream("cosmetic")
+            dx = rng.randint(-self.shake_intensity, self.shake_intensity)
+            dy = rng.randint(-self.shake_intensity, self.shake_intensity)
+            return (dx, dy)
+        return (0, 0)
 
-    def start_flash(self, center, duration=12, color=(255, 120, 120)):
+    def start_flash(self, center, duration=12, color=DAMAGE_FLASH_COLOR):
         self.flash_duration = duration
         self.flash_alpha = 255
         self.flash_center = center
         self.flash_color = color
 
+    def render_flash_sprite(self, color):
+        """
+        Render the flash gradient at full strength, sized to its own bounding box.
+
+        The rings step down to 2/3 and 1/3 of the outer alpha towards the
+        centre, so scaling the whole sprite by a per-surface alpha reproduces
+        the fading gradient.
+        """
+        radius = self.flash_radius
+        sprite = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+        step_count = 3
+        alpha_step = int(255 / step_count)
+        for i in range(step_count):
+            step_radius = int(radius * (1 - i * 0.25))
+            pygame.draw.circle(sprite, (*color, 255 - i * alpha_step), (radius, radius), step_radius)
+        return sprite
+
+    def get_flash_sprite(self, color):
+        color = tuple(color)
+        sprite = self.flash_cache.get(color)
+        if sprite is None:
+            sprite = self.render_flash_sprite(color)
+            self.flash_cache[color] = sprite
+            if len(self.flash_cache) > FLASH_CACHE_SIZE:
+                del self.flash_cache[next(iter(self.flash_cache))]
+        return sprite
+
     def apply_flash(self, surface):
         if self.flash_duration > 0:
-            flash_overlay = pygame.Surface((self.screen_width, self.screen_height), pygame.SRCALPHA)
-            radius = int(max(self.screen_width, self.screen_height) * 0.35)
-            step_count = 3
-            alpha_step = max(int(self.flash_alpha / step_count), 1)
-            for i in range(step_count):
-                step_radius = int(radius * (1 - i * 0.25))
-                color = (*self.flash_color, max(self.flash_alpha - i * alpha_step, 0))
-                pygame.draw.circle(flash_overlay, color, self.flash_center, step_radius)
-            self.flash_alpha -= int(255 / self.flash_duration)
-            self.flash_duration -= 1
-            surface.blit(flash_overlay, (0, 0))
+            sprite = self.get_flash_sprite(self.flash_color)
+            sprite.set_alpha(max(0, min(255, self.flash_alpha)))
+            surface.blit(sprite, (self.flash_center[0] - self.flash_radius, self.flash_center[1] - self.flash_radius))
         return surface
 
     def update(self):
-        pass  # Placeholder for any future updates to effects
+        """Advance shake and flash by one simulation step; durations count steps, not frames."""
+        if self.shake_duration > 0:
+            self.shake_duration -= 1
+        if self.flash_duration > 0:
+            self.flash_alpha -= int(255 / self.flash_duration)
+            self.flash_duration -= 1
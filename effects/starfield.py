@@ -0,0 +1,77 @@
+# effects/starfield.py
+
+import numpy as np
+import pygame
+from utils import blit_batch
+
+# (star count, min speed, max speed, star radius) from the far layer to the near one
+DEFAULT_STAR_LAYERS = (
+    (34, 1.0, 2.0, 1),
+    (33, 2.0, 3.0, 2),
+    (33, 3.0, 4.0, 3),
+)
+
+class Starfield:
+    """
+    Scrolling parallax starfield held in NumPy arrays.
+
+    Each layer has its own speed band and star size, so nearer layers scroll
+    faster and draw larger. Stars are advanced and respawned in one
+    vectorized step and drawn from pre-rendered sprites with a single blit call.
+    """
+
+    def __init__(self, width, height, layers=DEFAULT_STAR_LAYERS, color=(255, 255, 255), rng=None):
+        self.width = width
+        self.height = height
+        self.color = color
+        self.rng = rng if rng is not None else np.random.default_rng()
+        counts = [count for count, _, _, _ in layers]
+        self.min_speed = np.repeat([low for _, low, _, _ in layers], counts).astype(np.float64)
+        self.max_speed = np.repeat([high for _, _, high, _ in layers], counts).astype(np.float64)
+        self.radius = np.repeat([radius for _, _, _, radius in layers], counts).astype(np.int64)
+        n = len(self.radius)
+        self.x = self.rng.integers(0, width + 1, n).astype(np.float64)
+        self.y = self.rng.integers(0, height + 1, n).astype(np.float64)
+        self.speed = self.rng.uniform(self.min_speed, self.max_speed)
+        self.sprites = {radius: self.render_star(radius) for radius in np.unique(self.radius).tolist()}
+        self.sprite_for_star = [self.sprites[radius] for radius in self.radius.tolist()]
+
+    def __len__(self):
+        return len(self.radius)
+
+    def render_star(self, radius):
+        sprite = pygame.Surface((radius * 2, radius * 2))
+        sprite.set_colorkey((0, 0, 0))
+        pygame.draw.circle(sprite, self.color, (radius, radius), radius)
+        if pygame.display.get_surface() is not None:
+            sprite = sprite.convert()
+        return sprite
+
+    def resize(self, width, height):
+        """Rescale star positions to a new screen size."""
+        self.x *= width / self.width
+        self.y *= height / self.height
+        self.width = width
+        self.height = height
+
+    def update(self):
+        """Scroll every star down and respawn those that left the bottom at the top."""
+        self.y += self.speed
+        respawn = self.y > self.height
+        count = int(np.count_nonzero(respawn))
+        if count:
+            self.x[respawn] = self.rng.integers(0, self.width + 1, count)
+            self.y[respawn] = 0
+            self.speed[respawn] = self.rng.uniform(self.min_speed[respawn], self.max_speed[respawn])
+
+    def draw(self, surface):
+        xs = (self.x - self.radius).astype(np.int64).tolist()
+        ys = (self.y - self.radius).astype(np.int64).tolist()
+        blit_batch(surface, list(zip(self.sprite_for_star, zip(xs, ys))))
+
+    def rects(self):
+        """Return the screen rect each star covers, for dirty-rect presentation."""
+        xs = (self.x - self.radius).astype(np.int64).tolist()
+        ys = (self.y - self.radius).astype(np.int64).tolist()
+        sizes = (self.radius * 2).tolist()
+        return [pygame.Rect(x, y, size, size) for x, y, size in zip(xs, ys, sizes)]
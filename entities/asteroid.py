@@ -2,11 +2,284 @@
 
 import pygame
 import math
-import random
+from collections import OrderedDict
+import numpy as np
+from core.rng import get_stream
 from utils import get_opposite_color
 
+ROTATION_STEP = 3  # Degrees between pre-rendered rotation frames
+ROTATION_FRAMES = 360 // ROTATION_STEP
+SHAPE_COUNT = 16  # Distinct silhouettes shared by every asteroid
+BASE_RADIUS = 30  # Outer radius of a 1x asteroid
+MAX_SIZE_MULTIPLIER = 2
+FRAME_CACHE_SIZE = ROTATION_FRAMES * 8  # Frames kept until fit_to() sizes the cache to the asteroids in play
+FRAME_CACHE_MAX_BYTES = 64 * 1024 * 1024  # Pixel memory the cache may hold however many asteroids are in play
+
+
+def apply_tint(base_color, tint_color):
+    """
+    Apply a tint to the base color based on the background color.
+
+    :param base_color: Tuple representing the base RGB color.
+    :param tint_color: Tuple representing the background RGB color.
+    :return: Tuple representing the tinted RGB color.
+    """
+    return tuple(max(min(int((base + bg) / 2), 255), 0) for base, bg in zip(base_color, tint_color))
+
+
+def rotate_offsets(offsets, angle_deg):
+    """
+    Rotate an (n, 2) array of offsets about the origin in one vectorized pass.
+
+    :param offsets: NumPy array of (x, y) rows.
+    :param angle_deg: Rotation in degrees.
+    :return: New (n, 2) array.
+    """
+    angle = math.radians(angle_deg)
+    cos_a, sin_a = math.cos(angle), math.sin(angle)
+    rotated = np.empty_like(offsets)
+    rotated[:, 0] = offsets[:, 0] * cos_a - offsets[:, 1] * sin_a
+    rotated[:, 1] = offsets[:, 0] * sin_a + offsets[:, 1] * cos_a
+    return rotated
+
+
+def pack_layer(rgb, mask, alpha=None):
+    """
+    Copy the masked pixels of a rendered frame into an 8-bit colorkeyed surface cropped to them.
+
+    Asteroid frames only use a handful of flat colors, so a palette holds them
+    exactly at a quarter of the memory of a 32-bit surface.
+
+    :param rgb: (w, h, 3) array of the rendered frame's colors.
+    :param mask: (w, h) boolean array of the pixels that belong to this layer.
+    :param alpha: Surface alpha for a layer drawn translucently.
+    :return: Tuple of (surface, left, top) in frame pixels.
+    """
+    columns, rows = np.nonzero(mask)
+    left, top = int(columns.min()), int(rows.min())
+    right, bottom = int(columns.max()) + 1, int(rows.max()) + 1
+    crop = mask[left:right, top:bottom]
+    colors = rgb[left:right, top:bottom].astype(np.uint32)
+    packed = (colors[..., 0] << 16) | (colors[..., 1] << 8) | colors[..., 2]
+    palette, indices = np.unique(packed[crop], return_inverse=True)
+    pixels = np.zeros(crop.shape, dtype=np.uint8)
+    pixels[crop] = indices + 1  # Index 0 is the transparent colorkey
+    layer = pygame.Surface(crop.shape, 0, 8)
+    layer.set_palette([(0, 0, 0)] + [((color >> 16) & 255, (color >> 8) & 255, color & 255) for color in palette.tolist()])
+    pygame.surfarray.blit_array(layer, pixels)
+    layer.set_colorkey(0)
+    if alpha is not None:
+        layer.set_alpha(alpha)
+    return layer, left, top
+
+
+def frame_bytes(frame):
+    """Pixel memory held by a frame's layers."""
+    return sum(layer.get_width() * layer.get_height() * layer.get_bytesize() for layer, _, _ in frame)
+
+
+class AsteroidShapeBank:
+    def __init__(self, count=SHAPE_COUNT):
+        """
+        Precompute a fixed set of asteroid silhouettes shared by every Asteroid.
+
+        Vertices are stored as unit-radius offsets and craters at 1x scale, so one
+        shape serves every size. Rendered rotation frames are cached per
+        (shape, size, tint, frame) as cropped 8-bit layers and shared between
+        instances; fit_to() sizes the cache to the asteroids in play so each
+        keeps its whole rotation.
+
+        :param count: Number of distinct shapes to generate.
+        """
+        self.vertex_units = []
+        self.crater_offsets = []
+        self.crater_sizes = []
+        self.crater_counts = []
+        for _ in range(count):
+            self.generate_shape()
+        self.frames = OrderedDict()
+        self.capacity = FRAME_CACHE_SIZE
+        self.frame_bytes = 0
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+    def __len__(self):
+        return len(self.vertex_units)
+
+    def generate_shape(self):
+        """
+        Generate one silhouette: vertex unit vectors and up to MAX_SIZE_MULTIPLIER sets of craters.
+        """
+        rng = get_stream("cosmetic")
+        num_vertices = rng.randint(8, 12)
+        angle_between_vertices = 360 / num_vertices
+        angles = np.radians([
+            angle_between_vertices * i + rng.uniform(-angle_between_vertices / 4, angle_between_vertices / 4)
+            for i in range(num_vertices)
+        ])
+        radii = np.array([rng.uniform(0.75, 1.25) for _ in range(num_vertices)])
+        self.vertex_units.append(np.column_stack((np.cos(angles) * radii, np.sin(angles) * radii)))
+
+        # Craters scale linearly with size, so store them at 1x; larger asteroids show more of them
+        crater_count = rng.randint(3, 5)
+        offsets = []
+        sizes = []
+        for _ in range(crater_count * MAX_SIZE_MULTIPLIER):
+            crater_size = rng.randint(8, 15)
+            angle = rng.uniform(0, 2 * math.pi)
+            distance = rng.uniform(20 + crater_size, BASE_RADIUS - crater_size)
+            offsets.append((distance * math.cos(angle), distance * math.sin(angle)))
+            sizes.append(crater_size)
+        self.crater_offsets.append(np.array(offsets))
+        self.crater_sizes.append(np.array(sizes))
+        self.crater_counts.append(crater_count)
+
+    def frame_half_size(self, shape_id, size_multiplier):
+        """Half the side of a square that holds the body, its shadow and every crater."""
+        radius_outer = BASE_RADIUS * size_multiplier
+        max_radius = float(np.hypot(*self.vertex_units[shape_id].T).max()) * radius_outer
+        offsets, sizes = self.craters(shape_id, size_multiplier, 0)
+        crater_extent = float((np.hypot(*offsets.T) + sizes).max()) if len(sizes) else 0.0
+        return int(math.ceil(max(max_radius + int(radius_outer * 0.2), crater_extent))) + 2
+
+    def vertices(self, shape_id, size_multiplier, angle):
+        """
+        Get the shape's vertices rotated and scaled, relative to the asteroid centre.
+
+        :return: (n, 2) NumPy array.
+        """
+        return rotate_offsets(self.vertex_units[shape_id] * (BASE_RADIUS * size_multiplier), angle)
+
+    def craters(self, shape_id, size_multiplier, angle):
+        """
+        Get the shape's craters for a size, rotated, relative to the asteroid centre.
+
+        :return: Tuple of ((n, 2) offsets array, (n,) sizes array).
+        """
+        count = self.crater_counts[shape_id] * size_multiplier
+        offsets = self.crater_offsets[shape_id][:count] * size_multiplier
+        return rotate_offsets(offsets, angle), self.crater_sizes[shape_id][:count] * size_multiplier
+
+    def render_frame(self, shape_id, size_multiplier, bg_color, index):
+        """
+        Rasterize one rotation frame: body, outline, shadow and highlight overlay, and craters.
+
+        The frame is drawn at full color and alpha, then split by alpha level
+        into an opaque layer and the translucent shadow spilling past the body;
+        the layers never overlap, so drawing them all reproduces the frame.
+
+        :return: Tuple of (surface, x, y) layers, each placed relative to the asteroid centre.
+        """
+        radius_outer = BASE_RADIUS * size_multiplier
+        rotation = index * ROTATION_STEP
+        half = self.frame_half_size(shape_id, size_multiplier)
+        frame = pygame.Surface((half * 2, half * 2), pygame.SRCALPHA)
+
+        body_vertices = (self.vertices(shape_id, size_multiplier, rotation) + half).tolist()
+        if len(body_vertices) >= 3:
+            pygame.draw.polygon(frame, apply_tint((20, 20, 20), bg_color), body_vertices)
+            pygame.draw.polygon(frame, apply_tint((80, 80, 80), bg_color), body_vertices, width=2)  # Inner outline for depth
+            overlay = pygame.Surface(frame.get_size(), pygame.SRCALPHA)
+            shadow_color = (*apply_tint((10, 10, 10), bg_color), 90)
+            shadow_offset = int(radius_outer * 0.2)
+            shadow_vertices = [(x + shadow_offset, y + shadow_offset) for x, y in body_vertices]
+            pygame.draw.polygon(overlay, shadow_color, shadow_vertices, width=0)
+            highlight_color = (*apply_tint((180, 180, 180), bg_color), 110)
+            pygame.draw.circle(
+                overlay,
+                highlight_color,
+                (half - int(radius_outer * 0.2), half - int(radius_outer * 0.2)),
+                int(radius_outer * 0.35),
+            )
+            frame.blit(overlay, (0, 0))
+
+        # Crater color is gray with background tint
+        crater_color = apply_tint((100, 100, 100), bg_color)
+        offsets, sizes = self.craters(shape_id, size_multiplier, rotation)
+        for (crater_x, crater_y), size in zip((offsets + half).tolist(), sizes.tolist()):
+            pygame.draw.circle(frame, crater_color, (int(crater_x), int(crater_y)), size)
+
+        # One layer per alpha level, translucent ones (the shadow past the body) first
+        alpha = pygame.surfarray.array_alpha(frame)
+        rgb = pygame.surfarray.array3d(frame)
+        layers = []
+        for level in np.unique(alpha[alpha > 0]).tolist():
+            layer, left, top = pack_layer(rgb, alpha == level, None if level == 255 else level)
+            layers.append((layer, left - half, top - half))
+        return tuple(layers)
+
+    def get_frame(self, shape_id, size_multiplier, bg_color, angle):
+        """
+        Get the cached rotation frame nearest to ``angle``, rendering it on first use.
+
+        :return: Tuple of (surface, x, y) layers placed relative to the asteroid centre.
+        """
+        index = int(round(angle / ROTATION_STEP)) % ROTATION_FRAMES
+        key = (shape_id, size_multiplier, tuple(bg_color), index)
+        frame = self.frames.get(key)
+        if frame is not None:
+            self.frames.move_to_end(key)
+            self.stats["hits"] += 1
+        else:
+            self.stats["misses"] += 1
+            frame = self.render_frame(shape_id, size_multiplier, bg_color, index)
+            self.frames[key] = frame
+            self.frame_bytes += frame_bytes(frame)
+            self._evict()
+        return frame
+
+    def fit_to(self, asteroids):
+        """
+        Size the frame cache to the full rotation of every (shape, size, tint) in play.
+
+        When that shrinks the cache, frames no asteroid in play can use are
+        dropped before any least-recently-used ones.
+        """
+        in_play = {(asteroid.shape_id, asteroid.size_multiplier, tuple(asteroid.bg_color)) for asteroid in asteroids}
+        self.capacity = max(len(in_play), 1) * ROTATION_FRAMES
+        if len(self.frames) > self.capacity:
+            for key in [key for key in self.frames if key[:3] not in in_play]:
+                self._drop(key)
+        self._evict()
+
+    def _evict(self):
+        while len(self.frames) > self.capacity or (self.frame_bytes > FRAME_CACHE_MAX_BYTES and len(self.frames) > 1):
+            self._drop(next(iter(self.frames)))
+
+    def _drop(self, key):
+        self.frame_bytes -= frame_bytes(self.frames.pop(key))
+        self.stats["evictions"] += 1
+
+    def frame_cache_stats(self):
+        """Return the frame cache counters with its current size and pixel memory."""
+        return {**self.stats, "size": len(self.frames), "capacity": self.capacity, "bytes": self.frame_bytes}
+
+    def clear_frames(self):
+        """Drop every rendered frame and reset the counters; called when the palette changes."""
+        self.frames.clear()
+        self.frame_bytes = 0
+        for key in self.stats:
+            self.stats[key] = 0
+
+
+_shape_bank = None
+
+
+def get_shape_bank():
+    """Return the shared shape bank, generating it on first use."""
+    global _shape_bank
+    if _shape_bank is None:
+        _shape_bank = AsteroidShapeBank()
+    return _shape_bank
+
+
+def clear_asteroid_frame_cache():
+    """Drop the shared bank's rendered frames; called when the level palette changes."""
+    if _shape_bank is not None:
+        _shape_bank.clear_frames()
+
+
 class Asteroid:
-    def __init__(self, x, y, speed, screen_width, screen_height, bg_color, size_multiplier=1):
+    def __init__(self, x, y, speed, screen_width, screen_height, bg_color, size_multiplier=1, shape_bank=None):
         """
         Initialize an Asteroid instance.
 
@@ -17,6 +290,7 @@ class Asteroid:
         :param screen_height: Height of the game screen.
         :param bg_color: Current background color for tinting.
         :param size_multiplier: Multiplier for asteroid size (1x or 2x).
+        :param shape_bank: Bank to pick the silhouette from; defaults to the shared bank.
         """
         self.x = x
         self.y = y
@@ -27,31 +301,26 @@ class Asteroid:
 
         # Size configuration
         self.size_multiplier = size_multiplier
-        self.base_radius = 30  # Base radius for 1x size
+        self.base_radius = BASE_RADIUS  # Base radius for 1x size
         self.radius_outer = self.base_radius * self.size_multiplier
         self.radius_inner = 20 * self.size_multiplier
 
         # Rotation
         self.angle = 0  # Current rotation angle in degrees
-        self.rotation_speed = random.uniform(-2, 2)  # Degrees per frame
+        self.rotation_speed = get_stream("cosmetic").uniform(-2, 2)  # Degrees per frame
 
         # Colors
         self.color_outer = self.apply_tint((20, 20, 20), self.bg_color)  # Dark gray with background tint
         self.color_inner = self.apply_tint((80, 80, 80), self.bg_color)  # Gray with background tint
 
-        # Generate irregular polygon points
-        self.num_vertices = random.randint(8, 12)
-        self.vertex_angles = self.generate_vertex_angles()
-        self.vertex_radii = self.generate_vertex_radii()
-        self.vertices = self.generate_irregular_polygon()
-
-        # Craters configuration
-        self.craters = []
-        self.num_craters = random.randint(3, 5) * self.size_multiplier  # Adjusted for aesthetics
-        self.generate_craters()
+        # Shared silhouette; world-space geometry is only computed when asked for
+        self.shape_bank = shape_bank if shape_bank is not None else get_shape_bank()
+        self.shape_id = get_stream("cosmetic").randrange(len(self.shape_bank))
+        self._vertices = None
+        self._vertices_key = None
 
         # Movement direction (randomized)
-        self.direction_angle = math.radians(random.uniform(0, 360))
+        self.direction_angle = math.radians(get_stream("spawn").uniform(0, 360))
         self.dx = math.cos(self.direction_angle) * self.speed
         self.dy = math.sin(self.direction_angle) * self.speed
 
@@ -63,62 +332,31 @@ class Asteroid:
         :param tint_color: Tuple representing the background RGB color.
         :return: Tuple representing the tinted RGB color.
         """
-        tinted_color = tuple(
-            max(min(int((base + bg) / 2), 255), 0) for base, bg in zip(base_color, tint_color)
-        )
-        return tinted_color
-
-    def generate_irregular_polygon(self):
-        """
-        Generate points for an irregular polygon to represent the asteroid.
+        return apply_tint(base_color, tint_color)
 
-        :return: List of (x, y) tuples representing the polygon vertices.
+    @property
+    def vertices(self):
         """
-        points = []
-        for angle_deg, radius in zip(self.vertex_angles, self.vertex_radii):
-            angle_rad = math.radians(angle_deg + self.angle)
-            px = self.x + radius * math.cos(angle_rad)
-            py = self.y + radius * math.sin(angle_rad)
-            points.append((px, py))
-        return points
+        World-space polygon vertices, transformed on demand for the current position and angle.
 
-    def generate_vertex_angles(self):
+        :return: (n, 2) NumPy array.
         """
-        Generate stable vertex angles for the asteroid silhouette.
+        key = (self.x, self.y, self.angle)
+        if self._vertices_key != key:
+            self._vertices = self.shape_bank.vertices(self.shape_id, self.size_multiplier, self.angle)
+            self._vertices += (self.x, self.y)
+            self._vertices_key = key
+        return self._vertices
+
+    @property
+    def craters(self):
         """
-        angle_between_vertices = 360 / self.num_vertices
-        return [
-            angle_between_vertices * i + random.uniform(-angle_between_vertices / 4, angle_between_vertices / 4)
-            for i in range(self.num_vertices)
-        ]
+        World-space crater centres and sizes for the current position and angle.
 
-    def generate_vertex_radii(self):
-        """
-        Generate stable radius offsets for each vertex to avoid shape jitter.
-        """
-        return [random.uniform(0.75, 1.25) * self.radius_outer for _ in range(self.num_vertices)]
-
-    def generate_craters(self):
-        """
-        Generate craters on the asteroid's surface.
+        :return: Tuple of ((n, 2) centres array, (n,) sizes array).
         """
-        for _ in range(int(self.num_craters)):
-            # Crater size proportional to asteroid size
-            crater_size = random.randint(8, 15) * self.size_multiplier  # Larger craters
-
-            # Random position on the asteroid's circumference
-            angle = random.uniform(0, 2 * math.pi)
-            distance = random.uniform(self.radius_inner + crater_size, self.radius_outer - crater_size)
-            crater_x = self.x + distance * math.cos(angle)
-            crater_y = self.y + distance * math.sin(angle)
-
-            self.craters.append({
-                'x': crater_x,
-                'y': crater_y,
-                'size': crater_size,
-                'angle': angle,  # For potential future use (e.g., animation)
-                'distance': distance,
-            })
+        offsets, sizes = self.shape_bank.craters(self.shape_id, self.size_multiplier, self.angle)
+        return offsets + (self.x, self.y), sizes
 
     def move(self):
         """
@@ -138,40 +376,11 @@ class Asteroid:
         elif self.y > self.screen_height + self.radius_outer:
             self.y = -self.radius_outer
 
-        # Update vertices positions relative to new position
-        self.update_vertices()
-
-        # Update crater positions relative to new position
-        self.update_craters()
-
-    def update_vertices(self):
-        """
-        Update the positions of the polygon vertices based on the current rotation angle.
-        """
-        self.vertices = []
-        for angle_deg, radius in zip(self.vertex_angles, self.vertex_radii):
-            angle_rad = math.radians(angle_deg + self.angle)
-            px = self.x + radius * math.cos(angle_rad)
-            py = self.y + radius * math.sin(angle_rad)
-            self.vertices.append((px, py))
-
-    def update_craters(self):
-        """
-        Update the positions of the craters based on the asteroid's new position.
-        """
-        for crater in self.craters:
-            angle = crater['angle']
-            distance = crater['distance']
-            crater['x'] = self.x + distance * math.cos(angle + math.radians(self.angle))
-            crater['y'] = self.y + distance * math.sin(angle + math.radians(self.angle))
-
     def rotate(self):
         """
         Rotate the asteroid by updating its angle.
         """
         self.angle = (self.angle + self.rotation_speed) % 360
-        self.update_vertices()
-        self.update_craters()
 
     def update_colors(self, new_bg_color):
         """
@@ -187,36 +396,9 @@ class Asteroid:
 
         :param surface: Pygame surface to draw on.
         """
-        # Draw the main asteroid body as an irregular polygon
-        if len(self.vertices) >= 3:
-            pygame.draw.polygon(surface, self.color_outer, self.vertices)
-            pygame.draw.polygon(surface, self.color_inner, self.vertices, width=2)  # Inner outline for depth
-            overlay = pygame.Surface((self.radius_outer * 4, self.radius_outer * 4), pygame.SRCALPHA)
-            overlay_center = (overlay.get_width() // 2, overlay.get_height() // 2)
-            shadow_color = (*self.apply_tint((10, 10, 10), self.bg_color), 90)
-            shadow_offset = (int(self.radius_outer * 0.2), int(self.radius_outer * 0.2))
-            shadow_vertices = [
-                (
-                    overlay_center[0] + (vx - self.x) + shadow_offset[0],
-                    overlay_center[1] + (vy - self.y) + shadow_offset[1],
-                )
-                for vx, vy in self.vertices
-            ]
-            pygame.draw.polygon(overlay, shadow_color, shadow_vertices, width=0)
-            highlight_color = (*self.apply_tint((180, 180, 180), self.bg_color), 110)
-            pygame.draw.circle(
-                overlay,
-                highlight_color,
-                (overlay_center[0] - int(self.radius_outer * 0.2), overlay_center[1] - int(self.radius_outer * 0.2)),
-                int(self.radius_outer * 0.35),
-            )
-            surface.blit(overlay, (int(self.x - overlay_center[0]), int(self.y - overlay_center[1])))
-
-        # Draw craters
-        for crater in self.craters:
-            # Crater color is gray with background tint
-            crater_color = self.apply_tint((100, 100, 100), self.bg_color)
-            pygame.draw.circle(surface, crater_color, (int(crater['x']), int(crater['y'])), int(crater['size']))
+        x, y = int(self.x), int(self.y)
+        for layer, offset_x, offset_y in self.shape_bank.get_frame(self.shape_id, self.size_multiplier, self.bg_color, self.angle):
+            surface.blit(layer, (x + offset_x, y + offset_y))
 
     def get_rect(self):
         """
@@ -2,12 +2,97 @@
 
 import pygame
 import math
-import random
-from entities.bullet import Bullet
+import numpy as np
+from core.clock import get_ticks
+from core.rng import get_stream
+from entities.projectiles import ProjectileStore
 from utils import draw_glow_circle, lighten_color, darken_color
 
+BOSS_GLOW_RADIUS = 18
+CHARGE_FRAMES = 32  # Charge ring steps between 0 and full charge
+_boss_sprite_cache = {}
+
+
+def render_boss_body(color_outer, color_inner, radius_outer, radius_inner):
+    """Render the boss body and glow, centred in a sprite sized to the glow."""
+    offset = radius_outer + BOSS_GLOW_RADIUS
+    sprite = pygame.Surface((offset * 2, offset * 2), pygame.SRCALPHA)
+    center = (offset, offset)
+    glow_color = lighten_color(color_outer, 0.4)
+    draw_glow_circle(sprite, glow_color, center, radius_outer, glow_radius=BOSS_GLOW_RADIUS, alpha=160)
+
+    outer_ring = darken_color(color_outer, 0.2)
+    pygame.draw.circle(sprite, color_outer, center, radius_outer)
+    pygame.draw.circle(sprite, outer_ring, center, radius_outer, width=4)
+
+    mid_radius = int(radius_outer * 0.7)
+    mid_color = lighten_color(color_outer, 0.2)
+    pygame.draw.circle(sprite, mid_color, center, mid_radius)
+
+    core_color = lighten_color(color_inner, 0.4)
+    pygame.draw.circle(sprite, core_color, center, radius_inner)
+    pygame.draw.circle(sprite, color_inner, center, int(radius_inner * 0.6))
+
+    spoke_color = darken_color(color_outer, 0.4)
+    for i in range(6):
+        angle = i * (math.pi / 3)
+        end_x = offset + math.cos(angle) * radius_outer
+        end_y = offset + math.sin(angle) * radius_outer
+        pygame.draw.line(sprite, spoke_color, center, (end_x, end_y), width=3)
+    return sprite
+
+
+def get_boss_body_sprite(color_outer, color_inner, radius_outer, radius_inner):
+    key = ('body', tuple(color_outer), tuple(color_inner), radius_outer, radius_inner)
+    sprite = _boss_sprite_cache.get(key)
+    if sprite is None:
+        sprite = render_boss_body(*key[1:])
+        _boss_sprite_cache[key] = sprite
+    return sprite
+
+
+def get_boss_pulse_frame(color_outer, pulse_radius):
+    """Return the pulse ring for one radius; the pulse only ever takes a handful of radii."""
+    key = ('pulse', tuple(color_outer), pulse_radius)
+    frame = _boss_sprite_cache.get(key)
+    if frame is None:
+        pulse_color = (*lighten_color(color_outer, 0.5), 120)
+        frame = pygame.Surface((pulse_radius * 2 + 4, pulse_radius * 2 + 4), pygame.SRCALPHA)
+        pygame.draw.circle(frame, pulse_color, (pulse_radius + 2, pulse_radius + 2), pulse_radius, width=3)
+        _boss_sprite_cache[key] = frame
+    return frame
+
+
+def get_boss_charge_frame(color_inner, radius_outer, step):
+    """Return the charge ring at ``step`` out of CHARGE_FRAMES."""
+    key = ('charge', tuple(color_inner), radius_outer, step)
+    frame = _boss_sprite_cache.get(key)
+    if frame is None:
+        charge_ratio = step / CHARGE_FRAMES
+        charge_radius = int(radius_outer * (1.4 + charge_ratio))
+        frame = pygame.Surface((charge_radius * 2 + 4, charge_radius * 2 + 4), pygame.SRCALPHA)
+        charge_color = (*lighten_color(color_inner, 0.6), int(180 * charge_ratio))
+        pygame.draw.circle(frame, charge_color, (charge_radius + 2, charge_radius + 2), charge_radius, width=4)
+        _boss_sprite_cache[key] = frame
+    return frame
+
+
+def build_boss_frames(color_outer, color_inner, radius_outer=40, radius_inner=30):
+    """Pre-render the body, every pulse radius and every charge step for one palette."""
+    get_boss_body_sprite(color_outer, color_inner, radius_outer, radius_inner)
+    for pulse_radius in range(int(radius_outer * 1.12), int(radius_outer * 1.28) + 1):
+        get_boss_pulse_frame(color_outer, pulse_radius)
+    for step in range(CHARGE_FRAMES + 1):
+        get_boss_charge_frame(color_inner, radius_outer, step)
+
+
+def clear_boss_sprite_cache():
+    """Drop cached boss frames; called when the level palette changes."""
+    _boss_sprite_cache.clear()
+
+
 class Boss:
-    def __init__(self, x, y, color_outer, color_inner, screen_width, screen_height):
+    def __init__(self, x, y, color_outer, color_inner, screen_width, screen_height, projectiles=None):
         self.x = x
         self.y = y
         self.color_outer = color_outer
@@ -18,19 +103,19 @@ class Boss:
         self.direction = 1  # 1 for right, -1 for left
         self.screen_width = screen_width
         self.screen_height = screen_height
-        self.bullets = []
+        self.projectiles = projectiles if projectiles is not None else ProjectileStore(capacity=256)
         self.max_health = 30
         self.health = self.max_health
         self.shoot_delay = 1800  # Time between shots in milliseconds
-        self.last_shot_time = pygame.time.get_ticks()
+        self.last_shot_time = get_ticks()
         self.patterns = [self.direct_shot, self.shotgun_spread, self.circular_burst, self.spiral_burst]
-        self.current_pattern = random.choice(self.patterns)
+        self.current_pattern = get_stream("ai").choice(self.patterns)
         self.vx = 0
         self.vy = 0
         self.max_speed = 3.6
         self.acceleration = 0.12
-        self.wander_angle = random.uniform(0, math.tau)
-        self.last_special_time = pygame.time.get_ticks()
+        self.wander_angle = get_stream("ai").uniform(0, math.tau)
+        self.last_special_time = get_ticks()
         self.special_cooldown = 6500
         self.charge_duration = 1200
         self.charging = False
@@ -38,7 +123,7 @@ class Boss:
         self.spiral_angle = 0.0
 
     def update(self, player):
-        current_time = pygame.time.get_ticks()
+        current_time = get_ticks()
         phase = self.get_phase()
         speed_scale = 1.0 + phase * 0.25
         self.shoot_delay = max(800, 1800 - phase * 400)
@@ -59,9 +144,9 @@ class Boss:
 
         if current_time - self.last_shot_time > self.shoot_delay:
             if phase >= 2:
-                self.current_pattern = random.choice(self.patterns + [self.arc_burst])
+                self.current_pattern = get_stream("ai").choice(self.patterns + [self.arc_burst])
             else:
-                self.current_pattern = random.choice(self.patterns)
+                self.current_pattern = get_stream("ai").choice(self.patterns)
             self.current_pattern(player, phase)
             self.last_shot_time = current_time
         return special_triggered
@@ -76,7 +161,7 @@ class Boss:
         desired_vx = (dx / distance) * self.max_speed * speed_scale
         desired_vy = (dy / distance) * self.max_speed * speed_scale
 
-        self.wander_angle += random.uniform(-0.1, 0.1)
+        self.wander_angle += get_stream("ai").uniform(-0.1, 0.1)
         wander_x = math.cos(self.wander_angle) * 0.4
         wander_y = math.sin(self.wander_angle) * 0.2
 
@@ -109,16 +194,17 @@ class Boss:
             return 1
         return 2
 
+    def fire(self, angles, speed, phase):
+        """Emit one bullet per angle from the boss centre."""
+        angles = np.asarray(angles, dtype=np.float64)
+        self.projectiles.spawn_batch(self.x, self.y, np.cos(angles) * speed, np.sin(angles) * speed, 2 + phase, 'boss')
+
     def direct_shot(self, player, phase):
         # Shoot directly towards the player
         lead_x = player.x + player.direction_x * player.speed * 10
         lead_y = player.y + player.direction_y * player.speed * 10
         angle = math.atan2(lead_y - self.y, lead_x - self.x)
-        bullet_speed = 6 + phase
-        dx = math.cos(angle) * bullet_speed
-        dy = math.sin(angle) * bullet_speed
-        bullet = Bullet(self.x, self.y, dx, dy, 2 + phase, 'boss')
-        self.bullets.append(bullet)
+        self.fire([angle], 6 + phase, phase)
 
     def shotgun_spread(self, player, phase):
         # Shoot multiple bullets in a spread towards the player
@@ -127,33 +213,18 @@ class Boss:
         base_angle = math.atan2(player.y - self.y, player.x - self.x)
         start_angle = base_angle - spread_angle / 2
         angle_increment = spread_angle / (num_bullets - 1)
-        for i in range(num_bullets):
-            angle = start_angle + angle_increment * i
-            dx = math.cos(angle) * (6 + phase)
-            dy = math.sin(angle) * (6 + phase)
-            bullet = Bullet(self.x, self.y, dx, dy, 2 + phase, 'boss')
-            self.bullets.append(bullet)
+        self.fire(start_angle + angle_increment * np.arange(num_bullets), 6 + phase, phase)
 
     def circular_burst(self, player, phase):
         # Shoot bullets in a circular pattern around the boss
         num_bullets = 12 + phase * 4
         angle_increment = 2 * math.pi / num_bullets
-        for i in range(num_bullets):
-            angle = angle_increment * i
-            dx = math.cos(angle) * (4 + phase)
-            dy = math.sin(angle) * (4 + phase)
-            bullet = Bullet(self.x, self.y, dx, dy, 2 + phase, 'boss')
-            self.bullets.append(bullet)
+        self.fire(angle_increment * np.arange(num_bullets), 4 + phase, phase)
 
     def spiral_burst(self, player, phase):
         num_bullets = 10 + phase * 4
         angle_increment = math.pi / 6
-        for i in range(num_bullets):
-            angle = self.spiral_angle + angle_increment * i
-            dx = math.cos(angle) * (4.5 + phase)
-            dy = math.sin(angle) * (4.5 + phase)
-            bullet = Bullet(self.x, self.y, dx, dy, 2 + phase, 'boss')
-            self.bullets.append(bullet)
+        self.fire(self.spiral_angle + angle_increment * np.arange(num_bullets), 4.5 + phase, phase)
         self.spiral_angle += math.radians(20)
 
     def arc_burst(self, player, phase):
@@ -162,65 +233,33 @@ class Boss:
         base_angle = math.atan2(player.y - self.y, player.x - self.x)
         start_angle = base_angle - spread_angle / 2
         angle_increment = spread_angle / (num_bullets - 1)
-        for i in range(num_bullets):
-            angle = start_angle + angle_increment * i
-            dx = math.cos(angle) * (5 + phase)
-            dy = math.sin(angle) * (5 + phase)
-            bullet = Bullet(self.x, self.y, dx, dy, 2 + phase, 'boss')
-            self.bullets.append(bullet)
+        self.fire(start_angle + angle_increment * np.arange(num_bullets), 5 + phase, phase)
 
     def shockwave_burst(self, phase):
         num_bullets = 18 + phase * 6
         angle_increment = 2 * math.pi / num_bullets
-        for i in range(num_bullets):
-            angle = angle_increment * i
-            dx = math.cos(angle) * (5 + phase)
-            dy = math.sin(angle) * (5 + phase)
-            bullet = Bullet(self.x, self.y, dx, dy, 2 + phase, 'boss')
-            self.bullets.append(bullet)
+        self.fire(angle_increment * np.arange(num_bullets), 5 + phase, phase)
 
     def move(self):
         # Move bullets
         pass  # Movement is handled in the main game loop
 
     def draw(self, surface):
-        current_time = pygame.time.get_ticks()
-        center = (int(self.x), int(self.y))
-        glow_color = lighten_color(self.color_outer, 0.4)
-        draw_glow_circle(surface, glow_color, center, self.radius_outer, glow_radius=18, alpha=160)
+        current_time = get_ticks()
+        sprite = get_boss_body_sprite(self.color_outer, self.color_inner, self.radius_outer, self.radius_inner)
+        offset = self.radius_outer + BOSS_GLOW_RADIUS
+        surface.blit(sprite, (int(self.x) - offset, int(self.y) - offset))
 
+        # The rings sit outside the body, so blitting them after it keeps the original layering
         pulse_radius = int(self.radius_outer * (1.2 + 0.08 * math.sin(current_time / 200)))
-        pulse_color = (*lighten_color(self.color_outer, 0.5), 120)
-        pulse_surface = pygame.Surface((pulse_radius * 2 + 4, pulse_radius * 2 + 4), pygame.SRCALPHA)
-        pygame.draw.circle(pulse_surface, pulse_color, (pulse_radius + 2, pulse_radius + 2), pulse_radius, width=3)
-        surface.blit(pulse_surface, (self.x - pulse_radius - 2, self.y - pulse_radius - 2))
+        pulse_frame = get_boss_pulse_frame(self.color_outer, pulse_radius)
+        surface.blit(pulse_frame, (self.x - pulse_radius - 2, self.y - pulse_radius - 2))
 
         if self.charging:
             charge_ratio = min((current_time - self.charge_start_time) / self.charge_duration, 1)
-            charge_radius = int(self.radius_outer * (1.4 + charge_ratio))
-            charge_surface = pygame.Surface((charge_radius * 2 + 4, charge_radius * 2 + 4), pygame.SRCALPHA)
-            charge_color = (*lighten_color(self.color_inner, 0.6), int(180 * charge_ratio))
-            pygame.draw.circle(charge_surface, charge_color, (charge_radius + 2, charge_radius + 2), charge_radius, width=4)
-            surface.blit(charge_surface, (self.x - charge_radius - 2, self.y - charge_radius - 2))
-
-        outer_ring = darken_color(self.color_outer, 0.2)
-        pygame.draw.circle(surface, self.color_outer, center, self.radius_outer)
-        pygame.draw.circle(surface, outer_ring, center, self.radius_outer, width=4)
-
-        mid_radius = int(self.radius_outer * 0.7)
-        mid_color = lighten_color(self.color_outer, 0.2)
-        pygame.draw.circle(surface, mid_color, center, mid_radius)
-
-        core_color = lighten_color(self.color_inner, 0.4)
-        pygame.draw.circle(surface, core_color, center, self.radius_inner)
-        pygame.draw.circle(surface, self.color_inner, center, int(self.radius_inner * 0.6))
-
-        spoke_color = darken_color(self.color_outer, 0.4)
-        for i in range(6):
-            angle = i * (math.pi / 3)
-            end_x = self.x + math.cos(angle) * self.radius_outer
-            end_y = self.y + math.sin(angle) * self.radius_outer
-            pygame.draw.line(surface, spoke_color, center, (end_x, end_y), width=3)
+            charge_frame = get_boss_charge_frame(self.color_inner, self.radius_outer, round(charge_ratio * CHARGE_FRAMES))
+            charge_offset = charge_frame.get_width() // 2
+            surface.blit(charge_frame, (self.x - charge_offset, self.y - charge_offset))
 
     def draw_health_bar(self, surface):
         # Draw the health bar above the boss
@@ -1,7 +1,50 @@
 # entities/bullet.py
 
 import pygame
-from utils import draw_glow_circle, lighten_color
+from utils import blit_batch, render_glow_sprite, lighten_color
+
+BULLET_COLORS = {
+    'player': (255, 220, 80),
+    'enemy': (255, 80, 100),
+    'boss': (255, 80, 100),
+}
+BULLET_GLOW_RADIUS = 8
+
+# Pre-rendered bullet sprites keyed by (owner, radius).
+_bullet_atlas = {}
+
+def render_bullet_sprite(color, radius):
+    """Render a bullet (glow, body and hot core) centred in its own surface."""
+    glow_color = lighten_color(color, 0.3)
+    sprite = render_glow_sprite(glow_color, radius, glow_radius=BULLET_GLOW_RADIUS, alpha=160)
+    center = (radius + BULLET_GLOW_RADIUS, radius + BULLET_GLOW_RADIUS)
+    pygame.draw.circle(sprite, color, center, radius)
+    pygame.draw.circle(sprite, (255, 255, 255), center, max(1, radius // 2))
+    return sprite
+
+def get_bullet_sprite(owner, radius=5):
+    """Return the atlas sprite for an owner type, rendering it on first use."""
+    key = (owner, radius)
+    sprite = _bullet_atlas.get(key)
+    if sprite is None:
+        sprite = render_bullet_sprite(BULLET_COLORS.get(owner, BULLET_COLORS['enemy']), radius)
+        _bullet_atlas[key] = sprite
+    return sprite
+
+def build_bullet_atlas(radius=5):
+    """Pre-render every bullet look so the first frames do not pay for it."""
+    for owner in BULLET_COLORS:
+        get_bullet_sprite(owner, radius)
+
+def draw_bullets(surface, bullets):
+    """Draw many bullets with one batched blit per owner type."""
+    batches = {}
+    for bullet in bullets:
+        batches.setdefault((bullet.owner, bullet.radius), []).append(bullet)
+    for (owner, radius), group in batches.items():
+        sprite = get_bullet_sprite(owner, radius)
+        offset = radius + BULLET_GLOW_RADIUS
+        blit_batch(surface, [(sprite, (int(b.x) - offset, int(b.y) - offset)) for b in group])
 
 class Bullet:
     def __init__(self, x, y, dx, dy, damage, owner):
@@ -18,9 +61,6 @@ class Bullet:
         self.y += self.dy
 
     def draw(self, surface):
-        color = (255, 220, 80) if self.owner == 'player' else (255, 80, 100)
-        glow_color = lighten_color(color, 0.3)
-        center = (int(self.x), int(self.y))
-        draw_glow_circle(surface, glow_color, center, self.radius, glow_radius=8, alpha=160)
-        pygame.draw.circle(surface, color, center, self.radius)
-        pygame.draw.circle(surface, (255, 255, 255), center, max(1, self.radius // 2))
+        sprite = get_bullet_sprite(self.owner, self.radius)
+        offset = self.radius + BULLET_GLOW_RADIUS
+        surface.blit(sprite, (int(self.x) - offset, int(self.y) - offset))
@@ -1,13 +1,259 @@
 # entities/enemy.py
 
 import pygame
-import random
 import math
-from entities.bullet import Bullet
+import numpy as np
+from core.rng import get_numpy_stream, get_stream
+from core.spatial_hash import neighbor_pairs
+from entities.projectiles import ProjectileStore
 from utils import draw_glow_circle, lighten_color, darken_color
 
+SEPARATION_RADIUS = 80  # Neighbors closer than this push each other apart
+ENEMY_GLOW_RADIUS = 10
+_enemy_sprite_cache = {}
+
+# Per-enemy state held in EnemySwarm arrays, with the scalar type each field reads back as
+SWARM_FIELDS = {
+    'x': float,
+    'y': float,
+    'vx': float,
+    'vy': float,
+    'wander_angle': float,
+    'max_speed': float,
+    'acceleration': float,
+    'radius_outer': int,
+    'shoot_timer': int,
+}
+
+
+class EnemySwarm:
+    """
+    Struct-of-arrays state for a group of enemies.
+
+    Each Enemy is a view onto one slot of the swarm's arrays, so its
+    attributes read and write the arrays while update()/move() run the whole
+    swarm's steering and movement as NumPy passes. The swarm also behaves like the
+    plain list of enemies it replaces (append, remove, clear, iteration).
+    """
+
+    def __init__(self, screen_width, screen_height, capacity=32):
+        self.screen_width = screen_width
+        self.screen_height = screen_height
+        self.capacity = capacity
+        self.enemies = []
+        self.rng = get_numpy_stream("ai")
+        for name, kind in SWARM_FIELDS.items():
+            setattr(self, name, np.zeros(capacity, dtype=np.int64 if kind is int else np.float64))
+
+    def __len__(self):
+        return len(self.enemies)
+
+    def __iter__(self):
+        return iter(self.enemies)
+
+    def __getitem__(self, index):
+        return self.enemies[index]
+
+    def _reserve(self, required):
+        if required <= self.capacity:
+            return
+        capacity = self.capacity
+        while capacity < required:
+            capacity *= 2
+        count = len(self.enemies)
+        for name in SWARM_FIELDS:
+            old = getattr(self, name)
+            new = np.zeros(capacity, dtype=old.dtype)
+            new[:count] = old[:count]
+            setattr(self, name, new)
+        self.capacity = capacity
+
+    def append(self, enemy):
+        """Adopt an enemy, moving its state out of whichever swarm held it."""
+        previous = enemy._swarm
+        if previous is self:
+            return
+        slot = len(self.enemies)
+        self._reserve(slot + 1)
+        if previous is not None:
+            previous.remove(enemy)
+        for name in SWARM_FIELDS:
+            getattr(self, name)[slot] = enemy._detached[name]
+        self.enemies.append(enemy)
+        enemy._swarm = self
+        enemy._slot = slot
+
+    def remove(self, enemy):
+        """Drop an enemy, filling its slot with the last one."""
+        slot = enemy._slot
+        last = len(self.enemies) - 1
+        if self.enemies[slot] is not enemy:
+            raise ValueError("enemy is not in this swarm")
+        self._detach(enemy)
+        if slot != last:
+            moved = self.enemies[last]
+            for name in SWARM_FIELDS:
+                column = getattr(self, name)
+                column[slot] = column[last]
+            self.enemies[slot] = moved
+            moved._slot = slot
+        self.enemies.pop()
+
+    def clear(self):
+        for enemy in self.enemies:
+            self._detach(enemy)
+        self.enemies.clear()
+
+    def _detach(self, enemy):
+        # Copy the slot back onto the enemy so it keeps reading its last state
+        enemy._detached = {name: kind(getattr(self, name)[enemy._slot]) for name, kind in SWARM_FIELDS.items()}
+        enemy._swarm = None
+        enemy._slot = None
+
+    def update(self, player_x, player_y):
+        """Tick shoot timers and steer every enemy."""
+        n = len(self.enemies)
+        if n == 0:
+            return
+        timers = self.shoot_timer[:n]
+        timers -= 1
+        for slot in np.flatnonzero(timers <= 0).tolist():
+            self.enemies[slot].shoot(player_x, player_y)
+            timers[slot] = get_stream("ai").randint(60, 120)
+        self.steer(player_x, player_y)
+
+    def steer(self, player_x, player_y):
+        """Steer every enemy towards its range from the player and away from each other."""
+        n = len(self.enemies)
+        if n == 0:
+            return
+        x = self.x[:n]
+        y = self.y[:n]
+        vx = self.vx[:n]
+        vy = self.vy[:n]
+        max_speed = self.max_speed[:n]
+        radius = self.radius_outer[:n]
+
+        dx = player_x - x
+        dy = (player_y - 120) - y
+        distance = np.hypot(dx, dy)
+        distance[distance == 0] = 1.0
+        # Close in from beyond the desired range, back off inside it
+        seek = np.where(distance > 240, 1.0, -1.0) * max_speed / distance
+        desired_vx = dx * seek
+        desired_vy = dy * seek
+
+        rows, cols = neighbor_pairs(x, y, SEPARATION_RADIUS)
+        offset_x = x[rows] - x[cols]
+        offset_y = y[rows] - y[cols]
+        offset_dist = np.hypot(offset_x, offset_y)
+        weight = (SEPARATION_RADIUS - offset_dist) / SEPARATION_RADIUS / offset_dist
+        separation_x = np.bincount(rows, weights=offset_x * weight, minlength=n)
+        separation_y = np.bincount(rows, weights=offset_y * weight, minlength=n)
+
+        edge_push_x = np.where(x < radius * 2, 1.0, np.where(x > self.screen_width - radius * 2, -1.0, 0.0))
+        band_push_y = np.where(y < 50, 1.0, np.where(y > self.screen_height * 0.45, -1.0, 0.0))
+
+        wander_angle = self.wander_angle[:n]
+        wander_angle += self.rng.uniform(-0.15, 0.15, n)
+        wander_x = np.cos(wander_angle) * 0.5
+        wander_y = np.sin(wander_angle) * 0.5
+
+        steer_x = desired_vx + separation_x * 2.2 + edge_push_x * 1.5 + wander_x
+        steer_y = desired_vy + separation_y * 2.2 + band_push_y * 1.5 + wander_y
+
+        acceleration = self.acceleration[:n]
+        vx += (steer_x - vx) * acceleration
+        vy += (steer_y - vy) * acceleration
+
+        speed = np.hypot(vx, vy)
+        too_fast = speed > max_speed
+        scale = np.where(too_fast, max_speed / np.where(too_fast, speed, 1.0), 1.0)
+        vx *= scale
+        vy *= scale
+
+    def move(self):
+        """Move every enemy by its velocity, clamped to the screen."""
+        n = len(self.enemies)
+        radius = self.radius_outer[:n]
+        x = self.x[:n]
+        y = self.y[:n]
+        x += self.vx[:n]
+        y += self.vy[:n]
+        np.clip(x, radius, self.screen_width - radius, out=x)
+        np.clip(y, radius, self.screen_height - radius, out=y)
+
+
+def render_enemy_sprite(color_outer, color_inner, radius_outer=20, radius_inner=10):
+    """Render an enemy with its glow, centred in a sprite sized to the glow."""
+    offset = radius_outer + ENEMY_GLOW_RADIUS
+    sprite = pygame.Surface((offset * 2, offset * 2), pygame.SRCALPHA)
+    center = (offset, offset)
+    glow_color = lighten_color(color_outer, 0.4)
+    draw_glow_circle(sprite, glow_color, center, radius_outer, glow_radius=ENEMY_GLOW_RADIUS, alpha=120)
+
+    ring_color = darken_color(color_outer, 0.2)
+    pygame.draw.circle(sprite, color_outer, center, radius_outer)
+    pygame.draw.circle(sprite, ring_color, center, radius_outer, width=3)
+
+    inner_color = lighten_color(color_inner, 0.3)
+    pygame.draw.circle(sprite, inner_color, center, radius_inner)
+    pygame.draw.circle(sprite, color_inner, center, int(radius_inner * 0.6))
+
+    eye_offset = radius_inner * 0.6
+    eye_color = (255, 120, 120)
+    pygame.draw.circle(sprite, eye_color, (int(offset - eye_offset), int(offset - eye_offset * 0.2)), 3)
+    pygame.draw.circle(sprite, eye_color, (int(offset + eye_offset), int(offset - eye_offset * 0.2)), 3)
+    return sprite
+
+
+def get_enemy_sprite(color_outer, color_inner, radius_outer=20, radius_inner=10):
+    key = (tuple(color_outer), tuple(color_inner), radius_outer, radius_inner)
+    sprite = _enemy_sprite_cache.get(key)
+    if sprite is None:
+        sprite = render_enemy_sprite(*key)
+        _enemy_sprite_cache[key] = sprite
+    return sprite
+
+
+def clear_enemy_sprite_cache():
+    """Drop cached enemy sprites; called when the level palette changes."""
+    _enemy_sprite_cache.clear()
+
+
+def _swarm_field(name):
+    kind = SWARM_FIELDS[name]
+
+    def getter(self):
+        if self._swarm is None:
+            return self._detached[name]
+        return kind(getattr(self._swarm, name)[self._slot])
+
+    def setter(self, value):
+        if self._swarm is None:
+            self._detached[name] = kind(value)
+        else:
+            getattr(self._swarm, name)[self._slot] = value
+
+    return property(getter, setter)
+
+
 class Enemy:
-    def __init__(self, x, y, color_outer, color_inner, screen_width, screen_height):
+    x = _swarm_field('x')
+    y = _swarm_field('y')
+    vx = _swarm_field('vx')
+    vy = _swarm_field('vy')
+    wander_angle = _swarm_field('wander_angle')
+    max_speed = _swarm_field('max_speed')
+    acceleration = _swarm_field('acceleration')
+    radius_outer = _swarm_field('radius_outer')
+    shoot_timer = _swarm_field('shoot_timer')
+
+    def __init__(self, x, y, color_outer, color_inner, screen_width, screen_height, projectiles=None):
+        # Until it joins a swarm, an enemy keeps its swarm fields in a plain dict
+        self._swarm = None
+        self._slot = None
+        self._detached = {}
         self.x = x
         self.y = y
         self.radius_outer = 20
@@ -16,111 +262,25 @@ class Enemy:
         self.color_inner = color_inner
         self.speed = 2  # Horizontal speed baseline
         self.vertical_speed = 20  # Distance to move down when changing direction
-        self.direction = random.choice([-1, 1])  # 1 for right, -1 for left
-        self.bullets = []
+        self.direction = get_stream("ai").choice([-1, 1])  # 1 for right, -1 for left
+        self.projectiles = projectiles if projectiles is not None else ProjectileStore(capacity=64)
         self.screen_width = screen_width
         self.screen_height = screen_height
-        self.shoot_timer = random.randint(60, 120)  # Random shoot interval
+        self.shoot_timer = get_stream("ai").randint(60, 120)  # Random shoot interval
         self.vx = self.speed * self.direction
         self.vy = 0
         self.max_speed = 3.2
         self.acceleration = 0.15
-        self.wander_angle = random.uniform(0, math.tau)
-
-    def move(self):
-        self.x += self.vx
-        self.y += self.vy
-        self.x = max(self.radius_outer, min(self.x, self.screen_width - self.radius_outer))
-        self.y = max(self.radius_outer, min(self.y, self.screen_height - self.radius_outer))
-
-    def update(self, player_x, player_y, neighbors):
-        # Handle shooting
-        self.shoot_timer -= 1
-        if self.shoot_timer <= 0:
-            self.shoot(player_x, player_y)
-            self.shoot_timer = random.randint(60, 120)
-        self.apply_steering(player_x, player_y, neighbors)
-
-    def apply_steering(self, player_x, player_y, neighbors):
-        target_x = player_x
-        target_y = player_y - 120
-        dx = target_x - self.x
-        dy = target_y - self.y
-        distance = math.hypot(dx, dy) or 1.0
-
-        desired_range = 240
-        if distance > desired_range:
-            desired_vx = (dx / distance) * self.max_speed
-            desired_vy = (dy / distance) * self.max_speed
-        else:
-            desired_vx = (-dx / distance) * self.max_speed
-            desired_vy = (-dy / distance) * self.max_speed
-
-        separation_x = 0.0
-        separation_y = 0.0
-        for neighbor in neighbors:
-            if neighbor is self:
-                continue
-            offset_x = self.x - neighbor.x
-            offset_y = self.y - neighbor.y
-            offset_dist = math.hypot(offset_x, offset_y)
-            if 0 < offset_dist < 80:
-                strength = (80 - offset_dist) / 80
-                separation_x += (offset_x / offset_dist) * strength
-                separation_y += (offset_y / offset_dist) * strength
-
-        edge_push_x = 0.0
-        if self.x < self.radius_outer * 2:
-            edge_push_x = 1.0
-        elif self.x > self.screen_width - self.radius_outer * 2:
-            edge_push_x = -1.0
-
-        band_push_y = 0.0
-        band_min = 50
-        band_max = self.screen_height * 0.45
-        if self.y < band_min:
-            band_push_y = 1.0
-        elif self.y > band_max:
-            band_push_y = -1.0
-
-        self.wander_angle += random.uniform(-0.15, 0.15)
-        wander_x = math.cos(self.wander_angle) * 0.5
-        wander_y = math.sin(self.wander_angle) * 0.5
-
-        steer_x = desired_vx + separation_x * 2.2 + edge_push_x * 1.5 + wander_x
-        steer_y = desired_vy + separation_y * 2.2 + band_push_y * 1.5 + wander_y
-
-        self.vx += (steer_x - self.vx) * self.acceleration
-        self.vy += (steer_y - self.vy) * self.acceleration
-
-        speed = math.hypot(self.vx, self.vy)
-        if speed > self.max_speed:
-            scale = self.max_speed / speed
-            self.vx *= scale
-            self.vy *= scale
+        self.wander_angle = get_stream("ai").uniform(0, math.tau)
 
     def shoot(self, target_x, target_y):
         # Shoot towards the player
         angle = math.atan2(target_y - self.y, target_x - self.x)
         dx = math.cos(angle) * 5
         dy = math.sin(angle) * 5
-        bullet = Bullet(self.x, self.y, dx, dy, 1, 'enemy')
-        self.bullets.append(bullet)
+        self.projectiles.spawn(self.x, self.y, dx, dy, 1, 'enemy')
 
     def draw(self, surface):
-        center = (int(self.x), int(self.y))
-        glow_color = lighten_color(self.color_outer, 0.4)
-        draw_glow_circle(surface, glow_color, center, self.radius_outer, glow_radius=10, alpha=120)
-
-        ring_color = darken_color(self.color_outer, 0.2)
-        pygame.draw.circle(surface, self.color_outer, center, self.radius_outer)
-        pygame.draw.circle(surface, ring_color, center, self.radius_outer, width=3)
-
-        inner_color = lighten_color(self.color_inner, 0.3)
-        pygame.draw.circle(surface, inner_color, center, self.radius_inner)
-        pygame.draw.circle(surface, self.color_inner, center, int(self.radius_inner * 0.6))
-
-        eye_offset = self.radius_inner * 0.6
-        eye_color = (255, 120, 120)
-        pygame.draw.circle(surface, eye_color, (int(self.x - eye_offset), int(self.y - eye_offset * 0.2)), 3)
-        pygame.draw.circle(surface, eye_color, (int(self.x + eye_offset), int(self.y - eye_offset * 0.2)), 3)
+        sprite = get_enemy_sprite(self.color_outer, self.color_inner, self.radius_outer, self.radius_inner)
+        offset = self.radius_outer + ENEMY_GLOW_RADIUS
+        surface.blit(sprite, (int(self.x) - offset, int(self.y) - offset))
@@ -2,15 +2,17 @@
 
 import pygame
 import colorsys
-import random
+from core.rng import get_stream
 from utils import draw_glow_circle, lighten_color
 
+HUE_STEPS = 64  # Drawn hues are snapped to this many steps so glow sprites stay cached
+
 class HealthItem:
     def __init__(self, x, y, speed):
         self.x = x
         self.y = y
         self.speed = speed
-        self.hue = random.uniform(0, 1)
+        self.hue = get_stream("cosmetic").uniform(0, 1)
         self.radius = 15
 
     def move(self):
@@ -25,7 +27,8 @@ class HealthItem:
 
     def draw(self, surface):
         """Draw the health item with RGB cycling."""
-        rgb_fractional = colorsys.hsv_to_rgb(self.hue, 1, 1)
+        hue = round(self.hue * HUE_STEPS) % HUE_STEPS / HUE_STEPS
+        rgb_fractional = colorsys.hsv_to_rgb(hue, 1, 1)
         rgb = tuple(int(c * 255) for c in rgb_fractional)
         center = (int(self.x), int(self.y))
         draw_glow_circle(surface, lighten_color(rgb, 0.3), center, self.radius, glow_radius=10, alpha=140)
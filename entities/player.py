@@ -2,11 +2,157 @@
 
 import pygame
 import math
-from entities.bullet import Bullet
+from collections import OrderedDict
+import numpy as np
+from core.clock import get_ticks
+from entities.projectiles import ProjectileStore
 from utils import draw_glow_circle, lighten_color, darken_color
 
+SHIP_SPRITE_SIZE = 120  # Fits the glow, the widest wings and the longest thruster
+SHIP_SPRITE_CACHE_SIZE = 32
+_ship_sprite_cache = OrderedDict()
+
+
+def render_ship(surface, x, y, radius, hull_type, nozzle_type, color, wing_level, weapon_level):
+    """Draw a ship with the given loadout centred on (x, y)."""
+    base_color = color
+    glow_color = lighten_color(base_color, 0.3)
+    draw_glow_circle(surface, glow_color, (int(x), int(y)), radius, glow_radius=16, alpha=140)
+
+    ship_length = radius * 1.6
+    ship_width = radius * 1.2
+    if hull_type == "diamond":
+        nose = (x, y - ship_length * 0.9)
+        right = (x + ship_width * 0.9, y)
+        tail = (x, y + radius * 1.2)
+        left = (x - ship_width * 0.9, y)
+        body_points = [nose, right, tail, left]
+        left_wing = left
+        right_wing = right
+    elif hull_type == "delta":
+        nose = (x, y - ship_length)
+        left_wing = (x - ship_width * 1.2, y + radius * 0.8)
+        right_wing = (x + ship_width * 1.2, y + radius * 0.8)
+        body_points = [nose, right_wing, left_wing]
+    else:
+        nose = (x, y - ship_length)
+        left_wing = (x - ship_width, y + radius * 0.5)
+        right_wing = (x + ship_width, y + radius * 0.5)
+        tail = (x, y + radius * 1.1)
+        body_points = [nose, right_wing, tail, left_wing]
+    pygame.draw.polygon(surface, base_color, body_points)
+
+    if wing_level >= 2:
+        wing_extension = radius * (0.8 + 0.2 * wing_level)
+        wing_tip_left = (x - ship_width - wing_extension, y + radius * 0.2)
+        wing_tip_right = (x + ship_width + wing_extension, y + radius * 0.2)
+        pygame.draw.polygon(
+            surface,
+            darken_color(base_color, 0.1),
+            [left_wing, (x - ship_width * 0.4, y + radius * 0.9), wing_tip_left],
+        )
+        pygame.draw.polygon(
+            surface,
+            darken_color(base_color, 0.1),
+            [right_wing, (x + ship_width * 0.4, y + radius * 0.9), wing_tip_right],
+        )
+
+    if weapon_level >= 2:
+        pod_color = darken_color(base_color, 0.3)
+        pygame.draw.rect(
+            surface,
+            pod_color,
+            pygame.Rect(x - ship_width * 0.7, y - radius * 0.2, 8, 18),
+            border_radius=3,
+        )
+        pygame.draw.rect(
+            surface,
+            pod_color,
+            pygame.Rect(x + ship_width * 0.6, y - radius * 0.2, 8, 18),
+            border_radius=3,
+        )
+
+    canopy_color = lighten_color(base_color, 0.6)
+    pygame.draw.polygon(
+        surface,
+        canopy_color,
+        [
+            (x, y - ship_length * 0.6),
+            (x + ship_width * 0.35, y),
+            (x, y + radius * 0.2),
+            (x - ship_width * 0.35, y),
+        ],
+    )
+
+    outline_color = darken_color(base_color, 0.4)
+    pygame.draw.polygon(surface, outline_color, body_points, width=2)
+
+    thruster_color = (80, 200, 255)
+    if nozzle_type == "vector":
+        pygame.draw.polygon(
+            surface,
+            thruster_color,
+            [
+                (x - ship_width * 0.45, y + radius * 0.8),
+                (x + ship_width * 0.45, y + radius * 0.8),
+                (x, y + radius * 1.6),
+            ],
+        )
+    elif nozzle_type == "dual":
+        pygame.draw.rect(
+            surface,
+            thruster_color,
+            pygame.Rect(x - ship_width * 0.5, y + radius * 0.9, 8, 18),
+            border_radius=3,
+        )
+        pygame.draw.rect(
+            surface,
+            thruster_color,
+            pygame.Rect(x + ship_width * 0.3, y + radius * 0.9, 8, 18),
+            border_radius=3,
+        )
+    else:
+        pygame.draw.polygon(
+            surface,
+            thruster_color,
+            [
+                (x - ship_width * 0.35, y + radius * 0.9),
+                (x + ship_width * 0.35, y + radius * 0.9),
+                (x, y + radius * 1.5),
+            ],
+        )
+
+
+def get_ship_sprite(hull_type, nozzle_type, color, wing_level, weapon_level, radius=20):
+    """Return the pre-rendered ship for a loadout, rendering it on first use."""
+    key = (hull_type, nozzle_type, tuple(color), wing_level, weapon_level, radius)
+    sprite = _ship_sprite_cache.get(key)
+    if sprite is not None:
+        _ship_sprite_cache.move_to_end(key)
+        return sprite
+    sprite = pygame.Surface((SHIP_SPRITE_SIZE, SHIP_SPRITE_SIZE), pygame.SRCALPHA)
+    center = SHIP_SPRITE_SIZE // 2
+    render_ship(sprite, center, center, radius, hull_type, nozzle_type, tuple(color), wing_level, weapon_level)
+    _ship_sprite_cache[key] = sprite
+    if len(_ship_sprite_cache) > SHIP_SPRITE_CACHE_SIZE:
+        _ship_sprite_cache.popitem(last=False)
+    return sprite
+
+
+def draw_ship(surface, x, y, hull_type, nozzle_type, color, wing_level, weapon_level, radius=20):
+    """Blit the cached sprite for a loadout centred on (x, y)."""
+    sprite = get_ship_sprite(hull_type, nozzle_type, color, wing_level, weapon_level, radius)
+    offset = SHIP_SPRITE_SIZE // 2
+    surface.blit(sprite, (int(x) - offset, int(y) - offset))
+
+
+def clear_ship_sprite_cache():
+    """Drop every cached ship, e.g. after a purchase or a color change."""
+    _ship_sprite_cache.clear()
+
+
 class Player:
-    def __init__(self, x, y, color, screen_width, screen_height):
+    def __init__(self, x, y, color, screen_width, screen_height, projectiles=None):
         self.x = x
         self.y = y
         self.color = color
@@ -16,7 +162,7 @@ class Player:
         self.direction_y = 0  # -1 for up, 1 for down, 0 for no movement
         self.screen_width = screen_width
         self.screen_height = screen_height
-        self.bullets = []
+        self.projectiles = projectiles if projectiles is not None else ProjectileStore(capacity=64)
         self.health = 10
         self.max_health = 10
         self.credits = 0
@@ -48,7 +194,7 @@ class Player:
         self.y = max(min_y, min(self.y, max_y))
 
     def shoot(self):
-        current_time = pygame.time.get_ticks()
+        current_time = get_ticks()
         # Determine shoot delay based on power-up
         if self.power_up_active == 'rapid_fire':
             shoot_delay = 100  # Faster shooting
@@ -70,33 +216,31 @@ class Player:
             num_bullets = 5
             spread_angle = math.radians(45)  # 45 degrees spread
             start_angle = -spread_angle / 2
-            angle_increment = spread_angle / (num_bullets - 1)
-            for i in range(num_bullets):
-                angle = start_angle + angle_increment * i
-                dx = math.sin(angle) * 10
-                dy = -math.cos(angle) * 10
-                bullet = Bullet(self.x, self.y - self.radius, dx, dy, self.weapon_level, 'player')
-                self.bullets.append(bullet)
+            angles = start_angle + np.arange(num_bullets) * (spread_angle / (num_bullets - 1))
+            self.projectiles.spawn_batch(
+                self.x, self.y - self.radius, np.sin(angles) * 10, -np.cos(angles) * 10, self.weapon_level, 'player'
+            )
         else:
             # Normal or rapid shooting
             bullet_patterns = {
                 "basic": [(0, -10)],
                 "spread": [(-4, -10), (0, -10), (4, -10)],
             }
-            for dx, dy in bullet_patterns.get(self.weapon_mode, [(0, -10)]):
-                bullet = Bullet(self.x, self.y - self.radius, dx, dy, self.weapon_level, 'player')
-                self.bullets.append(bullet)
+            pattern = bullet_patterns.get(self.weapon_mode, [(0, -10)])
+            xs = [self.x] * len(pattern)
+            velocities = list(pattern)
             if self.weapon_level >= 2:
                 spread = 3 + self.weapon_level
-                left = Bullet(self.x - 6, self.y - self.radius, -spread, -10, self.weapon_level, 'player')
-                right = Bullet(self.x + 6, self.y - self.radius, spread, -10, self.weapon_level, 'player')
-                self.bullets.extend([left, right])
+                xs.extend([self.x - 6, self.x + 6])
+                velocities.extend([(-spread, -10), (spread, -10)])
+            dxs, dys = zip(*velocities)
+            self.projectiles.spawn_batch(xs, self.y - self.radius, dxs, dys, self.weapon_level, 'player')
 
         return True  # Indicate that a shot was fired
 
     def activate_power_up(self, power_type):
         self.power_up_active = power_type
-        self.power_up_end_time = pygame.time.get_ticks() + 30000  # 30 seconds duration
+        self.power_up_end_time = get_ticks() + 30000  # 30 seconds duration
 
         if power_type == 'rapid_fire':
             # Reduce shoot delay for rapid fire
@@ -111,123 +255,21 @@ class Player:
         self.shoot_delay = 300  # Reset to normal shooting delay
 
     def update_power_up(self):
-        if self.power_up_active and pygame.time.get_ticks() > self.power_up_end_time:
+        if self.power_up_active and get_ticks() > self.power_up_end_time:
             self.deactivate_power_up()
 
     def draw(self, surface):
-        base_color = self.color
-        glow_color = lighten_color(base_color, 0.3)
-        draw_glow_circle(surface, glow_color, (int(self.x), int(self.y)), self.radius, glow_radius=16, alpha=140)
-
-        ship_length = self.radius * 1.6
-        ship_width = self.radius * 1.2
-        if self.hull_type == "diamond":
-            nose = (self.x, self.y - ship_length * 0.9)
-            right = (self.x + ship_width * 0.9, self.y)
-            tail = (self.x, self.y + self.radius * 1.2)
-            left = (self.x - ship_width * 0.9, self.y)
-            body_points = [nose, right, tail, left]
-            left_wing = left
-            right_wing = right
-        elif self.hull_type == "delta":
-            nose = (self.x, self.y - ship_length)
-            left_wing = (self.x - ship_width * 1.2, self.y + self.radius * 0.8)
-            right_wing = (self.x + ship_width * 1.2, self.y + self.radius * 0.8)
-            body_points = [nose, right_wing, left_wing]
-        else:
-            nose = (self.x, self.y - ship_length)
-            left_wing = (self.x - ship_width, self.y + self.radius * 0.5)
-            right_wing = (self.x + ship_width, self.y + self.radius * 0.5)
-            tail = (self.x, self.y + self.radius * 1.1)
-            body_points = [nose, right_wing, tail, left_wing]
-        pygame.draw.polygon(surface, base_color, body_points)
-
-        if self.wing_level >= 2:
-            wing_extension = self.radius * (0.8 + 0.2 * self.wing_level)
-            wing_tip_left = (self.x - ship_width - wing_extension, self.y + self.radius * 0.2)
-            wing_tip_right = (self.x + ship_width + wing_extension, self.y + self.radius * 0.2)
-            pygame.draw.polygon(
-                surface,
-                darken_color(base_color, 0.1),
-                [left_wing, (self.x - ship_width * 0.4, self.y + self.radius * 0.9), wing_tip_left],
-            )
-            pygame.draw.polygon(
-                surface,
-                darken_color(base_color, 0.1),
-                [right_wing, (self.x + ship_width * 0.4, self.y + self.radius * 0.9), wing_tip_right],
-            )
-
-        if self.weapon_level >= 2:
-            pod_color = darken_color(base_color, 0.3)
-            pygame.draw.rect(
-                surface,
-                pod_color,
-                pygame.Rect(self.x - ship_width * 0.7, self.y - self.radius * 0.2, 8, 18),
-                border_radius=3,
-            )
-            pygame.draw.rect(
-                surface,
-                pod_color,
-                pygame.Rect(self.x + ship_width * 0.6, self.y - self.radius * 0.2, 8, 18),
-                border_radius=3,
-            )
-
-        canopy_color = lighten_color(base_color, 0.6)
-        pygame.draw.polygon(
-            surface,
-            canopy_color,
-            [
-                (self.x, self.y - ship_length * 0.6),
-                (self.x + ship_width * 0.35, self.y),
-                (self.x, self.y + self.radius * 0.2),
-                (self.x - ship_width * 0.35, self.y),
-            ],
+        draw_ship(
+            surface, self.x, self.y, self.hull_type, self.nozzle_type, self.color,
+            self.wing_level, self.weapon_level, self.radius,
         )
 
-        outline_color = darken_color(base_color, 0.4)
-        pygame.draw.polygon(surface, outline_color, body_points, width=2)
-
-        thruster_color = (80, 200, 255)
-        if self.nozzle_type == "vector":
-            pygame.draw.polygon(
-                surface,
-                thruster_color,
-                [
-                    (self.x - ship_width * 0.45, self.y + self.radius * 0.8),
-                    (self.x + ship_width * 0.45, self.y + self.radius * 0.8),
-                    (self.x, self.y + self.radius * 1.6),
-                ],
-            )
-        elif self.nozzle_type == "dual":
-            pygame.draw.rect(
-                surface,
-                thruster_color,
-                pygame.Rect(self.x - ship_width * 0.5, self.y + self.radius * 0.9, 8, 18),
-                border_radius=3,
-            )
-            pygame.draw.rect(
-                surface,
-                thruster_color,
-                pygame.Rect(self.x + ship_width * 0.3, self.y + self.radius * 0.9, 8, 18),
-                border_radius=3,
-            )
-        else:
-            pygame.draw.polygon(
-                surface,
-                thruster_color,
-                [
-                    (self.x - ship_width * 0.35, self.y + self.radius * 0.9),
-                    (self.x + ship_width * 0.35, self.y + self.radius * 0.9),
-                    (self.x, self.y + self.radius * 1.5),
-                ],
-            )
-
     def reset(self):
         self.x = self.screen_width // 2
         self.y = self.screen_height - 100
         self.direction_x = 0
         self.direction_y = 0
-        self.bullets.clear()
+        self.projectiles.clear('player')
         self.health = self.max_health
         self.power_up_active = None
         self.power_up_end_time = 0
@@ -263,13 +305,3 @@ class Player:
     def set_weapon_mode(self, mode):
         if mode in {"basic", "spread"}:
             self.weapon_mode = mode
-
-    def clone_for_preview(self, x, y):
-        preview = Player(x, y, self.color, self.screen_width, self.screen_height)
-        preview.wing_level = self.wing_level
-        preview.weapon_level = self.weapon_level
-        preview.weapon_mode = self.weapon_mode
-        preview.hull_type = self.hull_type
-        preview.nozzle_type = self.nozzle_type
-        preview.custom_color = self.custom_color
-        return preview
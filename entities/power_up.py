@@ -4,6 +4,7 @@ import pygame
 import random
 import math
 from utils import draw_glow_circle, lighten_color, darken_color
+from ui.fonts import get_font
 
 class PowerUp:
     def __init__(self, x, y, speed, type):
@@ -32,7 +33,7 @@ class PowerUp:
         pygame.draw.polygon(surface, darken_color(self.color, 0.2), points, width=2)
 
         # Draw icon representing the power-up type
-        font = pygame.font.Font(None, 24)
+        font = get_font(24)
         if self.type == 'rapid_fire':
             text = font.render('R', True, (15, 15, 15))
         elif self.type == 'shotgun':
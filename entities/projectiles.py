@@ -0,0 +1,214 @@
+# entities/projectiles.py
+
+import numpy as np
+from entities.bullet import BULLET_GLOW_RADIUS, get_bullet_sprite
+from utils import blit_batch
+
+OWNERS = ('player', 'enemy', 'boss')
+OWNER_IDS = {owner: index for index, owner in enumerate(OWNERS)}
+
+class ProjectileStore:
+    """
+    Struct-of-arrays storage for every live bullet.
+
+    Bullets are packed into the first ``count`` slots of preallocated NumPy
+    arrays so movement, culling and hit tests run as single vectorized
+    operations instead of per-object Python loops.
+    """
+
+    def __init__(self, capacity=1024):
+        self.capacity = capacity
+        self.count = 0
+        self.x = np.zeros(capacity, dtype=np.float64)
+        self.y = np.zeros(capacity, dtype=np.float64)
+        self.previous_x = np.zeros(capacity, dtype=np.float64)
+        self.previous_y = np.zeros(capacity, dtype=np.float64)
+        self.dx = np.zeros(capacity, dtype=np.float64)
+        self.dy = np.zeros(capacity, dtype=np.float64)
+        self.damage = np.zeros(capacity, dtype=np.int32)
+        self.radius = np.zeros(capacity, dtype=np.int32)
+        self.owner = np.zeros(capacity, dtype=np.int8)
+
+    def __len__(self):
+        return self.count
+
+    def _columns(self):
+        return (self.x, self.y, self.previous_x, self.previous_y, self.dx, self.dy, self.damage, self.radius, self.owner)
+
+    def _reserve(self, extra):
+        """Grow the arrays (doubling) so ``extra`` more bullets fit."""
+        required = self.count + extra
+        if required <= self.capacity:
+            return
+        capacity = self.capacity
+        while capacity < required:
+            capacity *= 2
+        for name in ('x', 'y', 'previous_x', 'previous_y', 'dx', 'dy', 'damage', 'radius', 'owner'):
+            old = getattr(self, name)
+            new = np.zeros(capacity, dtype=old.dtype)
+            new[:self.count] = old[:self.count]
+            setattr(self, name, new)
+        self.capacity = capacity
+
+    def spawn(self, x, y, dx, dy, damage, owner, radius=5):
+        """Add a single bullet."""
+        self._reserve(1)
+        i = self.count
+        self.x[i] = x
+        self.y[i] = y
+        self.previous_x[i] = x
+        self.previous_y[i] = y
+        self.dx[i] = dx
+        self.dy[i] = dy
+        self.damage[i] = damage
+        self.radius[i] = radius
+        self.owner[i] = OWNER_IDS[owner]
+        self.count += 1
+
+    def spawn_batch(self, x, y, dx, dy, damage, owner, radius=5):
+        """
+        Add many bullets at once.
+
+        Any argument may be a scalar or an array; they are broadcast against
+        each other, so a burst from one origin only needs velocity arrays.
+        """
+        x, y, dx, dy, damage, radius = np.broadcast_arrays(
+            np.asarray(x, dtype=np.float64),
+            np.asarray(y, dtype=np.float64),
+            np.asarray(dx, dtype=np.float64),
+            np.asarray(dy, dtype=np.float64),
+            np.asarray(damage),
+            np.asarray(radius),
+        )
+        n = x.size
+        if n == 0:
+            return
+        self._reserve(n)
+        start, end = self.count, self.count + n
+        self.x[start:end] = x.ravel()
+        self.y[start:end] = y.ravel()
+        self.previous_x[start:end] = self.x[start:end]
+        self.previous_y[start:end] = self.y[start:end]
+        self.dx[start:end] = dx.ravel()
+        self.dy[start:end] = dy.ravel()
+        self.damage[start:end] = damage.ravel()
+        self.radius[start:end] = radius.ravel()
+        self.owner[start:end] = OWNER_IDS[owner]
+        self.count = end
+
+    def move(self):
+        """Advance every bullet by its velocity, remembering where it was for interpolation."""
+        n = self.count
+        self.previous_x[:n] = self.x[:n]
+        self.previous_y[:n] = self.y[:n]
+        self.x[:n] += self.dx[:n]
+        self.y[:n] += self.dy[:n]
+
+    def owner_mask(self, owners):
+        """Return a mask of bullets belonging to one owner or an iterable of owners."""
+        n = self.count
+        if isinstance(owners, str):
+            return self.owner[:n] == OWNER_IDS[owners]
+        return np.isin(self.owner[:n], [OWNER_IDS[owner] for owner in owners])
+
+    def offscreen_mask(self, screen_width, screen_height):
+        """Return a mask of bullets that have fully left the screen."""
+        n = self.count
+        x = self.x[:n]
+        y = self.y[:n]
+        r = self.radius[:n]
+        return (x < -r) | (x > screen_width + r) | (y < -r) | (y > screen_height + r)
+
+    def hit_mask(self, x, y, radius, owners=None):
+        """Return a mask of bullets overlapping the circle at (x, y)."""
+        n = self.count
+        offset_x = self.x[:n] - x
+        offset_y = self.y[:n] - y
+        reach = self.radius[:n] + radius
+        hits = offset_x * offset_x + offset_y * offset_y < reach * reach
+        if owners is not None:
+            hits &= self.owner_mask(owners)
+        return hits
+
+    def total_damage(self, mask):
+        """Sum the damage carried by the masked bullets."""
+        return int(self.damage[:self.count][mask].sum())
+
+    def kill(self, mask, limit=None):
+        """
+        Remove the masked bullets, keeping the survivors packed and in order.
+
+        :param mask: Boolean array of length ``count``.
+        :param limit: Only remove the first ``limit`` masked bullets.
+        :return: Number of bullets removed.
+        """
+        mask = np.asarray(mask, dtype=bool)
+        if limit is not None:
+            indices = np.flatnonzero(mask)[:limit]
+            mask = np.zeros(self.count, dtype=bool)
+            mask[indices] = True
+        removed = int(np.count_nonzero(mask))
+        if removed == 0:
+            return 0
+        keep = ~mask
+        n = self.count
+        kept = n - removed
+        for column in self._columns():
+            column[:kept] = column[:n][keep]
+        self.count = kept
+        return removed
+
+    def kill_indices(self, indices):
+        """Remove the bullets at the given slot indices."""
+        mask = np.zeros(self.count, dtype=bool)
+        mask[list(indices)] = True
+        return self.kill(mask)
+
+    def entries(self, owner):
+        """Return (index, x, y, radius) tuples for one owner's bullets."""
+        indices = np.flatnonzero(self.owner_mask(owner))
+        return list(zip(
+            indices.tolist(),
+            self.x[indices].tolist(),
+            self.y[indices].tolist(),
+            self.radius[indices].tolist(),
+        ))
+
+    def clear(self, owner=None):
+        """Remove every bullet, or only those of one owner."""
+        if owner is None:
+            self.count = 0
+        else:
+            self.kill(self.owner_mask(owner))
+
+    def count_owner(self, owner):
+        return int(np.count_nonzero(self.owner_mask(owner)))
+
+    def draw(self, surface, owner, alpha=1.0):
+        """
+        Draw every bullet of one owner type with a single batched blit.
+
+        :param alpha: Fraction of the last step to draw at, blending from the previous position.
+        """
+        n = self.count
+        mask = self.owner[:n] == OWNER_IDS[owner]
+        if not mask.any():
+            return
+        radii = self.radius[:n][mask]
+        xs = self.x[:n][mask]
+        ys = self.y[:n][mask]
+        if alpha < 1.0:
+            previous_x = self.previous_x[:n][mask]
+            previous_y = self.previous_y[:n][mask]
+            xs = previous_x + (xs - previous_x) * alpha
+            ys = previous_y + (ys - previous_y) * alpha
+        xs = xs.astype(np.int64)
+        ys = ys.astype(np.int64)
+        for radius in np.unique(radii).tolist():
+            sprite = get_bullet_sprite(owner, radius)
+            offset = radius + BULLET_GLOW_RADIUS
+            same = radii == radius
+            blit_batch(
+                surface,
+                [(sprite, (x - offset, y - offset)) for x, y in zip(xs[same].tolist(), ys[same].tolist())],
+            )
@@ -2,41 +2,65 @@
 
 import pygame
 import sys
+import argparse
+import time
 import os
-import random
 import math
 import json
+import itertools
 
 from utils import get_random_dark_color, get_opposite_color, is_collision, load_sound
-from entities.player import Player
-from entities.enemy import Enemy
-from entities.boss import Boss
-from entities.bullet import Bullet
-from entities.asteroid import Asteroid
+from entities.player import Player, clear_ship_sprite_cache
+from entities.enemy import Enemy, EnemySwarm, get_enemy_sprite, clear_enemy_sprite_cache
+from entities.boss import Boss, build_boss_frames, clear_boss_sprite_cache
+from entities.bullet import build_bullet_atlas
+from entities.projectiles import ProjectileStore
+from entities.asteroid import Asteroid, clear_asteroid_frame_cache, get_shape_bank
 from entities.health_item import HealthItem
 from entities.power_up import PowerUp
-from effects.effects import Effects
+from effects.effects import Effects, BOSS_FLASH_COLOR
+from effects.starfield import Starfield
+from core.clock import SimulationClock, get_ticks, set_clock
+from core.dirty_rects import DirtyRectTracker
+from core.render_targets import RenderTargets
+from core.replay import (
+    ACTION_MODE_BASIC, ACTION_MODE_SPREAD, ACTION_SHOOT, LOADOUT_FIELDS,
+    InputPlayback, InputRecorder, pack_actions, unpack_direction,
+)
+from core.rng import get_numpy_stream, get_stream, seed_streams
+from core.spatial_hash import SpatialHash
+from core.timestep import FixedTimestep, Interpolator
 from ui.ui import Button, HealthBar, ScoreDisplay, DialogBubble
 from ui.ship_builder import draw_ship_builder
+from ui.fonts import get_font, prewarm_fonts
+from ui.text_cache import DigitAtlas, render_text
 
 # Initialize Pygame
 pygame.init()
 
-# Constants
-SCREEN_WIDTH, SCREEN_HEIGHT = pygame.display.Info().current_w, pygame.display.Info().current_h
-SCREEN = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.FULLSCREEN)
-pygame.display.set_caption("Space Shooter")
+# Constants; the screen is opened by init_display() when the game starts
+SCREEN_WIDTH, SCREEN_HEIGHT = 0, 0
+SCREEN = None
+HEADLESS_SIZE = (1280, 720)  # Playfield size simulated when running without a display
 
 # Colors
 WHITE = (255, 255, 255)
 
+# Frame pacing; the simulation always steps at a fixed rate, 0 renders uncapped
+MAX_RENDER_FPS = 60
+
+# Screens that only present the regions that changed
+DIRTY_RECT_STATES = ("menu", "game_over", "ship_builder")
+GAME_OVER_FADE_FRAMES = 12  # Full frames while the game-over overlay darkens the last gameplay frame
+COUNTDOWN_MS = 4000  # "3", "2", "1" and "Go!" at one second each
+
 # Fonts
-FONT = pygame.font.Font(None, 40)
-FONT.set_bold(True)
-GAME_OVER_FONT = pygame.font.Font(None, 72)
-GAME_OVER_FONT.set_bold(True)
-COUNTDOWN_FONT = pygame.font.Font(None, 150)
-COUNTDOWN_FONT.set_bold(True)
+prewarm_fonts()
+FONT = get_font(40, bold=True)
+GAME_OVER_FONT = get_font(72, bold=True)
+COUNTDOWN_FONT = get_font(150, bold=True)
+TITLE_FONT = get_font(80, bold=True)
+TIMER_DIGITS = DigitAtlas(FONT, WHITE)
 
 # Load sounds
 ASSETS_PATH = os.path.join(os.path.dirname(__file__), 'assets')
@@ -56,16 +80,76 @@ if COUNTDOWN_SOUND:
 if COUNTDOWN_FINAL_SOUND:
     COUNTDOWN_FINAL_SOUND.set_volume(0.8)
 
-# Background music
-try:
-    pygame.mixer.music.load(os.path.join(ASSETS_PATH, 'bgm.wav'))
-    pygame.mixer.music.play(-1)
-except pygame.error as e:
-    print(f"Error loading background music: {e}")
+def init_display(headless=False, size=None):
+    """
+    Open the fullscreen window, or a surface on SDL's dummy driver for headless runs.
+
+    A fixed ``size`` (used by replays, whose spawns depend on it) opens a window of that size instead.
+    """
+    global SCREEN, SCREEN_WIDTH, SCREEN_HEIGHT
+    if headless:
+        os.environ["SDL_VIDEODRIVER"] = "dummy"
+        pygame.display.quit()
+        pygame.display.init()
+        SCREEN_WIDTH, SCREEN_HEIGHT = size or HEADLESS_SIZE
+        SCREEN = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    elif size:
+        SCREEN_WIDTH, SCREEN_HEIGHT = size
+        SCREEN = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        pygame.display.set_caption("Space Shooter")
+    else:
+        SCREEN_WIDTH, SCREEN_HEIGHT = pygame.display.Info().current_w, pygame.display.Info().current_h
+        SCREEN = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.FULLSCREEN)
+        pygame.display.set_caption("Space Shooter")
+    return SCREEN
+
+def start_music():
+    # Background music
+    try:
+        pygame.mixer.music.load(os.path.join(ASSETS_PATH, 'bgm.wav'))
+        pygame.mixer.music.play(-1)
+    except pygame.error as e:
+        print(f"Error loading background music: {e}")
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Space Shooter")
+    parser.add_argument("--headless", action="store_true",
+                        help="run the simulation on the dummy video driver without drawing, as fast as possible")
+    parser.add_argument("--frames", type=int, default=0,
+                        help="stop after this many simulation steps (0 runs until quit or game over)")
+    parser.add_argument("--invulnerable", action="store_true",
+                        help="keep the player alive, for soak-testing level progression and boss phases")
+    parser.add_argument("--seed", type=int, default=None,
+                        help="seed the spawn, AI and cosmetic random streams so every run replays identically")
+    parser.add_argument("--record", metavar="PATH",
+                        help="record the first run's per-step inputs and seed to PATH")
+    parser.add_argument("--replay", metavar="PATH",
+                        help="play back a recorded run instead of reading the keyboard or autopilot")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    headless = args.headless
+    playback = InputPlayback.load(args.replay) if args.replay else None
+    if playback is not None:
+        # The recording decides everything that steers the run, not the command line
+        args.seed = playback.seed
+        args.invulnerable = playback.header.get("invulnerable", False)
+    init_display(headless, playback.screen_size if playback else None)
+    if not headless:
+        start_music()
+
+    # Every timer in the game reads this clock, which only moves with simulation steps
+    sim_clock = SimulationClock()
+    set_clock(sim_clock)
+
+    # Gameplay and cosmetics draw from separate seeded streams; each new run restarts them
+    seed = seed_streams(args.seed)
+    spawn_rng = get_stream("spawn")
+    cosmetic_rng = get_stream("cosmetic")
 
-def main():
     # Game setup
-    current_bg_color = get_random_dark_color()
+    current_bg_color = get_random_dark_color(cosmetic_rng)
     game_state = "menu"
     clock = pygame.time.Clock()
 
@@ -75,8 +159,12 @@ def main():
 
     # Player color opposite of background
     player_color = get_opposite_color(current_bg_color)
+
+    # Every live bullet (player, enemy and boss) shares one projectile store
+    projectiles = ProjectileStore()
+
     # Player
-    player = Player(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 100, player_color, SCREEN_WIDTH, SCREEN_HEIGHT)
+    player = Player(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 100, player_color, SCREEN_WIDTH, SCREEN_HEIGHT, projectiles)
 
     # Health bar
     health_bar = HealthBar(player)
@@ -84,11 +172,26 @@ def main():
     # Score display
     score_display = ScoreDisplay(SCREEN_WIDTH)
 
+    # Back buffers reused by every game state
+    render_targets = RenderTargets((SCREEN_WIDTH, SCREEN_HEIGHT))
+    dirty_rects = DirtyRectTracker((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+    # Fixed-rate simulation, drawn with interpolation between steps
+    timestep = FixedTimestep()
+    interpolator = Interpolator()
+    presented_state = None
+
     # Effects
     effects = Effects(SCREEN_WIDTH, SCREEN_HEIGHT)
 
+    # Bullet sprites
+    build_bullet_atlas()
+
+    # Collision broadphase, rebuilt every frame
+    collision_grid = SpatialHash(cell_size=64)
+
     # Dialogue bubble
-    dialog_font = pygame.font.Font(None, 28)
+    dialog_font = get_font(28)
     dialog_width = max(360, int(SCREEN_WIDTH * 0.33))
     dialog_bubble = DialogBubble(
         dialog_font,
@@ -99,8 +202,7 @@ def main():
     intro_dialog_shown = False
 
     # Buttons
-    button_font = pygame.font.Font(None, 52)
-    button_font.set_bold(True)
+    button_font = get_font(52, bold=True)
 
     play_button = Button(
         "Play",
@@ -246,6 +348,18 @@ def main():
         (60, 45),
         WHITE
     )
+    builder_buttons = [
+        builder_hull_prev,
+        builder_hull_next,
+        builder_color_prev,
+        builder_color_next,
+        builder_nozzle_prev,
+        builder_nozzle_next,
+        builder_weapon_button,
+        builder_wing_button,
+        builder_confirm_button,
+        builder_back_button,
+    ]
 
     SAVE_FILE = "save.json"
     hull_options = [
@@ -330,25 +444,13 @@ def main():
         )
 
     # Stars for background
-    stars = []
-    for _ in range(100):
-        x = random.randint(0, SCREEN_WIDTH)
-        y = random.randint(0, SCREEN_HEIGHT)
-        speed = random.uniform(1, 4)
-        radius = random.randint(1, 3)
-        stars.append([x, y, speed, radius])
+    starfield = Starfield(SCREEN_WIDTH, SCREEN_HEIGHT, color=WHITE, rng=get_numpy_stream("cosmetic"))
 
     def draw_background(surface):
         surface.fill(current_bg_color)
-        # Stars
-        for star in stars:
-            pygame.draw.circle(surface, WHITE, (int(star[0]), int(star[1])), star[3])
-            star[1] += star[2]
-            if star[1] > SCREEN_HEIGHT:
-                star[0] = random.randint(0, SCREEN_WIDTH)
-                star[1] = 0
-                star[2] = random.uniform(1, 4)
-                star[3] = random.randint(1, 3)
+        starfield.draw(surface)
+        if game_state in DIRTY_RECT_STATES:
+            dirty_rects.mark_many(starfield.rects())
 
     # Load top scores
     score_file = "scores.txt"
@@ -368,21 +470,40 @@ def main():
                     continue
 
     # Game variables
-    enemies = []
+    enemies = EnemySwarm(SCREEN_WIDTH, SCREEN_HEIGHT)
     asteroids = []
     health_items = []
     power_ups = []
-    enemy_bullets = []
-    boss_bullets = []
     level = 1
     boss_spawn_level_interval = 5  # Every 5 levels
     boss = None
     boss_active = False
     boss_defeated_current_level = False  # Initialize the flag
-    start_time = pygame.time.get_ticks()
+    start_time = get_ticks()
     elapsed_time = 0
     score_added = False  # Initialize the flag to prevent multiple score additions
     countdown_start_ticks = None  # For countdown timer
+    def replay_header():
+        # Everything besides the inputs that a replay needs to rebuild the run
+        return {
+            "seed": seed,
+            "invulnerable": args.invulnerable,
+            "screen_size": [SCREEN_WIDTH, SCREEN_HEIGHT],
+            "loadout": {field: getattr(player, field) for field in LOADOUT_FIELDS},
+        }
+
+    if playback is not None:
+        for field, value in playback.loadout.items():
+            setattr(player, field, value)
+    recorder = None
+    pressed_actions = 0  # Key presses not yet handed to a simulation step
+    if headless or playback is not None:
+        # Headless runs and replays skip the menu and go straight into a game
+        game_state = "countdown"
+        countdown_start_ticks = get_ticks()
+        player.reset()
+        if args.record:
+            recorder = InputRecorder(args.record, replay_header())
     countdown_number = 3  # Start countdown from 3
     story_events = {
         2: ("Mission Control", "Scans are spiking. Expect denser fire from the swarm."),
@@ -390,6 +511,15 @@ def main():
         6: ("Mission Control", "Bosses are adapting. Watch for charge-up patterns."),
     }
 
+    def rebuild_entity_sprites():
+        # Enemy and boss colors follow the background, so swap the cached palette with it
+        clear_enemy_sprite_cache()
+        clear_boss_sprite_cache()
+        clear_asteroid_frame_cache()
+        palette_outer = get_opposite_color(current_bg_color)
+        get_enemy_sprite(palette_outer, (255, 0, 0))
+        build_boss_frames(palette_outer, (255, 0, 0))
+
     # Function to spawn initial enemies
     def spawn_enemies(initial=False):
         if initial:
@@ -402,8 +532,8 @@ def main():
         max_attempts = 500  # Increased attempts to ensure enough enemies spawn
         spawned_enemies = 0
         while spawned_enemies < count and attempts < max_attempts:
-            enemy_x = random.randint(20, SCREEN_WIDTH - 20)
-            enemy_y = random.randint(50, 150)  # Random Y position near the top
+            enemy_x = spawn_rng.randint(20, SCREEN_WIDTH - 20)
+            enemy_y = spawn_rng.randint(50, 150)  # Random Y position near the top
             # Check for overlap with existing enemies
             overlap = False
             for existing_enemy in enemies:
@@ -413,7 +543,9 @@ def main():
             if not overlap:
                 enemy_color_outer = get_opposite_color(current_bg_color)
                 enemy_color_inner = (255, 0, 0)  # Red core
-                enemy = Enemy(enemy_x, enemy_y, enemy_color_outer, enemy_color_inner, SCREEN_WIDTH, SCREEN_HEIGHT)
+                enemy = Enemy(
+                    enemy_x, enemy_y, enemy_color_outer, enemy_color_inner, SCREEN_WIDTH, SCREEN_HEIGHT, projectiles
+                )
                 enemies.append(enemy)
                 spawned_enemies += 1
             attempts += 1
@@ -423,7 +555,9 @@ def main():
         nonlocal boss, boss_active
         boss_color_outer = get_opposite_color(current_bg_color)
         boss_color_inner = (255, 0, 0)  # Red core
-        boss = Boss(SCREEN_WIDTH // 2, 100, boss_color_outer, boss_color_inner, SCREEN_WIDTH, SCREEN_HEIGHT)
+        boss = Boss(
+            SCREEN_WIDTH // 2, 100, boss_color_outer, boss_color_inner, SCREEN_WIDTH, SCREEN_HEIGHT, projectiles
+        )
         boss_active = True
         boss_dialogs = {
             5: ("Warden-01", "You made it this far? Cute. Let's see you dodge this."),
@@ -451,11 +585,11 @@ def main():
 
     # Function to spawn an asteroid
     def spawn_asteroid():
-        asteroid_x = random.randint(50, SCREEN_WIDTH - 50)
+        asteroid_x = spawn_rng.randint(50, SCREEN_WIDTH - 50)
         asteroid_y = -50
-        asteroid_speed = random.uniform(2, 5)
+        asteroid_speed = spawn_rng.uniform(2, 5)
         # 20% chance to spawn a large asteroid
-        if random.random() < 0.2:
+        if spawn_rng.random() < 0.2:
             size_multiplier = 2  # 2x size
         else:
             size_multiplier = 1
@@ -469,7 +603,7 @@ def main():
 
     # Function to spawn a health item
     def spawn_health_item():
-        health_x = random.randint(15, SCREEN_WIDTH - 15)
+        health_x = spawn_rng.randint(15, SCREEN_WIDTH - 15)
         health_y = -15
         health_speed = 5
         health_item = HealthItem(health_x, health_y, health_speed)
@@ -477,10 +611,10 @@ def main():
 
     # Function to spawn a power-up
     def spawn_power_up():
-        power_x = random.randint(15, SCREEN_WIDTH - 15)
+        power_x = spawn_rng.randint(15, SCREEN_WIDTH - 15)
         power_y = -15
         power_speed = 3
-        power_type = random.choice(['rapid_fire', 'shotgun'])
+        power_type = spawn_rng.choice(['rapid_fire', 'shotgun'])
         power_up = PowerUp(power_x, power_y, power_speed, power_type)
         power_ups.append(power_up)
 
@@ -499,54 +633,121 @@ def main():
         save_scores(scores)
         return scores
 
+    def compose_game_over(surface):
+        surface.fill((0, 0, 0, 180))  # Semi-transparent black overlay
+
+        # Draw Game Over text
+        game_over_text = GAME_OVER_FONT.render("GAME OVER", True, WHITE)
+        game_over_rect = game_over_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 150))
+        surface.blit(game_over_text, game_over_rect)
+
+        # Draw Top Scores
+        scores_title = FONT.render("Top 10 Scores:", True, WHITE)
+        scores_title_rect = scores_title.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 100))
+        surface.blit(scores_title, scores_title_rect)
+        for idx, (score, lvl, time_sec) in enumerate(top_scores):
+            minutes = int(time_sec) // 60
+            seconds = int(time_sec) % 60
+            time_formatted = f"{minutes:02}:{seconds:02}"
+            ordinal = f"{idx+1}{'st' if idx==0 else 'nd' if idx==1 else 'rd' if idx==2 else 'th'}"
+            score_text = FONT.render(f"{ordinal} Score: {score} LVL {lvl} Time: {time_formatted}", True, WHITE)
+            score_rect = score_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 70 + idx * 30))
+            surface.blit(score_text, score_rect)
+
+    def autopilot_input():
+        """Line up under the nearest target and keep firing; drives headless runs."""
+        targets = [boss] if boss_active and boss else list(enemies)
+        if not targets:
+            return 0, 0, True
+        target = min(targets, key=lambda t: abs(t.x - player.x))
+        offset = target.x - player.x
+        if abs(offset) < player.speed:
+            return 0, 0, True
+        return (1 if offset > 0 else -1), 0, True
+
+    def finish_recording():
+        if recorder is not None and not recorder.closed:
+            recorder.close()
+            print(f"Recorded {len(recorder)} steps to {args.record}")
+
+    def moving_objects():
+        boss_list = [boss] if boss_active and boss else []
+        return itertools.chain([player], enemies, boss_list, asteroids, health_items, power_ups)
+
     # Initialize game by spawning initial enemies
     spawn_enemies(initial=True)
 
     # Game loop
+    wall_start = time.perf_counter()
     while True:
+        if args.frames and timestep.total_steps >= args.frames:
+            break
+        if playback is not None and playback.finished:
+            break
+        if headless:
+            if game_state == "game_over":
+                break
+            # One step per loop and no pacing: the simulation runs as fast as it can
+            steps = timestep.advance(timestep.step_ms)
+        else:
+            steps = timestep.advance(clock.tick(MAX_RENDER_FPS))
+        render_targets.begin_frame()
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
+                finish_recording()
                 pygame.quit()
                 sys.exit()
+            if event.type in (pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN, pygame.VIDEOEXPOSE):
+                dirty_rects.mark_all()
 
             if game_state == "menu":
                 if play_button.is_clicked(event):
                     game_state = "countdown"
-                    countdown_start_ticks = pygame.time.get_ticks()
+                    # Each run's timers start from zero, so a recording replays against the same clock
+                    sim_clock.reset()
+                    timestep.reset()
+                    interpolator.clear()
+                    countdown_start_ticks = get_ticks()
                     countdown_number = 3  # Reset countdown
                     # Play countdown sound
                     if COUNTDOWN_SOUND:
                         COUNTDOWN_SOUND.play()
                     # Reset game variables
-                    current_bg_color = get_random_dark_color()
+                    seed = seed_streams(args.seed)
+                    current_bg_color = get_random_dark_color(cosmetic_rng)
                     if current_bg_color == (0, 0, 0):
                         current_bg_color = (10, 10, 10)  # Slightly off-black
+                    rebuild_entity_sprites()
                     player_color = get_opposite_color(current_bg_color)
                     player.reset()
                     if not player.custom_color:
                         player.color = player_color
+                        clear_ship_sprite_cache()
                     health_bar = HealthBar(player)
                     score_display = ScoreDisplay(SCREEN_WIDTH)
                     enemies.clear()
                     asteroids.clear()
                     health_items.clear()
                     power_ups.clear()
-                    enemy_bullets.clear()
-                    boss_bullets.clear()
+                    projectiles.clear()
                     level = 1
                     boss = None
                     boss_active = False
                     boss_defeated_current_level = False
-                    start_time = pygame.time.get_ticks()
+                    start_time = get_ticks()
                     elapsed_time = 0
                     score_added = False  # Reset the flag
                     dialog_queue.clear()
                     dialog_bubble.visible = False
                     # Spawn initial enemies
                     spawn_enemies(initial=True)
+                    pressed_actions = 0
+                    if args.record and recorder is None:
+                        recorder = InputRecorder(args.record, replay_header())
                 if ship_builder_button.is_clicked(event):
                     game_state = "ship_builder"
                 if quit_button.is_clicked(event):
+                    finish_recording()
                     pygame.quit()
                     sys.exit()
 
@@ -554,53 +755,62 @@ def main():
                 pass  # No input handling during countdown
 
             elif game_state == "playing":
+                # Presses are applied by the next simulation step so recordings see them
                 if event.type == pygame.KEYDOWN:
                     if event.key == pygame.K_SPACE:
-                        if player.shoot():
-                            if SHOOT_SOUND:
-                                SHOOT_SOUND.play()
+                        pressed_actions |= ACTION_SHOOT
                     if event.key == pygame.K_z:
-                        player.set_weapon_mode("basic")
+                        pressed_actions |= ACTION_MODE_BASIC
                     if event.key == pygame.K_x:
-                        player.set_weapon_mode("spread")
+                        pressed_actions |= ACTION_MODE_SPREAD
                 # No need to handle movement here; it's handled in the main loop
 
             elif game_state == "game_over":
                 if retry_button.is_clicked(event):
                     game_state = "countdown"
-                    countdown_start_ticks = pygame.time.get_ticks()
+                    # Each run's timers start from zero, so a recording replays against the same clock
+                    sim_clock.reset()
+                    timestep.reset()
+                    interpolator.clear()
+                    countdown_start_ticks = get_ticks()
                     countdown_number = 3  # Reset countdown
                     # Play countdown sound
                     if COUNTDOWN_SOUND:
                         COUNTDOWN_SOUND.play()
                     # Reset game variables
-                    current_bg_color = get_random_dark_color()
+                    seed = seed_streams(args.seed)
+                    current_bg_color = get_random_dark_color(cosmetic_rng)
                     if current_bg_color == (0, 0, 0):
                         current_bg_color = (10, 10, 10)  # Slightly off-black
+                    rebuild_entity_sprites()
                     player_color = get_opposite_color(current_bg_color)
                     player.reset()
                     if not player.custom_color:
                         player.color = player_color
+                        clear_ship_sprite_cache()
                     health_bar = HealthBar(player)
                     score_display = ScoreDisplay(SCREEN_WIDTH)
                     enemies.clear()
                     asteroids.clear()
                     health_items.clear()
                     power_ups.clear()
-                    enemy_bullets.clear()
-                    boss_bullets.clear()
+                    projectiles.clear()
                     level = 1
                     boss = None
                     boss_active = False
                     boss_defeated_current_level = False
-                    start_time = pygame.time.get_ticks()
+                    start_time = get_ticks()
                     elapsed_time = 0
                     score_added = False  # Reset the flag
                     dialog_queue.clear()
                     dialog_bubble.visible = False
                     # Spawn initial enemies
                     spawn_enemies(initial=True)
+                    pressed_actions = 0
+                    if args.record and recorder is None:
+                        recorder = InputRecorder(args.record, replay_header())
                 if game_over_quit_button.is_clicked(event):
+                    finish_recording()
                     pygame.quit()
                     sys.exit()
             elif game_state == "ship_builder":
@@ -651,6 +861,7 @@ def main():
                         player.nozzle_type = selected_nozzle
                         player.color = pending_color["color"]
                         player.custom_color = True
+                        clear_ship_sprite_cache()
                         persist_save()
                 if event.type == pygame.MOUSEBUTTONDOWN:
                     for rect, color_id in builder_swatch_rects:
@@ -658,9 +869,19 @@ def main():
                             selected_color = color_id
                             break
 
+        if game_state != presented_state:
+            # A new screen is presented in full; game over also waits for its fade to settle
+            dirty_rects.mark_all(GAME_OVER_FADE_FRAMES if game_state == "game_over" else 1)
+            presented_state = game_state
+
+        for _ in range(steps):
+            starfield.update()
+            if game_state != "playing":
+                sim_clock.advance(timestep.step_ms)
+
         if game_state == "countdown":
             # Calculate countdown number based on time elapsed
-            time_since_countdown_start = (pygame.time.get_ticks() - countdown_start_ticks) / 1000  # in seconds
+            time_since_countdown_start = (get_ticks() - countdown_start_ticks) / 1000  # in seconds
             current_countdown_number = 3 - int(time_since_countdown_start)
 
             if current_countdown_number != countdown_number:
@@ -675,14 +896,18 @@ def main():
                         COUNTDOWN_FINAL_SOUND.play()
                 else:
                     game_state = "playing"
-                    start_time = pygame.time.get_ticks()  # Reset start time
+                    # Play starts exactly when the countdown ends, however many steps its last frame ran
+                    sim_clock.reset(countdown_start_ticks + COUNTDOWN_MS)
+                    start_time = get_ticks()  # Reset start time
                     if not intro_dialog_shown:
                         enqueue_intro_dialog()
                         intro_dialog_shown = True
                     continue  # Skip to next iteration to prevent drawing countdown at -1
 
+            if headless:
+                continue
             # Draw countdown screen
-            temp_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+            temp_surface = render_targets.get("frame")
             draw_background(temp_surface)
 
             # Determine what to display
@@ -698,166 +923,164 @@ def main():
 
             SCREEN.blit(temp_surface, (0, 0))
             pygame.display.flip()
-            clock.tick(60)
             continue  # Skip rest of the loop until countdown is over
 
         if game_state == "playing":
-            keys = pygame.key.get_pressed()
-            direction_x = 0
-            direction_y = 0
-            if keys[pygame.K_LEFT]:
-                direction_x = -1
-            elif keys[pygame.K_RIGHT]:
-                direction_x = 1
-
-            if keys[pygame.K_UP]:
-                direction_y = -1
-            elif keys[pygame.K_DOWN]:
-                direction_y = 1
-
-            player.move(direction_x, direction_y)
-
-            # Shooting when space is held down
-            if keys[pygame.K_SPACE]:
-                if player.shoot():
-                    if SHOOT_SOUND:
-                        SHOOT_SOUND.play()
-
-            # Update player's position
-            player.update_position()
-
-            # Update power-up status
-            player.update_power_up()
+            if playback is not None:
+                held_actions = 0  # Every step's actions come from the recording
+            elif headless:
+                held_actions = pack_actions(*autopilot_input())
+            else:
+                keys = pygame.key.get_pressed()
+                direction_x = 0
+                direction_y = 0
+                if keys[pygame.K_LEFT]:
+                    direction_x = -1
+                elif keys[pygame.K_RIGHT]:
+                    direction_x = 1
+
+                if keys[pygame.K_UP]:
+                    direction_y = -1
+                elif keys[pygame.K_DOWN]:
+                    direction_y = 1
+                held_actions = pack_actions(direction_x, direction_y, keys[pygame.K_SPACE])
 
             # Update timer
-            current_ticks = pygame.time.get_ticks()
+            current_ticks = get_ticks()
             elapsed_time = (current_ticks - start_time) / 1000  # Elapsed time in seconds
             update_dialog(current_ticks)
 
-            # Spawn asteroids
-            if random.random() < 0.002:
-                spawn_asteroid()
-
-            # Spawn health items
-            if random.random() < 0.001:
-                spawn_health_item()
-
-            # Spawn power-ups
-            if random.random() < 0.0005:
-                spawn_power_up()
-
-            # Spawn boss
-            if level % boss_spawn_level_interval == 0 and not boss_active and not boss_defeated_current_level:
-                spawn_boss()
-
-            # Update player bullets
-            for bullet in player.bullets[:]:
-                bullet.move()
-                # Remove bullet if it goes off-screen
-                if bullet.y < -bullet.radius:
-                    player.bullets.remove(bullet)
-
-            # Update enemies
-            for enemy in enemies[:]:
-                enemy.update(player.x, player.y, enemies)
-                # Update enemy bullets
-                for bullet in enemy.bullets[:]:
-                    bullet.move()
-                    if bullet.y > SCREEN_HEIGHT + bullet.radius or bullet.x < -bullet.radius or bullet.x > SCREEN_WIDTH + bullet.radius:
-                        enemy.bullets.remove(bullet)
-                    else:
-                        enemy_bullets.append(bullet)
-                        enemy.bullets.remove(bullet)
-                enemy.move()
-                # Remove enemies that move off the bottom of the screen
-                if enemy.y - enemy.radius_outer > SCREEN_HEIGHT:
-                    enemies.remove(enemy)
-
-            # Update enemy bullets
-            for bullet in enemy_bullets[:]:
-                bullet.move()
-                # Remove bullet if it goes off-screen
-                if bullet.y > SCREEN_HEIGHT + bullet.radius or bullet.x < -bullet.radius or bullet.x > SCREEN_WIDTH + bullet.radius:
-                    enemy_bullets.remove(bullet)
-
-            # Update boss if active
-            if boss_active and boss:
-                boss_special = boss.update(player)
-                if boss_special:
-                    effects.start_shake(duration=20)
-                    effects.start_flash((int(boss.x), int(boss.y)), color=(255, 80, 180))
-                # Update boss bullets
-                for bullet in boss.bullets[:]:
-                    bullet.move()
-                    if bullet.y > SCREEN_HEIGHT + bullet.radius or bullet.y < -bullet.radius or bullet.x < -bullet.radius or bullet.x > SCREEN_WIDTH + bullet.radius:
-                        boss.bullets.remove(bullet)
-                    else:
-                        boss_bullets.append(bullet)
-                        boss.bullets.remove(bullet)
-                boss.move()
-
-            # Update boss bullets
-            for bullet in boss_bullets[:]:
-                bullet.move()
-                # Remove bullet if it goes off-screen
-                if bullet.y > SCREEN_HEIGHT + bullet.radius or bullet.y < -bullet.radius or bullet.x < -bullet.radius or bullet.x > SCREEN_WIDTH + bullet.radius:
-                    boss_bullets.remove(bullet)
-
-            # Update asteroids
-            for asteroid in asteroids[:]:
-                asteroid.move()
-                asteroid.rotate()
-                if asteroid.y - asteroid.radius_outer > SCREEN_HEIGHT:
-                    asteroids.remove(asteroid)
-
-            # Update health items
-            for health_item in health_items[:]:
-                health_item.move()
-                health_item.update_hue()
-                if health_item.y - health_item.radius > SCREEN_HEIGHT:
-                    health_items.remove(health_item)
-
-            # Update power-ups
-            for power_up in power_ups[:]:
-                power_up.move()
-                if power_up.y - power_up.radius > SCREEN_HEIGHT:
-                    power_ups.remove(power_up)
+            # Advance the simulation in fixed steps; drawing below blends between the last two
+            for _ in range(steps):
+                if playback is not None:
+                    actions = playback.next_actions()
+                    if actions is None:
+                        break
+                else:
+                    actions = held_actions | pressed_actions
+                    pressed_actions = 0
+                if recorder is not None:
+                    recorder.record(actions)
+
+                sim_clock.advance(timestep.step_ms)
+                interpolator.capture(moving_objects())
+                if actions & ACTION_MODE_BASIC:
+                    player.set_weapon_mode("basic")
+                elif actions & ACTION_MODE_SPREAD:
+                    player.set_weapon_mode("spread")
+                player.move(*unpack_direction(actions))
+
+                # Shooting when space is held down
+                if actions & ACTION_SHOOT:
+                    if player.shoot():
+                        if SHOOT_SOUND:
+                            SHOOT_SOUND.play()
+
+                # Update player's position
+                player.update_position()
+
+                # Update power-up status
+                player.update_power_up()
+
+                # Spawn asteroids
+                if spawn_rng.random() < 0.002:
+                    spawn_asteroid()
+
+                # Spawn health items
+                if spawn_rng.random() < 0.001:
+                    spawn_health_item()
+
+                # Spawn power-ups
+                if spawn_rng.random() < 0.0005:
+                    spawn_power_up()
+
+                # Spawn boss
+                if level % boss_spawn_level_interval == 0 and not boss_active and not boss_defeated_current_level:
+                    spawn_boss()
+
+                # Update enemies (steering and movement run as one batch over the swarm)
+                enemies.update(player.x, player.y)
+                enemies.move()
+                for enemy in enemies[:]:
+                    # Remove enemies that move off the bottom of the screen
+                    if enemy.y - enemy.radius_outer > SCREEN_HEIGHT:
+                        enemies.remove(enemy)
 
-            # Handle player collision with power-ups
-            for power_up in power_ups[:]:
-                if is_collision(power_up.x, power_up.y, player.x, player.y, power_up.radius, player.radius):
+                # Update boss if active
+                if boss_active and boss:
+                    boss_special = boss.update(player)
+                    if boss_special:
+                        effects.start_shake(duration=20)
+                        effects.start_flash((int(boss.x), int(boss.y)), color=BOSS_FLASH_COLOR)
+                    boss.move()
+
+                # Move every bullet and drop the ones that left the screen
+                projectiles.move()
+                projectiles.kill(projectiles.offscreen_mask(SCREEN_WIDTH, SCREEN_HEIGHT))
+
+                # Update asteroids
+                for asteroid in asteroids[:]:
+                    asteroid.move()
+                    asteroid.rotate()
+                    if asteroid.y - asteroid.radius_outer > SCREEN_HEIGHT:
+                        asteroids.remove(asteroid)
+
+                # Update health items
+                for health_item in health_items[:]:
+                    health_item.move()
+                    health_item.update_hue()
+                    if health_item.y - health_item.radius > SCREEN_HEIGHT:
+                        health_items.remove(health_item)
+
+                # Update power-ups
+                for power_up in power_ups[:]:
+                    power_up.move()
+                    if power_up.y - power_up.radius > SCREEN_HEIGHT:
+                        power_ups.remove(power_up)
+
+                # Rebuild the collision grid from this frame's positions
+                collision_grid.clear()
+                for enemy in enemies:
+                    collision_grid.insert(enemy, enemy.x, enemy.y, enemy.radius_outer, 'enemy')
+                if boss_active and boss:
+                    collision_grid.insert(boss, boss.x, boss.y, boss.radius_outer, 'boss')
+                for asteroid in asteroids:
+                    collision_grid.insert(asteroid, asteroid.x, asteroid.y, asteroid.radius_outer, 'asteroid')
+                for health_item in health_items:
+                    collision_grid.insert(health_item, health_item.x, health_item.y, health_item.radius, 'health_item')
+                for power_up in power_ups:
+                    collision_grid.insert(power_up, power_up.x, power_up.y, power_up.radius, 'power_up')
+
+                # Handle player collision with power-ups
+                for power_up in collision_grid.collide(player.x, player.y, player.radius, 'power_up')[:1]:
                     if PICKUP_SOUND:
                         PICKUP_SOUND.play()
                     player.activate_power_up(power_up.type)
                     power_ups.remove(power_up)
-                    break
 
-            # Handle collisions
-            # Player bullets with enemies and boss
-            for bullet in player.bullets[:]:
-                collision_occurred = False
-                # Check collision with enemies
-                for enemy in enemies[:]:
-                    if is_collision(bullet.x, bullet.y, enemy.x, enemy.y, bullet.radius, enemy.radius_outer):
+                # Handle collisions
+                # Player bullets with enemies and boss
+                spent_bullets = []
+                boss_destroyed = False
+                for index, bullet_x, bullet_y, bullet_radius in projectiles.entries('player'):
+                    # Check collision with enemies
+                    hit_enemies = collision_grid.collide(bullet_x, bullet_y, bullet_radius, 'enemy')
+                    if hit_enemies:
+                        enemy = hit_enemies[0]
                         if EXPLOSION_SOUND:
                             EXPLOSION_SOUND.play()
                         score_display.add_score(1)
                         player.add_credits(1)
                         enemies.remove(enemy)
+                        collision_grid.remove(enemy)
                         # 5% chance to drop health item
-                        if random.random() < 0.05:
+                        if spawn_rng.random() < 0.05:
                             spawn_health_item()
-                        collision_occurred = True
-                        break  # Exit the enemy loop
-
-                # If collision occurred with enemy, remove bullet and continue to next bullet
-                if collision_occurred:
-                    player.bullets.remove(bullet)
-                    continue  # Move to the next bullet
+                        spent_bullets.append(index)
+                        continue  # Move to the next bullet
 
-                # Check collision with boss
-                if boss_active and boss:
-                    if is_collision(bullet.x, bullet.y, boss.x, boss.y, bullet.radius, boss.radius_outer):
+                    # Check collision with boss
+                    if boss_active and boss and collision_grid.collide(bullet_x, bullet_y, bullet_radius, 'boss'):
                         if EXPLOSION_SOUND:
                             EXPLOSION_SOUND.play()
                         score_display.add_score(5)
@@ -865,48 +1088,35 @@ def main():
                         boss.health -= 1
                         if boss.health <= 0:
                             player.add_credits(15)
+                            collision_grid.remove(boss)
                             boss_active = False
                             boss = None
-                            boss_bullets.clear()
+                            boss_destroyed = True
                             boss_defeated_current_level = True  # Boss defeated this level
                             # 10% chance to drop health item
-                            if random.random() < 0.1:
+                            if spawn_rng.random() < 0.1:
                                 spawn_health_item()
                         # Remove bullet after hitting the boss
-                        player.bullets.remove(bullet)
-                        continue  # Move to the next bullet
-
-            # Enemy bullets with player
-            for bullet in enemy_bullets[:]:
-                if is_collision(bullet.x, bullet.y, player.x, player.y, bullet.radius, player.radius):
-                    if EXPLOSION_SOUND:
-                        EXPLOSION_SOUND.play()
-                    player.health -= bullet.damage
-                    # Activate shake and flash effects
-                    effects.start_shake()
-                    effects.start_flash((int(player.x), int(player.y)))
-                    enemy_bullets.remove(bullet)
-                    if player.health <= 0:
-                        game_state = "game_over"
-                    continue
-
-            # Boss bullets with player
-            for bullet in boss_bullets[:]:
-                if is_collision(bullet.x, bullet.y, player.x, player.y, bullet.radius, player.radius):
+                        spent_bullets.append(index)
+                projectiles.kill_indices(spent_bullets)
+                if boss_destroyed:
+                    projectiles.clear('boss')
+
+                # Enemy and boss bullets with player
+                hits = projectiles.hit_mask(player.x, player.y, player.radius, ('enemy', 'boss'))
+                if hits.any():
                     if EXPLOSION_SOUND:
                         EXPLOSION_SOUND.play()
-                    player.health -= bullet.damage
+                    player.health -= projectiles.total_damage(hits)
                     # Activate shake and flash effects
                     effects.start_shake()
                     effects.start_flash((int(player.x), int(player.y)))
-                    boss_bullets.remove(bullet)
-                    if player.health <= 0:
+                    projectiles.kill(hits)
+                    if player.health <= 0 and not args.invulnerable:
                         game_state = "game_over"
-                    continue
 
-            # Player with asteroids
-            for asteroid in asteroids[:]:
-                if is_collision(asteroid.x, asteroid.y, player.x, player.y, asteroid.radius_outer, player.radius):
+                # Player with asteroids
+                for asteroid in collision_grid.collide(player.x, player.y, player.radius, 'asteroid'):
                     if EXPLOSION_SOUND:
                         EXPLOSION_SOUND.play()
                     player.health -= 2
@@ -914,70 +1124,109 @@ def main():
                     effects.start_shake()
                     effects.start_flash((int(player.x), int(player.y)))
                     asteroids.remove(asteroid)
-                    if player.health <= 0:
+                    if player.health <= 0 and not args.invulnerable:
                         game_state = "game_over"
 
-            # Player with health items
-            for health_item in health_items[:]:
-                if is_collision(health_item.x, health_item.y, player.x, player.y, health_item.radius, player.radius):
+                # Player with health items
+                for health_item in collision_grid.collide(player.x, player.y, player.radius, 'health_item'):
                     if PICKUP_SOUND:
                         PICKUP_SOUND.play()
                     player.health = min(player.health + 1, player.max_health)
                     health_items.remove(health_item)
 
-            # Update effects
-            effects.update()
+                # Update effects
+                effects.update()
+
+                if args.invulnerable and player.health <= 0:
+                    player.health = player.max_health
+
+                # Check for level progression
+                if not enemies and not boss_active and game_state == "playing":
+                    level += 1
+                    score_display.add_score(10)  # Bonus for completing level
+                    score_display.update_level(level)  # Update the level display
+                    boss_defeated_current_level = False  # Reset for the new level
+                    if level in story_events:
+                        dialog_queue.append(story_events[level])
+                    # Change background color
+                    current_bg_color = get_random_dark_color(cosmetic_rng)
+                    if current_bg_color == (0, 0, 0):
+                        current_bg_color = (10, 10, 10)  # Slightly off-black
+                    rebuild_entity_sprites()
+                    # Update player and enemy colors
+                    if not player.custom_color:
+                        player.color = get_opposite_color(current_bg_color)
+                        clear_ship_sprite_cache()
+                    # Play level-up sound
+                    if LEVELUP_SOUND:
+                        LEVELUP_SOUND.play()
+                    # Spawn new enemies with increased count
+                    enemies.clear()  # Clear any residual enemies
+                    spawn_enemies(initial=False)
+                    # Update asteroid colors
+                    update_asteroid_colors()
+
+                if game_state != "playing":
+                    break
+
+            if game_state != "playing":
+                # A recording covers one run, up to its game over
+                finish_recording()
+
+            if headless:
+                continue  # Nothing is drawn without a display
 
             # Draw everything on a temporary surface
-            temp_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+            temp_surface = render_targets.get("frame")
             draw_background(temp_surface)
 
-            # Draw player
-            player.draw(temp_surface)
+            # Draw moving objects part way between their last two simulation positions
+            alpha = timestep.alpha
+            with interpolator.blended(moving_objects(), alpha):
+                # Draw player
+                player.draw(temp_surface)
 
-            # Draw enemies
-            for enemy in enemies:
-                enemy.draw(temp_surface)
+                # Draw enemies
+                for enemy in enemies:
+                    enemy.draw(temp_surface)
 
-            # Draw enemy bullets
-            for bullet in enemy_bullets:
-                bullet.draw(temp_surface)
+                # Draw enemy bullets
+                projectiles.draw(temp_surface, 'enemy', alpha)
 
-            # Draw player bullets
-            for bullet in player.bullets:
-                bullet.draw(temp_surface)
+                # Draw player bullets
+                projectiles.draw(temp_surface, 'player', alpha)
 
-            # Draw boss
-            if boss_active and boss:
-                boss.draw(temp_surface)
-                boss.draw_health_bar(temp_surface)
+                # Draw boss
+                if boss_active and boss:
+                    boss.draw(temp_surface)
+                    boss.draw_health_bar(temp_surface)
 
-            # Draw boss bullets
-            for bullet in boss_bullets:
-                bullet.draw(temp_surface)
+                # Draw boss bullets
+                projectiles.draw(temp_surface, 'boss', alpha)
 
-            # Draw asteroids
-            for asteroid in asteroids:
-                asteroid.draw(temp_surface)
+                # Draw asteroids
+                get_shape_bank().fit_to(asteroids)
+                for asteroid in asteroids:
+                    asteroid.draw(temp_surface)
 
-            # Draw health items
-            for health_item in health_items:
-                health_item.draw(temp_surface)
+                # Draw health items
+                for health_item in health_items:
+                    health_item.draw(temp_surface)
 
-            # Draw power-ups
-            for power_up in power_ups:
-                power_up.draw(temp_surface)
+                # Draw power-ups
+                for power_up in power_ups:
+                    power_up.draw(temp_surface)
 
             # Draw UI elements
             health_bar.draw(temp_surface)
             score_display.draw(temp_surface)
 
             # Draw credits and weapon hints
-            credits_text = FONT.render(f"Credits: {player.credits}", True, WHITE)
+            credits_text = render_text(FONT, f"Credits: {player.credits}", WHITE)
             temp_surface.blit(credits_text, (20, 110))
-            upgrade_font = pygame.font.Font(None, 24)
+            upgrade_font = get_font(24)
             mode_label = f"Weapon: {player.weapon_mode.title()} [Z/X]"
-            mode_text = upgrade_font.render(mode_label, True, WHITE)
+            mode_text = render_text(upgrade_font, mode_label, WHITE)
             temp_surface.blit(mode_text, (20, 135))
 
             # Weapon hotbar
@@ -998,19 +1247,22 @@ def main():
                 fill_color = (80, 180, 255) if is_active else (50, 50, 50)
                 pygame.draw.rect(temp_surface, fill_color, (x, y, w, h), border_radius=8)
                 pygame.draw.rect(temp_surface, (220, 220, 220), (x, y, w, h), width=2, border_radius=8)
-                label = upgrade_font.render(key_label, True, WHITE)
+                label = render_text(upgrade_font, key_label, WHITE)
                 label_rect = label.get_rect(center=(x + w / 2, y + h / 2))
                 temp_surface.blit(label, label_rect)
 
             # Draw timer
             minutes = int(elapsed_time) // 60
             seconds = int(elapsed_time) % 60
-            timer_text = FONT.render(f"Time: {minutes:02}:{seconds:02}", True, WHITE)
-            temp_surface.blit(timer_text, (SCREEN_WIDTH - timer_text.get_width() - 20, 10))
+            timer_label = render_text(FONT, "Time: ", WHITE)
+            timer_digits = f"{minutes:02}:{seconds:02}"
+            timer_x = SCREEN_WIDTH - timer_label.get_width() - TIMER_DIGITS.width(timer_digits) - 20
+            temp_surface.blit(timer_label, (timer_x, 10))
+            TIMER_DIGITS.draw(temp_surface, timer_digits, (timer_x + timer_label.get_width(), 10))
 
             # Draw power-up cooldown bar
             if player.power_up_active:
-                remaining_time = (player.power_up_end_time - pygame.time.get_ticks()) / 1000  # In seconds
+                remaining_time = (player.power_up_end_time - get_ticks()) / 1000  # In seconds
                 bar_width = 200
                 bar_height = 20
                 bar_x = (SCREEN_WIDTH - bar_width) / 2
@@ -1020,66 +1272,40 @@ def main():
                 pygame.draw.rect(temp_surface, (128, 128, 128), (bar_x, bar_y, bar_width, bar_height))  # Background
                 pygame.draw.rect(temp_surface, (0, 255, 0), (bar_x, bar_y, current_bar_width, bar_height))  # Foreground
                 # Display power-up type
-                font = pygame.font.Font(None, 24)
-                text = font.render(player.power_up_active.replace('_', ' ').title(), True, WHITE)
+                font = get_font(24)
+                text = render_text(font, player.power_up_active.replace('_', ' ').title(), WHITE)
                 text_rect = text.get_rect(center=(SCREEN_WIDTH / 2, bar_y + bar_height / 2))
                 temp_surface.blit(text, text_rect)
 
             # Apply effects to the temporary surface
-            temp_surface = effects.apply_shake(temp_surface)
             temp_surface = effects.apply_flash(temp_surface)
 
-            # Blit the temporary surface onto the main screen
-            SCREEN.blit(temp_surface, (0, 0))
+            # Blit the temporary surface onto the main screen, offset by any screen shake
+            render_targets.present(SCREEN, temp_surface, effects.get_shake_offset())
 
             # Draw dialog bubble on top
             dialog_bubble.draw(SCREEN)
 
-            # Check for level progression
-            if not enemies and not boss_active and game_state == "playing":
-                level += 1
-                score_display.add_score(10)  # Bonus for completing level
-                score_display.update_level(level)  # Update the level display
-                boss_defeated_current_level = False  # Reset for the new level
-                if level in story_events:
-                    dialog_queue.append(story_events[level])
-                # Change background color
-                current_bg_color = get_random_dark_color()
-                if current_bg_color == (0, 0, 0):
-                    current_bg_color = (10, 10, 10)  # Slightly off-black
-                # Update player and enemy colors
-                if not player.custom_color:
-                    player.color = get_opposite_color(current_bg_color)
-                # Play level-up sound
-                if LEVELUP_SOUND:
-                    LEVELUP_SOUND.play()
-                # Spawn new enemies with increased count
-                enemies.clear()  # Clear any residual enemies
-                spawn_enemies(initial=False)
-                # Update asteroid colors
-                update_asteroid_colors()
-
         elif game_state == "menu":
             # Ensure background color is not black
             if current_bg_color == (0, 0, 0):
                 current_bg_color = (10, 10, 10)  # Slightly off-black
 
             # Draw menu on a temporary surface
-            temp_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+            temp_surface = render_targets.get("frame")
             draw_background(temp_surface)
             # Draw title
-            title_font = pygame.font.Font(None, 80)
-            title_font.set_bold(True)
-            title_text = title_font.render("Space Shooter", True, WHITE)
+            title_text = render_text(TITLE_FONT, "Space Shooter", WHITE)
             title_rect = title_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 200))
             temp_surface.blit(title_text, title_rect)
             # Draw buttons
             play_button.draw(temp_surface)
             ship_builder_button.draw(temp_surface)
             quit_button.draw(temp_surface)
+            dirty_rects.mark_many(button.get_draw_rect() for button in (play_button, ship_builder_button, quit_button))
 
             # Blit the temporary surface onto the main screen
-            SCREEN.blit(temp_surface, (0, 0))
+            dirty_rects.present(SCREEN, temp_surface)
 
         elif game_state == "game_over":
             if not score_added:
@@ -1088,35 +1314,19 @@ def main():
                 score_added = True  # Set the flag to prevent multiple additions
                 persist_save()
             # Draw game over screen on a temporary surface
-            temp_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-            temp_surface.fill((0, 0, 0, 180))  # Semi-transparent black overlay
-
-            # Draw Game Over text
-            game_over_text = GAME_OVER_FONT.render("GAME OVER", True, WHITE)
-            game_over_rect = game_over_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 150))
-            temp_surface.blit(game_over_text, game_over_rect)
-
-            # Draw Top Scores
-            scores_title = FONT.render("Top 10 Scores:", True, WHITE)
-            scores_title_rect = scores_title.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 100))
-            temp_surface.blit(scores_title, scores_title_rect)
-            for idx, (score, lvl, time_sec) in enumerate(top_scores):
-                minutes = int(time_sec) // 60
-                seconds = int(time_sec) % 60
-                time_formatted = f"{minutes:02}:{seconds:02}"
-                ordinal = f"{idx+1}{'st' if idx==0 else 'nd' if idx==1 else 'rd' if idx==2 else 'th'}"
-                score_text = FONT.render(f"{ordinal} Score: {score} LVL {lvl} Time: {time_formatted}", True, WHITE)
-                score_rect = score_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 70 + idx * 30))
-                temp_surface.blit(score_text, score_rect)
+            # The overlay and score table only change with the scores; buttons repaint over it
+            temp_surface = render_targets.get_layer("game_over", tuple(top_scores), compose_game_over, alpha=True)
+
             # Draw buttons
             retry_button.draw(temp_surface)
             game_over_quit_button.draw(temp_surface)
+            dirty_rects.mark_many(button.get_draw_rect() for button in (retry_button, game_over_quit_button))
 
             # Blit the temporary surface onto the main screen
-            SCREEN.blit(temp_surface, (0, 0))
+            dirty_rects.present(SCREEN, temp_surface)
 
         elif game_state == "ship_builder":
-            temp_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+            temp_surface = render_targets.get("frame")
             builder_swatch_rects = draw_ship_builder(
                 temp_surface,
                 SCREEN_WIDTH,
@@ -1144,15 +1354,25 @@ def main():
                     "back": builder_back_button,
                 },
                 FONT,
-                pygame.font.Font(None, 30),
-                pygame.font.Font(None, 28),
-                pygame.font.Font(None, 26),
+                get_font(30),
+                get_font(28),
+                get_font(26),
                 draw_background,
             )
-            SCREEN.blit(temp_surface, (0, 0))
-
-        pygame.display.flip()
-        clock.tick(60)
+            dirty_rects.mark_many(button.get_draw_rect() for button in builder_buttons)
+            dirty_rects.present(SCREEN, temp_surface)
+
+        dirty_rects.update_display()
+
+    # Only reached when a run is limited by --frames, ends headless or its replay runs out
+    finish_recording()
+    wall_seconds = time.perf_counter() - wall_start
+    sim_seconds = sim_clock.get_ticks() / 1000
+    print(
+        f"seed={seed} steps={timestep.total_steps} level={level} score={score_display.score} "
+        f"sim_time={sim_seconds:.1f}s wall_time={wall_seconds:.1f}s speedup={sim_seconds / max(wall_seconds, 1e-9):.1f}x"
+    )
+    pygame.quit()
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,81 @@
+# tests/reference_steering.py
+# Scalar versions of the per-enemy steering and movement EnemySwarm replaced, to check the vectorized kernels against
+
+import math
+
+from entities.enemy import SEPARATION_RADIUS
+
+
+def snapshot(enemy):
+    """Copy the fields steering reads and writes out of an enemy."""
+    return {
+        name: getattr(enemy, name)
+        for name in ("x", "y", "vx", "vy", "max_speed", "acceleration", "radius_outer", "wander_angle")
+    }
+
+
+def reference_steer(states, player_x, player_y, wander_deltas, screen_width, screen_height):
+    """
+    One step of the old Enemy.apply_steering for every state, comparing each with every other.
+
+    ``wander_deltas`` stands in for the per-enemy draw from the ``ai`` stream.
+    """
+    positions = [(state["x"], state["y"]) for state in states]
+    for state, wander_delta in zip(states, wander_deltas):
+        dx = player_x - state["x"]
+        dy = (player_y - 120) - state["y"]
+        distance = math.hypot(dx, dy) or 1.0
+        if distance > 240:
+            desired_vx = (dx / distance) * state["max_speed"]
+            desired_vy = (dy / distance) * state["max_speed"]
+        else:
+            desired_vx = (-dx / distance) * state["max_speed"]
+            desired_vy = (-dy / distance) * state["max_speed"]
+
+        separation_x = 0.0
+        separation_y = 0.0
+        for other_x, other_y in positions:
+            offset_x = state["x"] - other_x
+            offset_y = state["y"] - other_y
+            offset_dist = math.hypot(offset_x, offset_y)
+            if 0 < offset_dist < SEPARATION_RADIUS:
+                strength = (SEPARATION_RADIUS - offset_dist) / SEPARATION_RADIUS
+                separation_x += (offset_x / offset_dist) * strength
+                separation_y += (offset_y / offset_dist) * strength
+
+        edge_push_x = 0.0
+        if state["x"] < state["radius_outer"] * 2:
+            edge_push_x = 1.0
+        elif state["x"] > screen_width - state["radius_outer"] * 2:
+            edge_push_x = -1.0
+
+        band_push_y = 0.0
+        if state["y"] < 50:
+            band_push_y = 1.0
+        elif state["y"] > screen_height * 0.45:
+            band_push_y = -1.0
+
+        state["wander_angle"] += wander_delta
+        wander_x = math.cos(state["wander_angle"]) * 0.5
+        wander_y = math.sin(state["wander_angle"]) * 0.5
+
+        steer_x = desired_vx + separation_x * 2.2 + edge_push_x * 1.5 + wander_x
+        steer_y = desired_vy + separation_y * 2.2 + band_push_y * 1.5 + wander_y
+        state["vx"] += (steer_x - state["vx"]) * state["acceleration"]
+        state["vy"] += (steer_y - state["vy"]) * state["acceleration"]
+
+        speed = math.hypot(state["vx"], state["vy"])
+        if speed > state["max_speed"]:
+            scale = state["max_speed"] / speed
+            state["vx"] *= scale
+            state["vy"] *= scale
+    return states
+
+
+def reference_move(states, screen_width, screen_height):
+    """The old Enemy.move: step by the velocity, then clamp to the screen."""
+    for state in states:
+        radius = state["radius_outer"]
+        state["x"] = max(radius, min(state["x"] + state["vx"], screen_width - radius))
+        state["y"] = max(radius, min(state["y"] + state["vy"], screen_height - radius))
+    return states
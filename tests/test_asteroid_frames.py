@@ -0,0 +1,95 @@
+# tests/test_asteroid_frames.py
+
+import numpy as np
+import pygame
+from core.rng import seed_streams
+from entities.asteroid import (
+    FRAME_CACHE_MAX_BYTES, ROTATION_FRAMES, Asteroid, AsteroidShapeBank, clear_asteroid_frame_cache, get_shape_bank,
+)
+
+SCREEN_SIZE = (1280, 720)
+BACKGROUND_COLOR = (20, 24, 48)
+
+
+def asteroid_field(bank, small=8, large=2):
+    """A typical in-game field: mostly 1x asteroids with a few 2x ones, each tumbling at 1.5 degrees per frame."""
+    field = []
+    for i in range(small + large):
+        asteroid = Asteroid(60 + 110 * i, 300, 3, *SCREEN_SIZE, BACKGROUND_COLOR, 2 if i < large else 1, shape_bank=bank)
+        asteroid.shape_id = i
+        asteroid.rotation_speed = 1.5 if i % 2 else -1.5
+        field.append(asteroid)
+    return field
+
+
+def test_asteroid_field_keeps_every_rotation_frame():
+    seed_streams(0)
+    surface = pygame.Surface(SCREEN_SIZE)
+    bank = AsteroidShapeBank()
+    field = asteroid_field(bank)
+    # Three full revolutions: only the first should render frames
+    for _ in range(3 * 360 * 2 // 3):
+        bank.fit_to(field)
+        for asteroid in field:
+            asteroid.rotate()
+            asteroid.draw(surface)
+    stats = bank.frame_cache_stats()
+    hit_rate = stats["hits"] / (stats["hits"] + stats["misses"])
+    assert stats["capacity"] == len(field) * ROTATION_FRAMES
+    assert stats["misses"] <= len(field) * ROTATION_FRAMES
+    assert stats["evictions"] == 0
+    assert hit_rate > 0.8
+    assert stats["bytes"] <= FRAME_CACHE_MAX_BYTES
+
+
+def test_large_asteroid_scene_fits_without_evicting():
+    # The asteroid_field benchmark: 40 2x asteroids, here spread over every shape
+    seed_streams(0)
+    surface = pygame.Surface(SCREEN_SIZE)
+    bank = AsteroidShapeBank()
+    field = asteroid_field(bank, small=0, large=40)
+    for i, asteroid in enumerate(field):
+        asteroid.shape_id = i % len(bank)
+    for _ in range(360 * 2 // 3):
+        bank.fit_to(field)
+        for asteroid in field:
+            asteroid.rotate()
+            asteroid.draw(surface)
+    stats = bank.frame_cache_stats()
+    assert stats["size"] == len(bank) * ROTATION_FRAMES
+    assert stats["evictions"] == 0
+    assert stats["bytes"] <= FRAME_CACHE_MAX_BYTES
+
+
+def test_frames_hold_every_crater():
+    bank = AsteroidShapeBank()
+    for shape_id in range(len(bank)):
+        for size_multiplier in (1, 2):
+            offsets, sizes = bank.craters(shape_id, size_multiplier, 0)
+            extent = (np.hypot(*offsets.T) + sizes).max()
+            assert bank.frame_half_size(shape_id, size_multiplier) > extent
+
+
+def test_departed_asteroids_are_evicted_first():
+    seed_streams(0)
+    surface = pygame.Surface(SCREEN_SIZE)
+    bank = AsteroidShapeBank()
+    field = asteroid_field(bank, small=2, large=0)
+    for _ in range(240):
+        bank.fit_to(field)
+        for asteroid in field:
+            asteroid.rotate()
+            asteroid.draw(surface)
+    assert len(bank.frames) == 2 * ROTATION_FRAMES
+    departed, remaining = field
+    bank.fit_to([remaining])
+    assert len(bank.frames) == ROTATION_FRAMES
+    assert all(key[0] == remaining.shape_id for key in bank.frames)
+
+
+def test_palette_change_clears_shared_frames():
+    bank = get_shape_bank()
+    bank.get_frame(0, 1, BACKGROUND_COLOR, 0)
+    clear_asteroid_frame_cache()
+    assert len(bank.frames) == 0
+    assert bank.frame_cache_stats()["misses"] == 0
@@ -0,0 +1,126 @@
+# tests/test_enemy_swarm.py
+
+import math
+
+import numpy as np
+import pytest
+from entities.enemy import Enemy, EnemySwarm
+from tests.reference_steering import reference_move, reference_steer, snapshot
+
+SIZE = (800, 600)
+PLAYER = (400, 520)  # Enemies steer towards (400, 400), 120 px above the player
+
+
+def make_enemy(x, y):
+    return Enemy(x, y, (200, 200, 200), (255, 0, 0), *SIZE)
+
+
+def test_detached_enemy_keeps_state_without_a_swarm():
+    enemy = make_enemy(100, 120)
+    assert enemy._swarm is None
+    enemy.x += 5
+    assert enemy.x == 105.0
+    assert isinstance(enemy.shoot_timer, int)
+
+
+def test_state_survives_joining_and_leaving_a_swarm():
+    swarm = EnemySwarm(*SIZE, capacity=2)
+    enemies = [make_enemy(100 + 50 * i, 120) for i in range(3)]
+    for enemy in enemies:
+        swarm.append(enemy)
+    swarm.move()
+    moved = [(enemy.x, enemy.y) for enemy in enemies]
+
+    swarm.remove(enemies[0])
+    assert (enemies[0].x, enemies[0].y) == moved[0]
+    assert [(enemy.x, enemy.y) for enemy in swarm] == [moved[2], moved[1]]
+
+    swarm.clear()
+    assert (enemies[1].x, enemies[1].y) == moved[1]
+    assert len(swarm) == 0
+
+
+class NoWander:
+    """Stands in for the ai stream so the wander angle stays put."""
+
+    def uniform(self, low, high, size):
+        return np.zeros(size)
+
+
+def steered_swarm(*placements):
+    """A swarm of enemies at rest at (x, y), with wander fixed at (0.5, 0), after one steer()."""
+    swarm = EnemySwarm(*SIZE)
+    swarm.rng = NoWander()
+    for x, y in placements:
+        enemy = make_enemy(x, y)
+        enemy.vx = enemy.vy = 0.0
+        enemy.wander_angle = 0.0
+        swarm.append(enemy)
+    swarm.steer(*PLAYER)
+    return swarm
+
+
+def test_enemy_seeks_from_beyond_range_and_flees_inside_it():
+    far, near = steered_swarm((400, 100), (240, 250))
+    # 300 px out: full speed towards the target, plus wander
+    assert (far.vx, far.vy) == pytest.approx((0.15 * 0.5, 0.15 * 3.2))
+    # Inside 240 px: full speed away from it
+    distance = math.hypot(160, 150)
+    assert (near.vx, near.vy) == pytest.approx((0.15 * (-160 / distance * 3.2 + 0.5), 0.15 * (-150 / distance * 3.2)))
+
+
+def test_close_enemies_push_apart_by_separation_weight():
+    left, right = steered_swarm((380, 100), (420, 100))
+    distance = math.hypot(20, 300)
+    seek_x = 20 / distance * 3.2
+    seek_y = 300 / distance * 3.2
+    # 40 px apart out of an 80 px radius: half strength, weighted by 2.2
+    assert (left.vx, left.vy) == pytest.approx((0.15 * (seek_x - 0.5 * 2.2 + 0.5), 0.15 * seek_y))
+    assert (right.vx, right.vy) == pytest.approx((0.15 * (-seek_x + 0.5 * 2.2 + 0.5), 0.15 * seek_y))
+
+
+def test_edge_and_band_push_enemies_back():
+    corner, low = steered_swarm((30, 30), (780, 300))
+    distance = math.hypot(370, 370)
+    # Within two radii of the left edge and above the band: pushed right and down
+    assert (corner.vx, corner.vy) == pytest.approx((0.15 * (370 / distance * 3.2 + 1.5 + 0.5), 0.15 * (370 / distance * 3.2 + 1.5)))
+    # Near the right edge and below 45% of the screen: pushed left and up
+    distance = math.hypot(380, 100)
+    assert (low.vx, low.vy) == pytest.approx((0.15 * (-380 / distance * 3.2 - 1.5 + 0.5), 0.15 * (100 / distance * 3.2 - 1.5)))
+
+
+def test_speed_is_clamped_to_max_speed():
+    swarm = EnemySwarm(*SIZE)
+    swarm.rng = NoWander()
+    enemy = make_enemy(400, 100)
+    enemy.vx, enemy.vy, enemy.wander_angle = 10.0, 0.0, 0.0
+    swarm.append(enemy)
+    swarm.steer(*PLAYER)
+    vx = 10 + (0.5 - 10) * 0.15
+    vy = 3.2 * 0.15
+    scale = 3.2 / math.hypot(vx, vy)
+    assert (enemy.vx, enemy.vy) == pytest.approx((vx * scale, vy * scale))
+    assert math.hypot(enemy.vx, enemy.vy) == pytest.approx(3.2)
+
+
+def test_move_clips_to_the_screen():
+    swarm = EnemySwarm(*SIZE)
+    placements = [(795, 300, 10.0, 0.0), (5, 5, -3.0, -3.0), (400, 590, 0.0, 4.0), (400, 300, 1.5, -2.5)]
+    for x, y, vx, vy in placements:
+        enemy = make_enemy(x, y)
+        enemy.vx, enemy.vy = vx, vy
+        swarm.append(enemy)
+    swarm.move()
+    assert [(enemy.x, enemy.y) for enemy in swarm] == [(780, 300), (20, 20), (400, 580), (401.5, 297.5)]
+
+
+def test_steer_and_move_match_scalar_reference():
+    swarm = steered_swarm((380, 100), (420, 100), (30, 30), (780, 300), (400, 290))
+    states = [snapshot(enemy) for enemy in swarm]
+    for state in states:
+        state["vx"] = state["vy"] = 0.0
+    reference_steer(states, *PLAYER, [0.0] * len(states), *SIZE)
+    swarm.move()
+    reference_move(states, *SIZE)
+    for enemy, state in zip(swarm, states):
+        assert (enemy.x, enemy.y, enemy.vx, enemy.vy) == pytest.approx((state["x"], state["y"], state["vx"], state["vy"]))
@@ -0,0 +1,18 @@
+# tests/test_glow_cache.py
+
+import pygame
+from entities.health_item import HUE_STEPS, HealthItem
+from utils import clear_glow_cache, get_glow_cache_stats
+
+
+def test_cycling_health_item_hue_stays_cached():
+    surface = pygame.Surface((200, 200), pygame.SRCALPHA)
+    item = HealthItem(100, 100, 0)
+    clear_glow_cache()
+    for _ in range(1000):
+        item.update_hue()
+        item.draw(surface)
+    stats = get_glow_cache_stats()
+    assert stats["misses"] <= HUE_STEPS
+    assert stats["hits"] / (stats["hits"] + stats["misses"]) > 0.9
+    assert stats["evictions"] == 0
@@ -0,0 +1,87 @@
+# tests/test_replay.py
+
+import pygame
+
+import main as game
+
+MENU_FRAMES = 150  # Frames spent on the menu before Play is clicked
+RECORD_STEPS = 1500
+FRAME_MS = (16, 35, 9)  # Uneven frame times, so some frames run several steps and some none
+
+
+def run_game(monkeypatch, argv, events=lambda frame: [], keys=lambda frame: ()):
+    """Run main() with scripted events, held keys and frame times; return the final player and enemies."""
+    created = {}
+
+    class TrackedPlayer(game.Player):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            created["player"] = self
+
+    class TrackedSwarm(game.EnemySwarm):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            created["enemies"] = self
+
+    class ScriptedClock:
+        def tick(self, framerate=0):
+            return FRAME_MS[frame[0] % len(FRAME_MS)]
+
+        def get_fps(self):
+            return 60.0
+
+    frame = [0]
+    real_get = pygame.event.get
+
+    def scripted_events(*args, **kwargs):
+        real_get()
+        frame[0] += 1
+        return events(frame[0])
+
+    class HeldKeys:
+        def __getitem__(self, key):
+            return key in keys(frame[0])
+
+    monkeypatch.setattr(game, "Player", TrackedPlayer)
+    monkeypatch.setattr(game, "EnemySwarm", TrackedSwarm)
+    monkeypatch.setattr(game, "start_music", lambda: None)
+    # Both runs share one pygame session; quitting would free the sounds main loaded at import
+    monkeypatch.setattr(pygame, "quit", lambda: None)
+    monkeypatch.setattr(pygame.event, "get", scripted_events)
+    monkeypatch.setattr(pygame.key, "get_pressed", HeldKeys)
+    monkeypatch.setattr(pygame.time, "Clock", ScriptedClock)
+    game.main(argv)
+    return created["player"], created["enemies"]
+
+
+def snapshot(player, enemies):
+    return {
+        "player": (player.x, player.y, player.health, player.weapon_mode),
+        "enemies": [(enemy.x, enemy.y) for enemy in enemies],
+    }
+
+
+def test_windowed_recording_replays_after_menu_delay(monkeypatch, tmp_path, capsys):
+    path = str(tmp_path / "run.replay")
+
+    def events(frame):
+        if frame == MENU_FRAMES:
+            play = (game.SCREEN_WIDTH // 2, game.SCREEN_HEIGHT // 2 + 120)
+            return [pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=play, button=1)]
+        if frame % 200 == 0:
+            return [pygame.event.Event(pygame.KEYDOWN, key=pygame.K_x)]
+        return []
+
+    def keys(frame):
+        return (pygame.K_SPACE, pygame.K_LEFT if (frame // 90) % 2 else pygame.K_RIGHT)
+
+    argv = ["--seed", "7", "--invulnerable", "--record", path, "--frames", str(RECORD_STEPS)]
+    recorded = snapshot(*run_game(monkeypatch, argv, events, keys))
+    recorded_summary = capsys.readouterr().out.splitlines()[-1]
+
+    replayed = snapshot(*run_game(monkeypatch, ["--headless", "--replay", path]))
+    replayed_summary = capsys.readouterr().out.splitlines()[-1]
+
+    assert replayed == recorded
+    # Step counts and clocks differ by the menu time; the game outcome must not
+    assert recorded_summary.split()[2:4] == replayed_summary.split()[2:4]
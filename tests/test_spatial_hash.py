@@ -0,0 +1,57 @@
+# tests/test_spatial_hash.py
+
+import numpy as np
+import pytest
+from core.rng import get_numpy_stream, seed_streams
+from core.spatial_hash import neighbor_pairs
+from entities.enemy import SEPARATION_RADIUS, Enemy, EnemySwarm
+from tests.reference_steering import reference_steer, snapshot
+
+SIZE = (1280, 720)
+
+
+def brute_force_pairs(x, y, radius):
+    pairs = set()
+    for i in range(len(x)):
+        for j in range(len(x)):
+            offset_sq = (x[i] - x[j]) ** 2 + (y[i] - y[j]) ** 2
+            if 0 < offset_sq < radius * radius:
+                pairs.add((i, j))
+    return pairs
+
+
+@pytest.mark.parametrize("count", [0, 1, 2, 50, 400])
+def test_neighbor_pairs_match_brute_force(count):
+    rng = np.random.default_rng(count)
+    x = rng.uniform(-100, 700, count)
+    y = rng.uniform(-50, 400, count)
+    # Coincident points and points exactly on a cell boundary
+    x[: count // 10] = x[count // 10: 2 * (count // 10)]
+    y[: count // 10] = y[count // 10: 2 * (count // 10)]
+    x[2 * (count // 10): 3 * (count // 10)] = SEPARATION_RADIUS * 3
+    rows, cols = neighbor_pairs(x, y, SEPARATION_RADIUS)
+    pairs = set(zip(rows.tolist(), cols.tolist()))
+    assert len(pairs) == len(rows)
+    assert pairs == brute_force_pairs(x, y, SEPARATION_RADIUS)
+
+
+def test_swarm_steering_matches_scalar_reference():
+    seed_streams(3)
+    rng = np.random.default_rng(3)
+    swarm = EnemySwarm(*SIZE)
+    for x, y in zip(rng.uniform(0, SIZE[0], 300), rng.uniform(0, SIZE[1] * 0.6, 300)):
+        enemy = Enemy(x, y, (200, 200, 200), (255, 0, 0), *SIZE)
+        enemy.vx, enemy.vy = rng.uniform(-4, 4, 2)
+        swarm.append(enemy)
+    swarm[1].x, swarm[1].y = swarm[0].x, swarm[0].y
+    player_x, player_y = 640, 620
+
+    seed_streams(11)
+    wander_deltas = get_numpy_stream("ai").uniform(-0.15, 0.15, len(swarm))
+    expected = reference_steer([snapshot(enemy) for enemy in swarm], player_x, player_y, wander_deltas, *SIZE)
+    seed_streams(11)
+    swarm.steer(player_x, player_y)
+
+    for name in ("vx", "vy", "wander_angle"):
+        actual = [getattr(enemy, name) for enemy in swarm]
+        np.testing.assert_allclose(actual, [state[name] for state in expected], rtol=1e-12, atol=1e-12)
@@ -0,0 +1,42 @@
+# ui/fonts.py
+
+import pygame
+
+# (name, size, bold) variants loaded at startup; None is pygame's default font
+PREWARM_FONTS = [
+    (None, 24, False),
+    (None, 26, False),
+    (None, 26, True),
+    (None, 28, False),
+    (None, 30, False),
+    (None, 36, False),
+    (None, 36, True),
+    (None, 40, True),
+    (None, 52, True),
+    (None, 70, True),
+    (None, 72, True),
+    (None, 80, True),
+    (None, 150, True),
+]
+
+_fonts = {}
+
+def get_font(size, bold=False, name=None):
+    """
+    Return the shared Font for a (name, size, bold) variant, loading it once.
+
+    Fonts handed out here are shared, so callers must not change their
+    style (set_bold, set_italic, ...); ask for the variant instead.
+    """
+    key = (name, size, bold)
+    font = _fonts.get(key)
+    if font is None:
+        font = pygame.font.Font(name, size)
+        font.set_bold(bold)
+        _fonts[key] = font
+    return font
+
+def prewarm_fonts(variants=PREWARM_FONTS):
+    """Load every listed (name, size, bold) variant up front."""
+    for name, size, bold in variants:
+        get_font(size, bold, name)
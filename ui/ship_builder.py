@@ -1,6 +1,8 @@
 # ui/ship_builder.py
 
 import pygame
+from entities.player import draw_ship
+from ui.fonts import get_font
 
 
 def get_builder_panels(screen_width, screen_height):
@@ -65,8 +67,7 @@ def draw_ship_builder(
 ):
     draw_background(surface)
 
-    title_font = pygame.font.Font(None, 70)
-    title_font.set_bold(True)
+    title_font = get_font(70, bold=True)
     title_text = title_font.render("Ship Builder", True, (255, 255, 255))
     title_rect = title_text.get_rect(center=(screen_width // 2, 70))
     surface.blit(title_text, title_rect)
@@ -85,11 +86,10 @@ def draw_ship_builder(
 
     preview_x = center_panel.centerx
     preview_y = center_panel.y + 170
-    preview_player = player.clone_for_preview(preview_x, preview_y)
-    preview_player.hull_type = selected_hull
-    preview_player.nozzle_type = selected_nozzle
-    preview_player.color = get_option(color_options, selected_color)["color"]
-    preview_player.draw(surface)
+    draw_ship(
+        surface, preview_x, preview_y, selected_hull, selected_nozzle,
+        get_option(color_options, selected_color)["color"], player.wing_level, player.weapon_level, player.radius,
+    )
 
     hull_option = get_option(hull_options, selected_hull)
     color_option = get_option(color_options, selected_color)
@@ -115,7 +115,7 @@ def draw_ship_builder(
         y = label_y + idx * 40
         label_text = selection_font.render(label, True, label_color)
         option_text = selection_font.render(option_label, True, selection_color)
-        status_text = pygame.font.Font(None, 24).render(status, True, status_color)
+        status_text = get_font(24).render(status, True, status_color)
         surface.blit(label_text, (label_x, y))
         surface.blit(option_text, (option_x, y))
         surface.blit(status_text, (status_x, y + 5))
@@ -140,8 +140,7 @@ def draw_ship_builder(
     confirm_text = selection_font.render(confirm_label, True, (255, 255, 255))
     surface.blit(confirm_text, (center_panel.x + 30, center_panel.y + 390))
 
-    left_header_font = pygame.font.Font(None, 36)
-    left_header_font.set_bold(True)
+    left_header_font = get_font(36, bold=True)
     upgrades_title = left_header_font.render("Upgrades", True, (255, 255, 255))
     surface.blit(upgrades_title, (left_panel.x + 20, left_panel.y + 20))
 
@@ -162,7 +161,7 @@ def draw_ship_builder(
     surface.blit(weapon_info_text, (left_panel.x + 20, left_panel.y + 80))
     surface.blit(wing_info_text, (left_panel.x + 20, left_panel.y + 120))
 
-    tips_font = pygame.font.Font(None, 26)
+    tips_font = get_font(26)
     tips = [
         "Weapon modes: Z (Basic), X (Spread)",
         "Select parts, then confirm to buy/apply.",
@@ -187,7 +186,7 @@ def draw_ship_builder(
         line_text = info_font.render(line, True, (255, 255, 255))
         surface.blit(line_text, (left_panel.x + 20, left_panel.y + 330 + idx * 26))
 
-    stat_label_font = pygame.font.Font(None, 26)
+    stat_label_font = get_font(26)
     stat_bar_x = center_panel.x + 30
     stat_bar_y = center_panel.y + 500
     stat_width = center_panel.width - 60
@@ -205,8 +204,7 @@ def draw_ship_builder(
             border_radius=6,
         )
 
-    right_header_font = pygame.font.Font(None, 36)
-    right_header_font.set_bold(True)
+    right_header_font = get_font(36, bold=True)
     options_title = right_header_font.render("Options", True, (255, 255, 255))
     surface.blit(options_title, (right_panel.x + 20, right_panel.y + 20))
 
@@ -214,7 +212,7 @@ def draw_ship_builder(
     swatch_x = right_panel.x + 20
     swatch_size = 24
     swatch_spacing = 10
-    swatch_label = pygame.font.Font(None, 24).render("Colors", True, (255, 255, 255))
+    swatch_label = get_font(24).render("Colors", True, (255, 255, 255))
     surface.blit(swatch_label, (swatch_x, swatch_y - 26))
     swatch_rects = []
     for color_option in color_options:
@@ -226,7 +224,7 @@ def draw_ship_builder(
         swatch_rects.append((color_rect, color_option["id"]))
         swatch_x += swatch_size + swatch_spacing
 
-    option_font = pygame.font.Font(None, 28)
+    option_font = get_font(28)
     for idx, label in enumerate([hull_option["label"], color_option["label"], nozzle_option["label"]]):
         y = right_panel.y + 146 + idx * 60
         label_text = option_font.render(label, True, (255, 255, 255))
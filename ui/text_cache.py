@@ -0,0 +1,65 @@
+# ui/text_cache.py
+
+import pygame
+from collections import OrderedDict
+from utils import blit_batch
+
+# Rendered text surfaces keyed by (font, text, color, antialias).
+TEXT_CACHE_SIZE = 256
+_text_cache = OrderedDict()
+_text_cache_stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+def render_text(font, text, color, antialias=True):
+    """Return a rendered text surface, only rasterizing strings not seen recently."""
+    key = (font, text, tuple(color), antialias)
+    surface = _text_cache.get(key)
+    if surface is not None:
+        _text_cache.move_to_end(key)
+        _text_cache_stats["hits"] += 1
+        return surface
+    _text_cache_stats["misses"] += 1
+    surface = font.render(text, antialias, color)
+    _text_cache[key] = surface
+    if len(_text_cache) > TEXT_CACHE_SIZE:
+        _text_cache.popitem(last=False)
+        _text_cache_stats["evictions"] += 1
+    return surface
+
+def get_text_cache_stats():
+    """Return a snapshot of the text cache counters."""
+    return {**_text_cache_stats, "size": len(_text_cache), "capacity": TEXT_CACHE_SIZE}
+
+def clear_text_cache():
+    """Drop all cached text surfaces and reset the counters."""
+    _text_cache.clear()
+    for key in _text_cache_stats:
+        _text_cache_stats[key] = 0
+
+class DigitAtlas:
+    """
+    Pre-rendered glyphs for numeric counters such as the timer.
+
+    Each glyph is rasterized once; a counter is then composed from glyph
+    blits placed by the font's advance widths.
+    """
+
+    def __init__(self, font, color, antialias=True, glyphs="0123456789:"):
+        self.glyphs = {}
+        self.advances = {}
+        for glyph, metrics in zip(glyphs, font.metrics(glyphs)):
+            self.glyphs[glyph] = font.render(glyph, antialias, color)
+            self.advances[glyph] = metrics[4]
+        self.height = font.get_height()
+
+    def width(self, text):
+        return sum(self.advances[glyph] for glyph in text)
+
+    def draw(self, surface, text, position):
+        """Blit ``text`` with its top-left corner at ``position``; return the covered rect."""
+        x, y = position
+        blits = []
+        for glyph in text:
+            blits.append((self.glyphs[glyph], (x, y)))
+            x += self.advances[glyph]
+        blit_batch(surface, blits)
+        return pygame.Rect(position[0], y, x - position[0], self.height)
@@ -1,7 +1,10 @@
 # ui/ui.py
 
+import re
 import pygame
 from utils import lighten_color, darken_color
+from ui.fonts import get_font
+from ui.text_cache import render_text
 
 class Button:
     def __init__(self, text, font, color, hover_color, position, size, text_color):
@@ -25,10 +28,14 @@ class Button:
             button_color = self.color
         pygame.draw.rect(surface, button_color, self.rect, border_radius=10)
         pygame.draw.rect(surface, lighten_color(button_color, 0.2), self.rect, width=2, border_radius=10)
-        text_surface = self.font.render(self.text, True, self.text_color)
+        text_surface = render_text(self.font, self.text, self.text_color)
         text_rect = text_surface.get_rect(center=self.rect.center)
         surface.blit(text_surface, text_rect)
 
+    def get_draw_rect(self):
+        """Area the button paints, including its drop shadow."""
+        return self.rect.union(self.rect.move(4, 4))
+
     def is_clicked(self, event):
         if event.type == pygame.MOUSEBUTTONDOWN:
             if self.rect.collidepoint(event.pos):
@@ -54,7 +61,7 @@ class ScoreDisplay:
     def __init__(self, screen_width):
         self.score = 0
         self.level = 1
-        self.font = pygame.font.Font(None, 36)
+        self.font = get_font(36)
         self.screen_width = screen_width
 
     def add_score(self, points):
@@ -64,11 +71,11 @@ class ScoreDisplay:
         self.level = level
 
     def draw(self, surface):
-        score_text = self.font.render(f"Score: {self.score}", True, (255, 255, 255))
-        level_text = self.font.render(f"Level: {self.level}", True, (255, 255, 255))
+        score_text = render_text(self.font, f"Score: {self.score}", (255, 255, 255))
+        level_text = render_text(self.font, f"Level: {self.level}", (255, 255, 255))
         shadow_color = darken_color((255, 255, 255), 0.7)
-        score_shadow = self.font.render(f"Score: {self.score}", True, shadow_color)
-        level_shadow = self.font.render(f"Level: {self.level}", True, shadow_color)
+        score_shadow = render_text(self.font, f"Score: {self.score}", shadow_color)
+        level_shadow = render_text(self.font, f"Level: {self.level}", shadow_color)
         surface.blit(score_shadow, (22, 52))
         surface.blit(level_shadow, (22, 82))
         surface.blit(score_text, (20, 50))
@@ -91,6 +98,9 @@ class DialogBubble:
         self.hold_time = 2500
         self.finish_time = None
         self.visible = False
+        self.lines = []
+        self.surface = None
+        self.revealed_index = 0
 
     def start(self, speaker, text, start_time, typing_speed=40, hold_time=2500):
         self.speaker = speaker
@@ -103,6 +113,10 @@ class DialogBubble:
         self.hold_time = hold_time
         self.finish_time = None
         self.visible = True
+        # Wrap once for the whole text so lines never reflow while typing
+        self.lines = self._wrap_text(text, self.size[0] - self.padding * 2)
+        self.surface = None
+        self.revealed_index = 0
 
     def update(self, current_time):
         if not self.visible:
@@ -126,25 +140,26 @@ class DialogBubble:
         return self.visible
 
     def _wrap_text(self, text, max_width):
-        words = text.split()
+        """Return the (start, end) span in ``text`` of each wrapped line."""
         lines = []
-        current_line = ""
-        for word in words:
-            test_line = f"{current_line} {word}".strip()
-            if self.font.size(test_line)[0] <= max_width:
-                current_line = test_line
+        line_start = line_end = None
+        for match in re.finditer(r"\S+", text):
+            if line_start is None:
+                line_start, line_end = match.span()
+            elif self.font.size(text[line_start:match.end()])[0] <= max_width:
+                line_end = match.end()
             else:
-                if current_line:
-                    lines.append(current_line)
-                current_line = word
-        if current_line:
-            lines.append(current_line)
+                lines.append((line_start, line_end))
+                line_start, line_end = match.span()
+        if line_start is not None:
+            lines.append((line_start, line_end))
         return lines
 
-    def draw(self, surface):
-        if not self.visible:
-            return
-        rect = pygame.Rect(self.position, self.size)
+    def _build_surface(self):
+        """Render the bubble chrome and speaker; the text is appended as it is revealed."""
+        width, height = self.size
+        surface = pygame.Surface((width, height + 20), pygame.SRCALPHA)
+        rect = pygame.Rect((0, 0), self.size)
         bubble_color = (245, 245, 245)
         border_color = darken_color(bubble_color, 0.2)
         pygame.draw.rect(surface, bubble_color, rect, border_radius=16)
@@ -157,15 +172,30 @@ class DialogBubble:
         pygame.draw.polygon(surface, bubble_color, tail)
         pygame.draw.polygon(surface, border_color, tail, width=2)
 
-        speaker_font = pygame.font.Font(None, 26)
-        speaker_font.set_bold(True)
+        speaker_font = get_font(26, bold=True)
         speaker_surface = speaker_font.render(self.speaker, True, darken_color(self.text_color, 0.2))
-        surface.blit(speaker_surface, (rect.x + self.padding, rect.y + self.padding))
-
-        text_area_width = rect.width - self.padding * 2
-        lines = self._wrap_text(self.current_text, text_area_width)
-        y_offset = rect.y + self.padding + 28
-        for line in lines:
-            text_surface = self.font.render(line, True, self.text_color)
-            surface.blit(text_surface, (rect.x + self.padding, y_offset))
-            y_offset += text_surface.get_height() + 4
+        surface.blit(speaker_surface, (self.padding, self.padding))
+        return surface
+
+    def _reveal_text(self):
+        """Rasterize the characters typed since the last draw onto the cached bubble."""
+        line_height = self.font.get_height() + 4
+        y_offset = self.padding + 28
+        for line_start, line_end in self.lines:
+            segment_start = max(self.revealed_index, line_start)
+            segment_end = min(self.char_index, line_end)
+            if segment_start < segment_end:
+                x_offset = self.padding + self.font.size(self.full_text[line_start:segment_start])[0]
+                text_surface = self.font.render(self.full_text[segment_start:segment_end], True, self.text_color)
+                self.surface.blit(text_surface, (x_offset, y_offset))
+            y_offset += line_height
+        self.revealed_index = self.char_index
+
+    def draw(self, surface):
+        if not self.visible:
+            return
+        if self.surface is None:
+            self.surface = self._build_surface()
+        if self.char_index > self.revealed_index:
+            self._reveal_text()
+        surface.blit(self.surface, self.position)
@@ -3,13 +3,19 @@
 import random
 import pygame
 import math
+from collections import OrderedDict
 
-def get_random_dark_color():
-    """Generate a random dark color that is not pure black."""
+# Pre-rendered glow sprites keyed by (color, radius, glow_radius, alpha).
+GLOW_CACHE_SIZE = 256
+_glow_cache = OrderedDict()
+_glow_cache_stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+def get_random_dark_color(rng=random):
+    """Generate a random dark color that is not pure black, drawn from ``rng``."""
     while True:
-        r = random.randint(0, 100)
-        g = random.randint(0, 100)
-        b = random.randint(0, 100)
+        r = rng.randint(0, 100)
+        g = rng.randint(0, 100)
+        b = rng.randint(0, 100)
         if (r, g, b) != (0, 0, 0):
             return (r, g, b)
 
@@ -51,15 +57,47 @@ def darken_color(color, ratio):
     """Darken a color by blending it with black."""
     return blend_colors(color, (0, 0, 0), ratio)
 
-def draw_glow_circle(surface, color, position, radius, glow_radius=12, alpha=180):
-    """Draw a soft glow around a circle."""
+def render_glow_sprite(color, radius, glow_radius=12, alpha=180):
+    """Render a glow sprite centred on a circle of the given radius."""
     glow_surface = pygame.Surface((radius * 2 + glow_radius * 2, radius * 2 + glow_radius * 2), pygame.SRCALPHA)
     center = (radius + glow_radius, radius + glow_radius)
     for i in range(glow_radius, 0, -1):
         glow_alpha = int(alpha * (i / glow_radius))
         glow_color = (*color, glow_alpha)
         pygame.draw.circle(glow_surface, glow_color, center, radius + i)
-    surface.blit(glow_surface, (position[0] - center[0], position[1] - center[1]))
+    return glow_surface
+
+def get_glow_sprite(color, radius, glow_radius=12, alpha=180):
+    """Return a cached glow sprite, rendering it on first use (LRU eviction)."""
+    key = (tuple(color), radius, glow_radius, alpha)
+    sprite = _glow_cache.get(key)
+    if sprite is not None:
+        _glow_cache.move_to_end(key)
+        _glow_cache_stats["hits"] += 1
+        return sprite
+    _glow_cache_stats["misses"] += 1
+    sprite = render_glow_sprite(key[0], radius, glow_radius, alpha)
+    _glow_cache[key] = sprite
+    if len(_glow_cache) > GLOW_CACHE_SIZE:
+        _glow_cache.popitem(last=False)
+        _glow_cache_stats["evictions"] += 1
+    return sprite
+
+def get_glow_cache_stats():
+    """Return a snapshot of the glow cache counters."""
+    return {**_glow_cache_stats, "size": len(_glow_cache), "capacity": GLOW_CACHE_SIZE}
+
+def clear_glow_cache():
+    """Drop all cached glow sprites and reset the counters."""
+    _glow_cache.clear()
+    for key in _glow_cache_stats:
+        _glow_cache_stats[key] = 0
+
+def draw_glow_circle(surface, color, position, radius, glow_radius=12, alpha=180):
+    """Draw a soft glow around a circle."""
+    glow_surface = get_glow_sprite(color, radius, glow_radius, alpha)
+    offset = radius + glow_radius
+    surface.blit(glow_surface, (position[0] - offset, position[1] - offset))
 
 def blend_colors(color1, color2, ratio):
     """
@@ -74,3 +112,11 @@ def blend_colors(color1, color2, ratio):
     g = int(color1[1] * (1 - ratio) + color2[1] * ratio)
     b = int(color1[2] * (1 - ratio) + color2[2] * ratio)
     return (r, g, b)
+
+def blit_batch(surface, blit_sequence):
+    """Blit a sequence of (source, dest) pairs with a single call."""
+    fblits = getattr(surface, "fblits", None)
+    if fblits is not None:
+        fblits(blit_sequence)
+    else:
+        surface.blits(blit_sequence, doreturn=False)